@@ -0,0 +1,584 @@
+import os
+from ChecksPPE import ProjectCheckerPPE
+from ChecksSSP import ProjectCheckerSSP
+from ChecksSDV01 import ProjectCheckerSDV01
+from CompareIndex import CompareIndex
+from ModuleNameIndex import ModuleNameIndex
+from ModulePartitions import ModulePartitions
+from logger_config import logger
+
+
+class CheckDefinition:
+    """
+    Declaration of one check: where it applies, what it needs and how it is called.
+
+    The columns a check reads, and which of them it cannot run without, are
+    declared on the check function itself (HelperFunctions.uses_columns); the
+    registry adds when and how the check is called.
+    """
+
+    def __init__(self, number, check, project, direction,
+                 arguments=('df', 'file_path'), needs_compare=False, per_cr_number=False,
+                 per_module=False, consumes=()):
+        """
+        Declare a check.
+
+        Args:
+            number (str): Check number shown in the reports, e.g. 'Nr.5'
+            check (callable): The check function
+            project (str): Project name (value of CheckConfiguration.PROJECT)
+            direction (int): CheckRegistry.IMPORT or CheckRegistry.EXPORT
+            arguments (tuple, optional): Names of the positional arguments, taken from
+                                         the run context ('df', 'file_path', 'compare_df',
+                                         'compare_file', 'cr_number', 'report_folder',
+                                         'doors_version')
+            needs_compare (bool, optional): Only runs with a compare file
+            per_cr_number (bool, optional): Runs once per given CR number (argument 'cr_number')
+            per_module (bool, optional): Only needs the compare rows of the customer file's
+                                         module (see ModulePartitions); gets the full
+                                         compare file when no module matches
+            consumes (iterable, optional): Shared intermediates (keys of
+                                           CheckRegistry.INTERMEDIATES) passed as
+                                           keyword arguments of the same name
+        """
+        self.number = number
+        self.check = check
+        self.project = project
+        self.direction = direction
+        self.arguments = tuple(arguments)
+        self.needs_compare = needs_compare
+        self.per_cr_number = per_cr_number
+        self.per_module = per_module
+        self.consumes = tuple(consumes)
+
+    @property
+    def name(self):
+        return self.check.__name__
+
+    @property
+    def requires(self):
+        """Customer file columns without which the check is skipped; a tuple entry means "one of these columns"."""
+        return self.check.requires
+
+    @property
+    def compare_requires(self):
+        """Compare file columns without which the check is skipped."""
+        return self.check.compare_requires
+
+    @property
+    def columns(self):
+        """Customer file columns to load for the check."""
+        return self.check.columns
+
+    @property
+    def compare_columns(self):
+        """Compare file columns to load for the check, including the module column it is partitioned by."""
+        if self.per_module:
+            return self.check.compare_columns + (ModulePartitions.MODULE_COLUMN,)
+        return self.check.compare_columns
+
+    @staticmethod
+    def missing_columns(required, columns):
+        """
+        Required columns that are not in columns.
+
+        Args:
+            required (tuple): Column names or tuples of alternative column names
+            columns (Index): Columns of the table
+
+        Returns:
+            list: The missing entries (alternatives joined with '/')
+        """
+        missing = []
+        for entry in required:
+            alternatives = entry if isinstance(entry, tuple) else (entry,)
+            if not any(col in columns for col in alternatives):
+                missing.append('/'.join(alternatives))
+        return missing
+
+
+class CheckPlan:
+    """
+    The checks of one run, in report order, with everything that is shared
+    between them.
+
+    Built once per run by CheckRegistry.plan: checks that cannot run with the
+    given compare file or CR numbers are already left out. Module checks get the
+    compare rows of the customer file's module only. Shared intermediates are
+    built on first use per compare file or module and then reused for every file;
+    they are not pickled, so every worker process builds its own copy once.
+    """
+
+    def __init__(self, project, direction, definitions, compare_df=None, compare_file=None,
+                 cr_numbers=None, doors_version="Classic", intermediates=None):
+        self.project = project
+        self.direction = direction
+        self.definitions = definitions
+        self.compare_df = compare_df
+        self.compare_file = compare_file
+        self.cr_numbers = cr_numbers or []
+        self.doors_version = doors_version
+        # (module or None for the full compare file, name) -> intermediate
+        self._intermediates = {(None, name): value for name, value in (intermediates or {}).items()}
+        self._partitions = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_intermediates'] = {}  # Rebuilt on first use instead of being pickled
+        state['_partitions'] = None
+        return state
+
+    def compare_scope(self, file_path):
+        """
+        Compare rows for the module checks of a customer file.
+
+        The compare file is partitioned by 'Modulename' on first use.
+
+        Args:
+            file_path (str): Path of the customer file
+
+        Returns:
+            tuple: (module name, compare rows of the module), or (None, full compare
+                   file) when the compare file has no modules or none matches
+        """
+        if self.compare_df is None or ModulePartitions.MODULE_COLUMN not in self.compare_df.columns:
+            return None, self.compare_df
+        if self._partitions is None:
+            self._partitions = ModulePartitions(self.compare_df, self.intermediate('module_index'))
+        subset = self._partitions.subset(file_path)
+        if subset is None:
+            logger.info(f"No module of the compare file matches {os.path.basename(file_path)}, "
+                        f"checking against the full compare file")
+            return None, self.compare_df
+        source_module = ModuleNameIndex.source_module(file_path)
+        logger.debug(f"Checking {os.path.basename(file_path)} against {len(subset)} rows "
+                     f"of module {source_module}")
+        return source_module, subset
+
+    def intermediate(self, name, module=None, compare_df=None):
+        """
+        Shared intermediate, built on first use for the compare file or a module of it.
+
+        Args:
+            name (str): Key of CheckRegistry.INTERMEDIATES
+            module (str, optional): Module the intermediate is built for, None for the
+                                    full compare file
+            compare_df (DataFrame, optional): Compare rows of the module
+
+        Returns:
+            The intermediate (e.g. the CompareIndex of the compare rows)
+        """
+        key = (module, name)
+        if key not in self._intermediates:
+            rows = self.compare_df if module is None else compare_df
+            # Only the compare columns the consuming checks declare
+            columns = {col for definition in self.definitions if name in definition.consumes
+                       for col in definition.compare_columns}
+            self._intermediates[key] = CheckRegistry.INTERMEDIATES[name](rows, columns)
+        return self._intermediates[key]
+
+    def run(self, df, file_path, report_folder=None):
+        """
+        Run the planned checks on one customer file.
+
+        Checks whose required customer columns are missing in df are skipped
+        without being called. Module checks get the compare rows of the module of
+        file_path (see compare_scope).
+
+        Args:
+            df (DataFrame): The customer file
+            file_path (str): Path of the customer file (for reports and logs)
+            report_folder (str, optional): Folder for files written by checks (CR TSVs)
+
+        Returns:
+            list: Findings of all checks, in plan order
+        """
+        logger.info(f"Running {self.project} {CheckRegistry.DIRECTION_NAMES[self.direction]} checks "
+                    f"for file: {os.path.basename(file_path)}")
+        context = {
+            'df': df,
+            'file_path': file_path,
+            'compare_df': self.compare_df,
+            'compare_file': self.compare_file,
+            'report_folder': report_folder,
+            'doors_version': self.doors_version,
+        }
+        module, module_compare_df = self.compare_scope(file_path) if any(
+            definition.per_module for definition in self.definitions) else (None, self.compare_df)
+        findings = []
+        for definition in self.definitions:
+            missing = CheckDefinition.missing_columns(definition.requires, df.columns)
+            if missing:
+                logger.warning(f"Missing columns in the DataFrame: {missing}, in File: {file_path}.\n"
+                               f"Skipping check: {definition.name}")
+                continue
+
+            scope = module if definition.per_module else None
+            context['compare_df'] = module_compare_df if definition.per_module else self.compare_df
+            keywords = {name: self.intermediate(name, scope, context['compare_df'])
+                        for name in definition.consumes}
+            for cr_number in (self.cr_numbers if definition.per_cr_number else [None]):
+                context['cr_number'] = cr_number
+                arguments = [context[name] for name in definition.arguments]
+                findings += definition.check(*arguments, **keywords)
+        return findings
+
+
+class CheckRegistry:
+    """
+    All checks of all projects with their declarations, and the planner that
+    selects the checks of a run.
+
+    The order of CHECKS is the order of the findings in the reports.
+    """
+
+    IMPORT = 0
+    EXPORT = 1
+    DIRECTION_NAMES = {IMPORT: "import", EXPORT: "export"}
+
+    PPE = "PPE/MLBW"
+    SSP = "SSP"
+    SDV01 = "SDV01"
+
+    # Shared intermediates checks can consume, built from the compare rows once
+    # per run (or once per module for module checks), called with the rows and
+    # the compare columns declared by the checks consuming them
+    INTERMEDIATES = {
+        'compare_index': CompareIndex,
+        'module_index': lambda compare_df, columns: ModuleNameIndex(
+            compare_df[ModulePartitions.MODULE_COLUMN].tolist()),
+    }
+
+    COMPARE_ARGUMENTS = ('df', 'compare_df', 'file_path', 'compare_file')
+    CR_ARGUMENTS = COMPARE_ARGUMENTS + ('cr_number', 'report_folder')
+
+    CHECKS = [
+        # PPE/MLBW import checks (AUDI ==> BOSCH)
+        CheckDefinition('Nr.1', ProjectCheckerPPE.check_empty_object_id_with_forbidden_cr_status,
+                        PPE, IMPORT),
+        CheckDefinition('Nr.2', ProjectCheckerPPE.check_cr_status_bosch_ppx_conditions,
+                        PPE, IMPORT),
+        CheckDefinition('Nr.4', ProjectCheckerPPE.check_anlaufkonfiguration_empty,
+                        PPE, IMPORT),
+        CheckDefinition('Nr.8', ProjectCheckerPPE.check_required_attributes_not_empty,
+                        PPE, IMPORT),
+        CheckDefinition('Nr.10', ProjectCheckerPPE.check_cr_status_bosch_ppx_015_and_brs_status_not_abgestimmt,
+                        PPE, IMPORT),
+        CheckDefinition('Nr.5', ProjectCheckerPPE.compare_cr_id_and_brs_status_by_object_id,
+                        PPE, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.6', ProjectCheckerPPE.check_object_text_with_status_hersteller_bosch_ppx,
+                        PPE, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.9', ProjectCheckerPPE.check_new_requirements_without_cr_id,
+                        PPE, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.11', ProjectCheckerPPE.check_cr_number_status,
+                        PPE, IMPORT, CR_ARGUMENTS, needs_compare=True, per_cr_number=True),
+        CheckDefinition('Nr.7', ProjectCheckerPPE.check_object_text_with_rb_as_status,
+                        PPE, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True),
+
+        # PPE/MLBW export checks (BOSCH ==> AUDI)
+        CheckDefinition('Nr.1', ProjectCheckerPPE.check_cr_id_with_typ_and_brs_1box_status_zulieferer_bosch_ppx,
+                        PPE, EXPORT),
+        CheckDefinition('Nr.2', ProjectCheckerPPE.check_typ_with_brs_1box_status_zulieferer_bosch_ppx,
+                        PPE, EXPORT),
+
+        # SSP import checks; Nr.1 - Nr.5 are not implemented and there are no export checks yet
+        CheckDefinition('Nr.6', ProjectCheckerSSP.check_object_text_with_status_oem_zu_lieferant_r,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.8', ProjectCheckerSSP.check_multiple_attributes_with_status_oem_zu_lieferant_r,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.9', ProjectCheckerSSP.check_quelle_with_status_oem_zu_lieferant_r,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.10', ProjectCheckerSSP.check_text_differences_without_status_validation,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.11', ProjectCheckerSSP.check_rb_update_for_changed_requirements,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.12', ProjectCheckerSSP.check_missing_object_ids_from_bosch,
+                        SSP, IMPORT, COMPARE_ARGUMENTS, needs_compare=True,
+                        consumes=['module_index']),
+        CheckDefinition('Nr.13', ProjectCheckerSSP.check_cr_number_status,
+                        SSP, IMPORT, CR_ARGUMENTS, needs_compare=True, per_cr_number=True),
+
+        # SDV01 import checks; there are no export checks yet
+        CheckDefinition('Nr.1', ProjectCheckerSDV01.check_empty_object_id_with_forbidden_cr_status,
+                        SDV01, IMPORT),
+        CheckDefinition('Nr.2', ProjectCheckerSDV01.check_cr_status_bosch_sdv01_conditions,
+                        SDV01, IMPORT),
+        CheckDefinition('Nr.3', ProjectCheckerSDV01.check_missing_release_for_verworfen_status,
+                        SDV01, IMPORT),
+        CheckDefinition('Nr.4', ProjectCheckerSDV01.compare_cr_id_and_brs_status_by_object_id,
+                        SDV01, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.5', ProjectCheckerSDV01.check_reqif_text_with_status_hersteller_bosch_sdv01,
+                        SDV01, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.6', ProjectCheckerSDV01.check_object_text_with_rb_as_status,
+                        SDV01, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True),
+        CheckDefinition('Nr.10', ProjectCheckerSDV01.check_cr_status_overwrite_protection,
+                        SDV01, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.7', ProjectCheckerSDV01.check_required_attributes_not_empty,
+                        SDV01, IMPORT),
+        CheckDefinition('Nr.8', ProjectCheckerSDV01.check_new_requirements_without_cr_id,
+                        SDV01, IMPORT, COMPARE_ARGUMENTS, needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.9', ProjectCheckerSDV01.check_new_cr_exists_for_rejected_requirements,
+                        SDV01, IMPORT, ('df', 'file_path', 'compare_df', 'compare_file'),
+                        needs_compare=True, per_module=True,
+                        consumes=['compare_index']),
+        CheckDefinition('Nr.11', ProjectCheckerSDV01.check_cr_number_status,
+                        SDV01, IMPORT, CR_ARGUMENTS + ('doors_version',), needs_compare=True, per_cr_number=True),
+    ]
+
+    @staticmethod
+    def select(project, direction, with_compare=False, with_cr_numbers=False):
+        """
+        Checks that apply to a project and direction, in report order.
+
+        Args:
+            project (str): Project name
+            direction (int): CheckRegistry.IMPORT or CheckRegistry.EXPORT
+            with_compare (bool, optional): A compare file is given
+            with_cr_numbers (bool, optional): CR numbers are given
+
+        Returns:
+            list: The CheckDefinitions
+        """
+        return [definition for definition in CheckRegistry.CHECKS
+                if definition.project == project and definition.direction == direction
+                and (with_compare or not definition.needs_compare)
+                and (with_cr_numbers or not definition.per_cr_number)]
+
+    @staticmethod
+    def plan(project, direction, compare_df=None, compare_file=None, cr_numbers=None,
+             doors_version="Classic", intermediates=None):
+        """
+        Build the execution plan of a run.
+
+        Checks that need a compare file or CR numbers are left out when these are
+        not given, and so are checks whose required compare file columns are
+        missing, since the compare file is the same for every customer file.
+
+        Args:
+            project (str): Project name
+            direction (int): CheckRegistry.IMPORT or CheckRegistry.EXPORT
+            compare_df (DataFrame, optional): The loaded compare file
+            compare_file (str, optional): Path of the compare file
+            cr_numbers (list, optional): CR numbers for the CR status checks
+            doors_version (str, optional): DOORS version of the customer files
+            intermediates (dict, optional): Intermediates that are already built,
+                                            e.g. {'compare_index': CompareIndex}
+
+        Returns:
+            CheckPlan: The plan
+        """
+        with_compare = compare_df is not None and compare_file is not None
+        definitions = []
+        for definition in CheckRegistry.select(project, direction, with_compare, bool(cr_numbers)):
+            if with_compare:
+                missing = CheckDefinition.missing_columns(definition.compare_requires, compare_df.columns)
+                if missing:
+                    logger.warning(f"Missing columns in the compare file: {missing}, in File: {compare_file}.\n"
+                                   f"Skipping check: {definition.name}")
+                    continue
+            definitions.append(definition)
+
+        if not definitions:
+            logger.warning(f"No {CheckRegistry.DIRECTION_NAMES[direction]} checks to run for project {project}")
+        return CheckPlan(project, direction, definitions,
+                         compare_df if with_compare else None, compare_file if with_compare else None,
+                         cr_numbers, doors_version, intermediates)
+
+    # Module of the generated compare rows that the test customer file
+    # LAH_Mod_0123abcd_local_conversion.xlsx belongs to
+    _TEST_MODULE = '/260177_Audi_SSP/10_260177_Customer-Spec_AS/QSLAH/LAH_Mod'
+
+    @staticmethod
+    def _generated_frame(columns, rows, offset, generator):
+        """
+        Table of random cell values for the check tests.
+
+        Args:
+            columns (iterable): Columns of the table; two unused columns are added
+            rows (int): Number of rows
+            offset (int): Added to the row number for the generated IDs
+            generator (random.Random): Source of the cell values
+
+        Returns:
+            DataFrame: The table, with object dtype
+        """
+        import pandas as pd
+
+        texts = ['Das System muss das Signal prüfen.', 'Die Spannung ≥ 12V; sonst Fehler',
+                 'Text A', 'Text  A', 'OLE Object Text', None]
+        vocabulary = {
+            'Typ': ['Anforderung,', 'Information,', 'Überschrift,', 'Anforderung', None],
+            'Type': ['Requirement', 'Information', None],
+            'CR-Status_Bosch_PPx': ['014,', '013,', '100,', '---', '015,', '15', None],
+            'CR-Status_Bosch_SDV0.1': ['014,', '031,', '100,', '---', '015,', None],
+            'BRS-1Box_Status_Hersteller_Bosch_PPx': ['verworfen,', 'abgestimmt,', 'neu/geändert,', None],
+            'BRS_Status_Hersteller_Bosch_SDV0.1': ['verworfen,', 'abgestimmt,', 'neu/geändert,', None],
+            'BRS-1Box_Status_Zulieferer_Bosch_PPx': ['akzeptiert', 'abgelehnt', 'offen,', None],
+            'Status OEM zu Lieferant R': ['zu bewerten,', 'verworfen,', 'akzeptiert,', None],
+            'RB_AS_Status': ['accepted', 'no_req', 'canceled_closed', 'open', None],
+            'ReqIF.Category': ['Anforderung', 'Information', 'Überschrift', None],
+            'Category': ['Anforderung', 'Information', None],
+            'ASIL': ['QM', 'A', 'B', 'n/a', None],
+            'externe CR-ID': ['CR-1', 'CR-2', None],
+            'Customer Id': ['CR-1', 'CR-2'],
+            'Customer Status': ['akzeptiert', 'offen'],
+            'Modulename': [CheckRegistry._TEST_MODULE, '/x/Other'],
+        }
+
+        def value(column, row):
+            if column in vocabulary:
+                return generator.choice(vocabulary[column])
+            if column == 'Object ID':
+                return generator.choice([row, row, row, None])
+            if column in ('ReqIF.ForeignID', 'ForeignID'):
+                return generator.choice([f'F{row}', None])
+            if 'CR-ID' in column:
+                return generator.choice(['CR-1', 'CR-2', None, None])
+            if 'Text' in column or column in ('English_Translation', 'Quelle'):
+                return generator.choice(texts)
+            return generator.choice(['a', 'b', 'a, b', None])
+
+        columns = sorted(columns) + ['Unused 1', 'Unused 2']
+        return pd.DataFrame([[value(col, row + offset) for col in columns] for row in range(rows)],
+                            columns=columns, dtype=object)
+
+    @staticmethod
+    def test_column_projection(rows=300, seed=0):
+        """
+        Regression test of the column declarations: every check must return the
+        same findings on tables projected to its declared columns as on the full
+        tables. A check reading a column it does not declare fails the test.
+
+        Args:
+            rows (int, optional): Rows of every generated table
+            seed (int, optional): Seed of the generated tables
+
+        Returns:
+            bool: True when all findings are identical
+        """
+        import random
+        import tempfile
+        import pandas as pd
+
+        generator = random.Random(seed)
+
+        def frame(columns, offset):
+            return CheckRegistry._generated_frame(columns, rows, offset, generator)
+
+        def projected(df, columns):
+            return df[[col for col in df.columns if col in columns]]
+
+        def run(definition, df, compare_df, folder):
+            # Like CheckRegistry.plan, leave out a check whose compare columns are missing
+            if definition.needs_compare and CheckDefinition.missing_columns(definition.compare_requires,
+                                                                            compare_df.columns):
+                return []
+            plan = CheckPlan(definition.project, definition.direction, [definition],
+                             compare_df, 'compare.xlsx', ['CR-1', 'CR-3'])
+            findings = plan.run(df, os.path.join(folder, 'LAH_Mod_0123abcd_local_conversion.xlsx'), folder)
+            return [dict(finding) for finding in findings]
+
+        print("\nTesting the checks on tables projected to their declared columns:")
+        print("-" * 50)
+        passed = True
+        total = 0
+        # The tables have the columns of all projects, so that a check also fails
+        # the test when it reads a column only other checks declare
+        df = frame({col for definition in CheckRegistry.CHECKS for col in definition.columns}, 0)
+        compare_df = frame({col for definition in CheckRegistry.CHECKS for col in definition.compare_columns},
+                           rows // 3)
+        with tempfile.TemporaryDirectory() as folder:
+            for project in (CheckRegistry.PPE, CheckRegistry.SSP, CheckRegistry.SDV01):
+                definitions = [definition for definition in CheckRegistry.CHECKS if definition.project == project]
+                # Further variants use the alternative columns, or lack the optional ones
+                variants = [(df, compare_df)] + [
+                    (df.drop(columns=without, errors='ignore'), compare_df.drop(columns=without, errors='ignore'))
+                    for without in (['ReqIF.ForeignID', 'ReqIF.Category', 'ForeignID', 'ASIL'], ['Typ', 'Type'])]
+                for definition in definitions:
+                    for variant_df, variant_compare_df in variants:
+                        expected = run(definition, variant_df, variant_compare_df, folder)
+                        total += len(expected)
+                        try:
+                            actual = run(definition, projected(variant_df, definition.columns),
+                                         projected(variant_compare_df, definition.compare_columns), folder)
+                        except KeyError as e:
+                            actual = f"KeyError {e}"
+                        if expected != actual:
+                            passed = False
+                            print(f"{project} {definition.number} {definition.name}: MISMATCH "
+                                  f"({len(expected)} findings, projected: {len(actual) if isinstance(actual, list) else actual})")
+        passed = passed and total > 0
+        print(f"{total} findings compared")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
+        return passed
+
+    @staticmethod
+    def test_module_partitions(rows=300, seed=1):
+        """
+        Regression test of the module partitions: every module check must return the
+        same findings on a compare file with several modules as on the rows of the
+        customer file's module plus the rows without a module name, given as a
+        compare file without modules.
+
+        Args:
+            rows (int, optional): Rows of every generated table
+            seed (int, optional): Seed of the generated tables
+
+        Returns:
+            bool: True when all findings are identical
+        """
+        import random
+        import tempfile
+
+        generator = random.Random(seed)
+        df = CheckRegistry._generated_frame(
+            {col for definition in CheckRegistry.CHECKS for col in definition.columns}, rows, 0, generator)
+        compare_df = CheckRegistry._generated_frame(
+            {col for definition in CheckRegistry.CHECKS for col in definition.compare_columns},
+            rows, rows // 3, generator)
+        compare_df[ModulePartitions.MODULE_COLUMN] = [
+            generator.choice([CheckRegistry._TEST_MODULE, CheckRegistry._TEST_MODULE, '/x/Other', None, ' '])
+            for _ in range(rows)]
+        # Same rows and index as the partition of the customer file
+        module_compare_df = compare_df[compare_df[ModulePartitions.MODULE_COLUMN] != '/x/Other'].drop(
+            columns=ModulePartitions.MODULE_COLUMN)
+
+        def run(definition, compare_df, folder):
+            plan = CheckPlan(definition.project, definition.direction, [definition],
+                             compare_df, 'compare.xlsx', ['CR-1', 'CR-3'])
+            findings = plan.run(df, os.path.join(folder, 'LAH_Mod_0123abcd_local_conversion.xlsx'), folder)
+            return [dict(finding) for finding in findings]
+
+        print("\nTesting the module checks on a partitioned compare file:")
+        print("-" * 50)
+        passed = True
+        total = 0
+        with tempfile.TemporaryDirectory() as folder:
+            for definition in CheckRegistry.CHECKS:
+                if not definition.per_module:
+                    continue
+                expected = run(definition, module_compare_df, folder)
+                actual = run(definition, compare_df, folder)
+                total += len(expected)
+                if expected != actual:
+                    passed = False
+                    print(f"{definition.project} {definition.number} {definition.name}: MISMATCH "
+                          f"({len(expected)} findings, partitioned: {len(actual)})")
+        passed = passed and total > 0
+        print(f"{total} findings compared")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
+        return passed
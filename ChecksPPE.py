@@ -1,178 +1,182 @@
 import os
+import numpy as np
 import pandas as pd
 from HelperFunc import HelperFunctions
+from CompareIndex import CompareIndex
+from Finding import Finding
 from logger_config import logger
 
 
 class ProjectCheckerPPE:
     """Import Checks """
 
+    # Column helpers of the vectorised checks. They take the values of
+    # HelperFunctions.row_values, so str() gives the same text as for the cells
+    # of df.iterrows() rows.
+
+    @staticmethod
+    def _is_brs_status(brs_statuses, status):
+        """Rows whose BRS status without trailing commas is status."""
+        return brs_statuses.notna() & (brs_statuses.map(str).str.rstrip(',') == status)
+
+    @staticmethod
+    def _brs_status_text(brs_status):
+        """Report form of a BRS status: 'Empty' or the status without trailing commas."""
+        if pd.isna(brs_status) or brs_status == "":
+            return "Empty"
+        return str(brs_status).rstrip(',')
+
     # Check Nr.1
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-Status_Bosch_PPx'], optional=['Typ'])
     def check_empty_object_id_with_forbidden_cr_status(df, file_path):
         """
         Checks if 'Object ID' is empty and 'CR-Status_Bosch_PPx' has forbidden values.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
-        # Check for required columns
-        required_columns = ['Object ID', 'CR-Status_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        if missing_columns:
-            logger.warning(f"Missing columns in file {file_path}: {missing_columns}")
-            return findings
-
         logger.info(f"[CHECK NR.1 START] Empty Object ID with forbidden CR-Status | File: {file_path}")
         forbidden_status = ['014,', '013,', '100,']
-        for index, row in df.iterrows():
-            if pd.isna(row['Object ID']) and row[
-                'CR-Status_Bosch_PPx'] in forbidden_status:
-                logger.debug(f"Found issue at row {index + 2}: Empty Object ID with forbidden status {row['CR-Status_Bosch_PPx']}")
-                object_id = "Empty"
-                typ_value = row.get('Typ', None)
-                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                findings.append({
-                    'Row': index + 2,
-                    'Check Number': 'Nr.1',
-                    'Object ID': object_id,
-                    'Attribute': 'Object ID, CR-Status_Bosch_PPx',
-                    'Issue': "Empty 'Object ID' with forbidden 'CR-Status_Bosch_PPx' value",
-                    'Value': (
-                        f"Object ID: {object_id}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"CR-Status_Bosch_PPx: {row['CR-Status_Bosch_PPx']}"
-                    )
-                })
+        violations = df['Object ID'].isna() & df['CR-Status_Bosch_PPx'].isin(forbidden_status)
+
+        cr_statuses = df['CR-Status_Bosch_PPx']
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            cr_status = cr_statuses.iat[position]
+            logger.debug(f"Found issue at row {index + 2}: Empty Object ID with forbidden status {cr_status}")
+            object_id = "Empty"
+            findings.append(Finding(
+                'Nr.1', index + 2, object_id,
+                attribute='Object ID, CR-Status_Bosch_PPx',
+                issue="Empty 'Object ID' with forbidden 'CR-Status_Bosch_PPx' value",
+                template=(
+                    "Object ID: {id}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "CR-Status_Bosch_PPx: {cr_status}"
+                ),
+                status=cr_status,
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                cr_status=cr_status))
         logger.info(f"[CHECK NR.1 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.2
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['CR-Status_Bosch_PPx', 'CR-ID_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx'],
+        optional=['Object ID', 'Typ'])
     def check_cr_status_bosch_ppx_conditions(df, file_path):
         """
         Checks if 'CR-Status_Bosch_PPx' is '---', 'CR-ID_Bosch_PPx' is not empty,
         and 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'verworfen'.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         logger.info(f"[CHECK NR.2 START] CR-Status '---' with non-empty CR-ID | File: {file_path}")
-        # Check for required columns
-        required_columns = ['CR-Status_Bosch_PPx', 'CR-ID_Bosch_PPx',
-                            'BRS-1Box_Status_Hersteller_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_cr_status_bosch_ppx_conditions.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}")
-            return findings
 
-        for index, row in df.iterrows():
-            # Handle empty BRS status
-            brs_status = row['BRS-1Box_Status_Hersteller_Bosch_PPx']
-            if pd.isna(brs_status) or brs_status == "":
-                brs_status = "Empty"
-            else:
-                brs_status = str(brs_status).rstrip(',')
-
-            if (row['CR-Status_Bosch_PPx'] == "---" and
-                    not pd.isna(row['CR-ID_Bosch_PPx']) and
-                    brs_status != "verworfen"):
-                object_id = row.get('Object ID', None)
-                object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                typ_value = row.get('Typ', None)
-                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                findings.append({
-                    'Row': index + 2,
-                    'Check Number': 'Nr.2',
-                    'Object ID': object_id_str,
-                    'Attribute': 'CR-Status_Bosch_PPx, CR-ID_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx',
-                    'Issue': (
-                        "'CR-Status_Bosch_PPx' is '---' where as 'CR-ID_Bosch_PPx' is not empty "
-                        "and 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'verworfen'"),
-                    'Value': (
-                        f"Object ID: {object_id_str}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"CR-Status_Bosch_PPx: {row['CR-Status_Bosch_PPx']}\n"
-                        f"CR-ID_Bosch_PPx: {row['CR-ID_Bosch_PPx']}\n"
-                        f"BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}")
-                })
+        brs_statuses = HelperFunctions.row_values(df, 'BRS-1Box_Status_Hersteller_Bosch_PPx')
+        violations = ((df['CR-Status_Bosch_PPx'] == "---")
+                      & df['CR-ID_Bosch_PPx'].notna()
+                      & ~ProjectCheckerPPE._is_brs_status(brs_statuses, "verworfen"))
+
+        cr_statuses = HelperFunctions.row_values(df, 'CR-Status_Bosch_PPx')
+        cr_ids = HelperFunctions.row_values(df, 'CR-ID_Bosch_PPx')
+        object_ids = HelperFunctions.row_values(df, 'Object ID') if 'Object ID' in df.columns else None
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            brs_status = ProjectCheckerPPE._brs_status_text(brs_statuses.iat[position])
+            object_id = object_ids.iat[position] if object_ids is not None else None
+            findings.append(Finding(
+                'Nr.2', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute='CR-Status_Bosch_PPx, CR-ID_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx',
+                issue=("'CR-Status_Bosch_PPx' is '---' where as 'CR-ID_Bosch_PPx' is not empty "
+                    "and 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'verworfen'"),
+                template=(
+                    "Object ID: {id!e}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "CR-Status_Bosch_PPx: {cr_status}\n"
+                    "CR-ID_Bosch_PPx: {cr_id}\n"
+                    "BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
+                ),
+                status=cr_statuses.iat[position],
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                cr_status=cr_statuses.iat[position],
+                cr_id=cr_ids.iat[position],
+                brs_status=brs_status))
         logger.info(f"[CHECK NR.2 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.4
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'Anlaufkonfiguration_01', 'Anlaufkonfiguration_02', 'Anlaufkonfiguration_03',
+         'BRS-1Box_Status_Hersteller_Bosch_PPx'],
+        optional=['Typ'])
     def check_anlaufkonfiguration_empty(df, file_path):
         """
         Checks if 'Anlaufkonfiguration_01', 'Anlaufkonfiguration_02', 'Anlaufkonfiguration_03'
         are empty where:
         1. 'Object ID' is not empty AND
         2. 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'verworfen'
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         logger.info(f"[CHECK NR.4 START] Anlaufkonfiguration empty check | File: {file_path}")
-        # Check for required columns
-        required_columns = ['Object ID', 'Anlaufkonfiguration_01',
-                            'Anlaufkonfiguration_02',
-                            'Anlaufkonfiguration_03',
-                            'BRS-1Box_Status_Hersteller_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_anlaufkonfiguration_empty.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}")
-            return findings
 
-        # Iterate through rows and check conditions
-        for index, row in df.iterrows():
-            # Handle empty BRS status
-            brs_status = row['BRS-1Box_Status_Hersteller_Bosch_PPx']
-            if pd.isna(brs_status) or brs_status == "":
-                brs_status = "Empty"
-            else:
-                brs_status = str(brs_status).rstrip(',')
-
-            # Check if 'Object ID' is not empty AND status is not 'verworfen'
-            if (not pd.isna(row['Object ID']) and 
-                brs_status != "verworfen"):
-                
-                # Check Anlaufkonfiguration columns
-                empty_columns = [col for col in required_columns[1:4] if
-                                pd.isna(row[col])]
-                if empty_columns:
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.4',
-                        'Object ID': str(row['Object ID']),
-                        'Attribute': ', '.join(empty_columns),
-                        'Issue': (
-                            f"{', '.join(empty_columns)} is empty where as 'Object ID' is not empty "
-                            f"and BRS-1Box_Status_Hersteller_Bosch_PPx is not 'verworfen'."
-                        ),
-                        'Value': (
-                            f"Object ID: {row['Object ID']}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"Empty Attributes: {', '.join(empty_columns)}\n"
-                            f"BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
-                        )
-                    })
+        # Rows with an 'Object ID' whose status is not 'verworfen' and at least one
+        # empty Anlaufkonfiguration column
+        anlauf_columns = ['Anlaufkonfiguration_01', 'Anlaufkonfiguration_02', 'Anlaufkonfiguration_03']
+        brs_statuses = HelperFunctions.row_values(df, 'BRS-1Box_Status_Hersteller_Bosch_PPx')
+        empty = df[anlauf_columns].isna()
+        violations = (df['Object ID'].notna()
+                      & ~ProjectCheckerPPE._is_brs_status(brs_statuses, "verworfen")
+                      & empty.any(axis=1))
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID')
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        empty_values = empty.to_numpy()
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            brs_status = ProjectCheckerPPE._brs_status_text(brs_statuses.iat[position])
+            empty_columns = [col for col, is_empty in zip(anlauf_columns, empty_values[position]) if is_empty]
+            object_id = object_ids.iat[position]
+            findings.append(Finding(
+                'Nr.4', index + 2, str(object_id),
+                attribute=', '.join(empty_columns),
+                issue=(f"{', '.join(empty_columns)} is empty where as 'Object ID' is not empty "
+                    f"and BRS-1Box_Status_Hersteller_Bosch_PPx is not 'verworfen'."),
+                template=(
+                    "Object ID: {id}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "Empty Attributes: {empty_attributes}\n"
+                    "BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
+                ),
+                status=brs_statuses.iat[position],
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                empty_attributes=', '.join(empty_columns),
+                brs_status=brs_status))
         logger.info(f"[CHECK NR.4 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.5
     @staticmethod
-    def compare_cr_id_and_brs_status_by_object_id(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-ID_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx', 'CR-Status_Bosch_PPx', 'Typ'],
+        compare_columns=['Object ID', 'CR-ID_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx', 'CR-Status_Bosch_PPx', 'Typ'])
+    def compare_cr_id_and_brs_status_by_object_id(df, compare_df, file_path, compare_file_path,
+                                                  compare_index=None):
         """
         Compares 'CR-ID_Bosch_PPx' and 'BRS-1Box_Status_Hersteller_Bosch_PPx' between the main file (Audi) and a reference (Bosch) file, matching rows by 'Object ID'.
         For each row in the main file where 'Typ' is 'Anforderung' (with or without a trailing comma):
@@ -184,78 +188,80 @@ class ProjectCheckerPPE:
         """
         findings = []
         logger.info(f"[CHECK NR.5 START] CR-ID and BRS-Status comparison by Object ID | File: {file_path}")
-        required_columns = ['Object ID', 'CR-ID_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx', 'CR-Status_Bosch_PPx', 'Typ']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_reference_columns = [col for col in required_columns if col not in compare_df.columns]
-        if missing_columns:
-            check_name = __class__.compare_cr_id_and_brs_status_by_object_id.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, in File: {file_path}. Skipping check: {check_name}\n\n")
-            return findings
-        if missing_reference_columns:
-            check_name = __class__.compare_cr_id_and_brs_status_by_object_id.__name__
-            logger.warning(f"Warning: Missing columns in the reference file: {missing_reference_columns}, in File: {compare_file_path}. Skipping check: {check_name}\n\n")
-            return findings
 
-        for index, row in df.iterrows():
+        # Join on 'Object ID' through the compare index instead of filtering compare_df per row
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
+        ref_cr_ids = compare_index.column('CR-ID_Bosch_PPx')
+        ref_brs_statuses = compare_index.column('BRS-1Box_Status_Hersteller_Bosch_PPx')
+        ref_cr_statuses = compare_index.column('CR-Status_Bosch_PPx')
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             typ_value = str(row['Typ']).rstrip(',')
-            if pd.isna(object_id) or typ_value != 'Anforderung':
+            if object_key is None or typ_value != 'Anforderung':
                 continue
-            # Find all rows in compare_df with the same Object ID
-            ref_matches = compare_df[compare_df['Object ID'] == object_id]
-            if ref_matches.empty:
+            # Find all rows in compare_df with the same Object ID (in file order)
+            ref_positions = compare_index.rows(HelperFunctions.id_key_column('Object ID'), object_key)
+            if not ref_positions:
                 continue  # No reference to compare
-            for _, ref_row in ref_matches.iterrows():
+            for position in ref_positions:
                 cr_id = row['CR-ID_Bosch_PPx']
                 brs_status = row['BRS-1Box_Status_Hersteller_Bosch_PPx']
                 cr_status = row['CR-Status_Bosch_PPx']
-                ref_cr_id = ref_row['CR-ID_Bosch_PPx']
-                ref_brs_status = ref_row['BRS-1Box_Status_Hersteller_Bosch_PPx']
-                ref_cr_status = ref_row['CR-Status_Bosch_PPx']
-                # Convert NaN to 'Empty' for reporting
-                cr_id_str = 'Empty' if pd.isna(cr_id) or cr_id == '' else cr_id
-                brs_status_str = 'Empty' if pd.isna(brs_status) or brs_status == '' else brs_status
-                cr_status_str = 'Empty' if pd.isna(cr_status) or cr_status == '' else cr_status
-                ref_cr_id_str = 'Empty' if pd.isna(ref_cr_id) or ref_cr_id == '' else ref_cr_id
-                ref_brs_status_str = 'Empty' if pd.isna(ref_brs_status) or ref_brs_status == '' else ref_brs_status
-                ref_cr_status_str = 'Empty' if pd.isna(ref_cr_status) or ref_cr_status == '' else ref_cr_status
-                norm_cr_id = HelperFunctions.normalize_text(cr_id)
-                norm_ref_cr_id = HelperFunctions.normalize_text(ref_cr_id)
+                ref_cr_id = ref_cr_ids[position]
+                ref_brs_status = ref_brs_statuses[position]
+                ref_cr_status = ref_cr_statuses[position]
+                norm_cr_id = HelperFunctions.normalize_cached(cr_id)
+                norm_ref_cr_id = HelperFunctions.normalize_cached(ref_cr_id)
                 norm_brs_status = str(brs_status).rstrip(',') if not pd.isna(brs_status) else ''
                 norm_ref_brs_status = str(ref_brs_status).rstrip(',') if not pd.isna(ref_brs_status) else ''
                 norm_cr_status = str(cr_status).rstrip(',') if not pd.isna(cr_status) else ''
                 norm_ref_cr_status = str(ref_cr_status).rstrip(',') if not pd.isna(ref_cr_status) else ''
                 if norm_cr_id != norm_ref_cr_id or norm_brs_status != norm_ref_brs_status:
-                    typ_str = str(typ_value).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.5',
-                        'Object ID': str(object_id),
-                        'Attribute': 'CR-ID_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx, CR-Status_Bosch_PPx',
-                        'Issue': ("'CR-ID_Bosch_PPx' or 'BRS-1Box_Status_Hersteller_Bosch_PPx' differs from Bosch file."),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer CR-ID_Bosch_PPx: {cr_id_str}\n"
-                            f"       Customer BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status_str}\n"
-                            f"       Customer CR-Status_Bosch_PPx: {cr_status_str}\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch CR-ID_Bosch_PPx: {ref_cr_id_str}\n"
-                            f"       Bosch BRS-1Box_Status_Hersteller_Bosch_PPx: {ref_brs_status_str}\n"
-                            f"       Bosch CR-Status_Bosch_PPx: {ref_cr_status_str}"
-                        )
-                    })
+                    findings.append(Finding(
+                        'Nr.5', index + 2, str(object_id),
+                        attribute='CR-ID_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx, CR-Status_Bosch_PPx',
+                        issue="'CR-ID_Bosch_PPx' or 'BRS-1Box_Status_Hersteller_Bosch_PPx' differs from Bosch file.",
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer CR-ID_Bosch_PPx: {customer_cr_id!e}\n"
+                            "       Customer BRS-1Box_Status_Hersteller_Bosch_PPx: {customer_brs_status!e}\n"
+                            "       Customer CR-Status_Bosch_PPx: {customer_cr_status!e}\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch CR-ID_Bosch_PPx: {bosch_cr_id!e}\n"
+                            "       Bosch BRS-1Box_Status_Hersteller_Bosch_PPx: {bosch_brs_status!e}\n"
+                            "       Bosch CR-Status_Bosch_PPx: {bosch_cr_status!e}"
+                        ),
+                        status=brs_status,
+                        id=object_id,
+                        typ=typ_value,
+                        customer_file=os.path.basename(file_path),
+                        customer_cr_id=cr_id,
+                        customer_brs_status=brs_status,
+                        customer_cr_status=cr_status,
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_cr_id=ref_cr_id,
+                        bosch_brs_status=ref_brs_status,
+                        bosch_cr_status=ref_cr_status))
         logger.info(f"[CHECK NR.5 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.6
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'Object Text', 'BRS-1Box_Status_Hersteller_Bosch_PPx'],
+        compare_columns=['Object ID', 'Object Text'],
+        optional=['Typ'])
     def check_object_text_with_status_hersteller_bosch_ppx(df, compare_df,
-                                                           file_path, compare_file_path):
+                                                           file_path, compare_file_path,
+                                                           compare_index=None):
         """
         Compares the 'Object Text' attribute based on 'Object ID' with a compare file.
         If 'Object Text' differs, ensure 'BRS-1Box_Status_Hersteller_Bosch_PPx' is 'neu/geändert'.
@@ -264,83 +270,68 @@ class ProjectCheckerPPE:
         """
         findings = []
         logger.info(f"[CHECK NR.6 START] Object Text vs BRS-Status Hersteller | File: {file_path}")
-        # Ensure required columns exist in both DataFrames
-        required_columns = ['Object ID', 'Object Text',
-                            'BRS-1Box_Status_Hersteller_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        missing_compare_columns = [col for col in required_columns[:2] if
-                                   col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.check_object_text_with_status_hersteller_bosch_ppx.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}\n\n")
-            return findings
 
-        if missing_compare_columns:
-            check_name = __class__.check_object_text_with_status_hersteller_bosch_ppx.__name__
-            logger.warning(f"Warning: Missing columns in the compare file: {missing_compare_columns}.\nSkipping check: {check_name}\n\n")
-            return findings
+        # Quick lookup of 'Object Text' from compare file (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
-        # Create a dictionary for quick lookup of 'Object Text' from compare file
-        compare_dict = compare_df.set_index('Object ID')[
-            'Object Text'].to_dict()
+        key_column = HelperFunctions.id_key_column('Object ID')
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
 
         # Iterate through rows in the main DataFrame
-        for index, row in df.iterrows():
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             object_text = row['Object Text']
             brs_status = row.get('BRS-1Box_Status_Hersteller_Bosch_PPx', None)
 
             # Skip rows with missing 'Object ID'
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Check if the 'Object ID' exists in the compare file
-            if object_id in compare_dict:
-                compare_text = compare_dict[object_id]
+            if compare_index.contains(key_column, object_key):
+                compare_text = compare_index.value(key_column, object_key, 'Object Text')
 
-                # Clean OLE Object artifacts before strict normalization
-                cleaned_object_text = HelperFunctions.clean_ole_object_text(object_text)
-                cleaned_compare_text = HelperFunctions.clean_ole_object_text(compare_text)
-
-                # Normalize both object_text and compare_text
-                normalized_object_text = HelperFunctions.normalize_text(cleaned_object_text)
-                normalized_compare_text = HelperFunctions.normalize_text(cleaned_compare_text)
+                # Clean OLE Object artifacts and normalize (cached for the whole run)
+                normalized_object_text = HelperFunctions.normalize_cached(object_text, 'ole_text')
+                normalized_compare_text = HelperFunctions.normalize_cached(compare_text, 'ole_text')
                 if normalized_object_text != normalized_compare_text:
                     if brs_status not in ['neu/geändert,']:
-                        typ_value = row.get('Typ', None)
-                        typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                        compare_text_display = 'Empty' if pd.isna(compare_text) or str(compare_text).strip() == '' else str(compare_text)
-                        findings.append({
-                            'Row': index + 2,  # Adjust for Excel row numbering
-                            'Check Number': 'Nr.6',
-                            'Object ID': str(object_id),
-                            'Attribute': 'Object Text, BRS-1Box_Status_Hersteller_Bosch_PPx',
-                            'Issue': (
-                                f"'Object Text' differs but 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'neu/geändert'."
+                        findings.append(Finding(
+                            'Nr.6', index + 2, str(object_id),
+                            attribute='Object Text, BRS-1Box_Status_Hersteller_Bosch_PPx',
+                            issue=f"'Object Text' differs but 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'neu/geändert'.",
+                            template=(
+                                "Object ID: {id}\n"
+                                "Typ: {typ!t}\n"
+                                "\n"
+                                "---------------\n"
+                                "       Customer File Name: {customer_file}\n"
+                                "       Customer File Object Text: {customer_text}\n"
+                                "---------------\n"
+                                "       Bosch File Name: {bosch_file}\n"
+                                "       Bosch File Object Text: {bosch_text!e}\n"
+                                "---------------\n"
+                                "       BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
                             ),
-                            'Value': (
-                                f"Object ID: {object_id}\n"
-                                f"Typ: {typ_str}\n"
-                                f"\n"
-                                f"---------------\n"
-                                f"       Customer File Name: {os.path.basename(file_path)}\n"
-                                f"       Customer File Object Text: {object_text}\n"
-                                f"---------------\n"
-                                f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                                f"       Bosch File Object Text: {compare_text_display}\n"
-                                f"---------------\n"
-                                f"       BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
-                            )
-                        })
+                            status=brs_status,
+                            id=object_id,
+                            typ=row.get('Typ', None),
+                            customer_file=os.path.basename(file_path),
+                            customer_text=object_text,
+                            bosch_file=os.path.basename(compare_file_path),
+                            bosch_text=compare_text,
+                            brs_status=brs_status))
 
         logger.info(f"[CHECK NR.6 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.7
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'Object Text'],
+        compare_columns=['Object ID', 'Object Text', 'RB_AS_Status'],
+        compare_optional=['Typ'])
     def check_object_text_with_rb_as_status(df, compare_df, file_path, compare_file_path):
         """
         Compares 'Object Text' in the main file with the compare file based on 'Object ID'.
@@ -349,30 +340,14 @@ class ProjectCheckerPPE:
         """
         findings = []
         logger.info(f"[CHECK NR.7 START] Object Text with RB_AS_Status | File: {file_path}")
-        # Ensure required columns exist in both DataFrames
-        required_columns = ['Object ID', 'Object Text', 'RB_AS_Status']
-        missing_columns = [col for col in required_columns[:2] if
-                           col not in df.columns]
-        missing_compare_columns = [col for col in required_columns if
-                                   col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.check_object_text_with_rb_as_status.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}\n\n")
-            return findings
-
-        if missing_compare_columns:
-            check_name = __class__.check_object_text_with_rb_as_status.__name__
-            logger.warning(f"Warning: Missing columns in the compare file: {missing_compare_columns}.\nSkipping check: {check_name}\n\n")
-            return findings
 
         # Create a dictionary for quick lookup of 'Object Text' from main file(gernerated from reqif)
-        compare_dict = df.set_index('Object ID')[
-            'Object Text'].to_dict()
+        # keyed by canonical ID, the last row of an ID wins
+        compare_dict = dict(zip(HelperFunctions.id_keys(df, 'Object ID'), df['Object Text']))
+        compare_keys = HelperFunctions.id_keys(compare_df, 'Object ID')
 
         # Iterate through rows in the compare file DataFrame
-        for index, row in compare_df.iterrows():
+        for (index, row), object_key in zip(compare_df.iterrows(), compare_keys):
             object_id = row['Object ID']
             # here object_text is from the compare CCB file
             object_text = row['Object Text']
@@ -382,64 +357,72 @@ class ProjectCheckerPPE:
                 logger.debug(f"Warning: 'RB_AS_Status' is None for Object ID: {object_id}")
 
                 # Skip rows with missing 'Object ID'
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Check if the 'Object ID' exists in the compare file
-            if object_id in compare_dict:
+            if object_key in compare_dict:
                 # here the compare text is from generated reqif file
-                compare_text = compare_dict[object_id]
-                # Clean OLE Object artifacts before strict normalization
-                cleaned_object_text = HelperFunctions.clean_ole_object_text(object_text)
-                cleaned_compare_text = HelperFunctions.clean_ole_object_text(compare_text)
-                # Normalize both object_text and compare_text
-                normalized_object_text = HelperFunctions.normalize_text(cleaned_object_text)
-                normalized_compare_text = HelperFunctions.normalize_text(cleaned_compare_text)
+                compare_text = compare_dict[object_key]
+                # Clean OLE Object artifacts and normalize (cached for the whole run)
+                normalized_object_text = HelperFunctions.normalize_cached(object_text, 'ole_text')
+                normalized_compare_text = HelperFunctions.normalize_cached(compare_text, 'ole_text')
 
                 # If 'Object Text' differs, check 'RB_AS_Status'
                 if normalized_object_text != normalized_compare_text:
                     logger.debug(f"rb_as_status: {rb_as_status}")
                     if rb_as_status in ['accepted', 'no_req',
                                         'canceled_closed']:
-                        typ_value = row.get('Typ', None)
-                        typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                        object_text_display = 'Empty' if pd.isna(object_text) or str(object_text).strip() == '' else str(object_text)
-                        compare_text_display = 'Empty' if pd.isna(compare_text) or str(compare_text).strip() == '' else str(compare_text)
-                        findings.append({
-                            'Row': index + 2,  # Adjust for Excel row numbering
-                            'Check Number': 'Nr.7',
-                            'Object ID': str(object_id),
-                            'Attribute': 'Object Text, RB_AS_Status',
-                            'Issue': (
-                                f"'Object Text' differs but 'RB_AS_Status' is one of the prohibited values "
-                                f"('accepted', 'no_req', 'canceled_closed')."
+                        findings.append(Finding(
+                            'Nr.7', index + 2, str(object_id),
+                            attribute='Object Text, RB_AS_Status',
+                            issue=(f"'Object Text' differs but 'RB_AS_Status' is one of the prohibited values "
+                                f"('accepted', 'no_req', 'canceled_closed')."),
+                            template=(
+                                "Object ID: {id}\n"
+                                "Typ: {typ!t}\n"
+                                "\n"
+                                "---------------\n"
+                                "       Bosch File Name: {bosch_file}\n"
+                                "       Bosch File Object Text: {bosch_text!e}\n"
+                                "---------------\n"
+                                "       Customer File Name: {customer_file}\n"
+                                "       Customer File Object Text: {customer_text!e}\n"
+                                "---------------\n"
+                                "       RB_AS_Status: {rb_as_status}"
                             ),
-                            'Value': (
-                                  f"Object ID: {object_id}\n"
-                                  f"Typ: {typ_str}\n"
-                                  f"\n"
-                                  f"---------------\n"
-                                  f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                                  f"       Bosch File Object Text: {object_text_display}\n"
-                                  f"---------------\n"
-                                  f"       Customer File Name: {os.path.basename(file_path)}\n"
-                                  f"       Customer File Object Text: {compare_text_display}\n"
-                                  f"---------------\n"
-                                  f"       RB_AS_Status: {rb_as_status}"
-                            )
-                        })
+                            status=rb_as_status,
+                            id=object_id,
+                            typ=row.get('Typ', None),
+                            bosch_file=os.path.basename(compare_file_path),
+                            bosch_text=object_text,
+                            customer_file=os.path.basename(file_path),
+                            customer_text=compare_text,
+                            rb_as_status=rb_as_status))
 
         logger.info(f"[CHECK NR.7 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.8
+    # Details of the findings; the Object ID line is left out for files without 'Object ID'
+    _REQUIRED_ATTRIBUTES_DETAILS = (
+        "Typ: {typ!t}\n"
+        "\n"
+        "---------------\n"
+        "Empty Attributes: {empty_attributes}\n"
+        "BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
+    )
+    _REQUIRED_ATTRIBUTES_DETAILS_WITH_ID = "Object ID: {id!e}\n" + _REQUIRED_ATTRIBUTES_DETAILS
+
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['BRS-1Box_Status_Hersteller_Bosch_PPx', ('Object ID', 'Object Text', 'Technikvariante', 'Typ')])
     def check_required_attributes_not_empty(df, file_path):
         """
         Checks if required attributes are empty where BRS-1Box_Status_Hersteller_Bosch_PPx is not 'verworfen'.
         Required attributes: Object ID, Object Text, Technikvariante, Typ
         The check executes if at least one required attribute is present in the file.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         # Define all possible required columns
@@ -448,68 +431,48 @@ class ProjectCheckerPPE:
         
         # Check which required columns are actually present in the DataFrame
         available_columns = [col for col in all_required_columns if col in df.columns]
-        
-        # Check if BRS status column exists
-        if brs_status_column not in df.columns:
-            logger.warning(f"Missing BRS status column in file {file_path}")
-            return findings
-            
-        # Check if at least one required attribute is present
-        if not available_columns:
-            logger.warning(f"None of the required attributes {all_required_columns} found in file {file_path}")
-            return findings
-            
         logger.info(f"[CHECK NR.8 START] Required attributes not empty | File: {file_path}")
 
-        # Iterate through rows and check conditions
-        for index, row in df.iterrows():
-            # Handle empty BRS status
-            brs_status = row[brs_status_column]
-            if pd.isna(brs_status) or brs_status == "":
-                brs_status = "Empty"
-            else:
-                brs_status = str(brs_status).rstrip(',')
-
-            # Only check if status is not 'verworfen'
-            if brs_status != "verworfen":
-                # Check each available attribute
-                empty_columns = [col for col in available_columns if
-                               pd.isna(row[col]) or str(row[col]).strip() == ""]
-                
-                if empty_columns:
-                    # Build details section
-                    details = []
-                    object_id = row.get('Object ID', None)
-                    object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    # Add Object ID first if available
-                    if 'Object ID' in df.columns:
-                        details.append(f"Object ID: {object_id_str}")
-                    details.append(f"Typ: {typ_str}")
-                    details.append("")
-                    details.append("---------------")
-                    details.append(f"Empty Attributes: {', '.join(empty_columns)}")
-                    details.append(f"BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}")
-                    
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.8',
-                        'Object ID': object_id_str,
-                        'Attribute': ', '.join(empty_columns),
-                        'Issue': (
-                            f"{', '.join(empty_columns)} {'is' if len(empty_columns) == 1 else 'are'} empty while "
-                            f"BRS-1Box_Status_Hersteller_Bosch_PPx is not 'verworfen'."
-                        ),
-                        'Value': "\n".join(details)
-                    })
+        # Empty (missing or blank) attributes of every row whose status is not 'verworfen'
+        brs_statuses = HelperFunctions.row_values(df, brs_status_column)
+        empty = pd.DataFrame({col: HelperFunctions.is_blank(HelperFunctions.row_values(df, col))
+                              for col in available_columns}, index=df.index)
+        violations = ~ProjectCheckerPPE._is_brs_status(brs_statuses, "verworfen") & empty.any(axis=1)
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID') if 'Object ID' in df.columns else None
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        empty_values = empty.to_numpy()
+        # Object ID first if available
+        template = (ProjectCheckerPPE._REQUIRED_ATTRIBUTES_DETAILS_WITH_ID if object_ids is not None
+                    else ProjectCheckerPPE._REQUIRED_ATTRIBUTES_DETAILS)
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            brs_status = ProjectCheckerPPE._brs_status_text(brs_statuses.iat[position])
+            empty_columns = [col for col, is_empty in zip(available_columns, empty_values[position]) if is_empty]
+
+            object_id = object_ids.iat[position] if object_ids is not None else None
+            findings.append(Finding(
+                'Nr.8', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute=', '.join(empty_columns),
+                issue=(f"{', '.join(empty_columns)} {'is' if len(empty_columns) == 1 else 'are'} empty while "
+                    f"BRS-1Box_Status_Hersteller_Bosch_PPx is not 'verworfen'."),
+                template=template,
+                status=brs_statuses.iat[position],
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                empty_attributes=', '.join(empty_columns),
+                brs_status=brs_status))
 
         logger.info(f"[CHECK NR.8 END] Found {len(findings)} findings.")
         return findings
     
     # Check Nr.9
     @staticmethod
-    def check_new_requirements_without_cr_id(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-ID_Bosch_PPx', 'Typ'],
+        compare_columns=['Object ID'])
+    def check_new_requirements_without_cr_id(df, compare_df, file_path, compare_file_path,
+                                             compare_index=None):
         """
         Check Nr.9: Checks for new requirements (Object IDs present in Customer but not in Bosch) that do not have a CR-ID assigned.
         Reports a finding for each such case.
@@ -519,104 +482,101 @@ class ProjectCheckerPPE:
             compare_df (pd.DataFrame): The reference (Bosch) DataFrame to compare against.
             file_path (str): Path to the main file (for reporting).
             compare_file_path (str): Path to the reference file (for reporting).
+            compare_index (CompareIndex, optional): Prebuilt lookup of compare_df.
         
         Returns:
-            list of dict: Each dict describes a finding with row number, Object ID, and details.
+            list of Finding: One finding per requirement, with row number, Object ID, and details.
         """
         findings = []
         logger.info(f"[CHECK NR.9 START] New requirements without CR-ID | File: {file_path}")
-        required_columns = ['Object ID', 'CR-ID_Bosch_PPx', 'Typ']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_reference_columns = ['Object ID'] if 'Object ID' not in compare_df.columns else []
-        if missing_columns:
-            check_name = __class__.check_new_requirements_without_cr_id.__name__
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns}, in File: {file_path}. Skipping check: {check_name}\n\n")
-            return findings
-        if missing_reference_columns:
-            check_name = __class__.check_new_requirements_without_cr_id.__name__
-            logger.warning(f"Warning: Missing columns in the reference file: {missing_reference_columns}, in File: {compare_file_path}. Skipping check: {check_name}\n\n")
-            return findings
 
-        bosch_object_ids = set(compare_df['Object ID'])
-        for index, row in df.iterrows():
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             cr_id = row['CR-ID_Bosch_PPx']
             typ = row['Typ'] if 'Typ' in row else ''
             # Check if Object ID is not in Bosch and CR-ID_Bosch_PPx is empty
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
-            if object_id not in bosch_object_ids and (pd.isna(cr_id) or cr_id == ''):
-                typ_str = 'Empty' if pd.isna(typ) or str(typ).strip() == '' else str(typ).rstrip(',')
-                findings.append({
-                    'Row': index + 2,
-                    'Check Number': 'Nr.9',
-                    'Object ID': str(object_id),
-                    'Attribute': 'Object ID, CR-ID_Bosch_PPx',
-                    'Issue': ("New requirement (Object ID) found in Customer document that does not exist in Bosch document, and CR-ID_Bosch_PPx is missing. Hint: All new requirements should have a CR-ID assigned."),
-                    'Value': (
-                        f"Object ID: {object_id}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"       Customer File Name: {os.path.basename(file_path)}\n"
-                        f"       Customer CR-ID_Bosch_PPx: {'Empty' if pd.isna(cr_id) or cr_id == '' else cr_id}\n"
-                        f"---------------\n"
-                        f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                        f"       Bosch Object ID: Not found"
-                    )
-                })
+            if (not compare_index.contains(HelperFunctions.id_key_column('Object ID'), object_key)
+                    and (pd.isna(cr_id) or cr_id == '')):
+                findings.append(Finding(
+                    'Nr.9', index + 2, str(object_id),
+                    attribute='Object ID, CR-ID_Bosch_PPx',
+                    issue="New requirement (Object ID) found in Customer document that does not exist in Bosch document, and CR-ID_Bosch_PPx is missing. Hint: All new requirements should have a CR-ID assigned.",
+                    template=(
+                        "Object ID: {id}\n"
+                        "Typ: {typ!t}\n"
+                        "\n"
+                        "---------------\n"
+                        "       Customer File Name: {customer_file}\n"
+                        "       Customer CR-ID_Bosch_PPx: {cr_id!e}\n"
+                        "---------------\n"
+                        "       Bosch File Name: {bosch_file}\n"
+                        "       Bosch Object ID: Not found"
+                    ),
+                    id=object_id,
+                    typ=typ,
+                    customer_file=os.path.basename(file_path),
+                    cr_id=cr_id,
+                    bosch_file=os.path.basename(compare_file_path)))
         logger.info(f"[CHECK NR.9 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.10
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['CR-Status_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx', 'Object ID', 'Typ'])
     def check_cr_status_bosch_ppx_015_and_brs_status_not_abgestimmt(df, file_path):
         """
         Checks if 'CR-Status_Bosch_PPx' is '015' or '15' and 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'abgestimmt'.
         Handles both string and integer values for CR-Status_Bosch_PPx.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         logger.info(f"[CHECK NR.10 START] CR-Status 015 with BRS not abgestimmt | File: {file_path}")
         findings = []
-        required_columns = ['CR-Status_Bosch_PPx', 'BRS-1Box_Status_Hersteller_Bosch_PPx', 'Object ID', 'Typ']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_cr_status_bosch_ppx_015_and_brs_status_not_abgestimmt.__name__
-            logger.warning(f"Check Nr.10: Missing columns in the DataFrame: {missing_columns}, in File: {file_path}. Skipping check: {check_name}")
-            return findings
 
-        for index, row in df.iterrows():
-            status_bosch_ppx = row['CR-Status_Bosch_PPx']
-            brs_status = row['BRS-1Box_Status_Hersteller_Bosch_PPx']
-            object_id = row['Object ID'] if 'Object ID' in row else ''
-            typ = row['Typ'] if 'Typ' in row else ''
-            # Normalize by stripping trailing commas and whitespace
-            status_bosch_ppx_norm = str(status_bosch_ppx).strip().rstrip(',') if not pd.isna(status_bosch_ppx) else ''
-            brs_status_norm = str(brs_status).strip().rstrip(',') if not pd.isna(brs_status) else ''
-            if (status_bosch_ppx_norm == '015' or status_bosch_ppx_norm == '15') and brs_status_norm != 'abgestimmt':
-                object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                typ_str = 'Empty' if pd.isna(typ) or str(typ).strip() == '' else str(typ).rstrip(',')
-                findings.append({
-                    'Row': index + 2,  # Excel row numbering
-                    'Check Number': 'Nr.10',
-                    'Object ID': object_id_str,
-                    'Attribute': 'CR-Status_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx',
-                    'Issue': ("'CR-Status_Bosch_PPx' is '15' but 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'abgestimmt'."),
-                    'Value': (
-                        f"Object ID: {object_id_str}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"       File Name: {os.path.basename(file_path)}\n"
-                        f"       CR-Status_Bosch_PPx: {status_bosch_ppx_norm}\n"
-                        f"       BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status_norm}"
-                    )
-                })
+        # Normalize by stripping trailing commas and whitespace
+        status_bosch_ppx_norm = HelperFunctions.normalize_status(
+            HelperFunctions.row_values(df, 'CR-Status_Bosch_PPx'), empty='')
+        brs_status_norm = HelperFunctions.normalize_status(
+            HelperFunctions.row_values(df, 'BRS-1Box_Status_Hersteller_Bosch_PPx'), empty='')
+        violations = status_bosch_ppx_norm.isin(['015', '15']) & (brs_status_norm != 'abgestimmt')
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID')
+        typs = HelperFunctions.row_values(df, 'Typ')
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            object_id = object_ids.iat[position]
+            findings.append(Finding(
+                'Nr.10', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute='CR-Status_Bosch_PPx, BRS-1Box_Status_Hersteller_Bosch_PPx',
+                issue="'CR-Status_Bosch_PPx' is '15' but 'BRS-1Box_Status_Hersteller_Bosch_PPx' is not 'abgestimmt'.",
+                template=(
+                    "Object ID: {id!e}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "       File Name: {customer_file}\n"
+                    "       CR-Status_Bosch_PPx: {cr_status}\n"
+                    "       BRS-1Box_Status_Hersteller_Bosch_PPx: {brs_status}"
+                ),
+                status=brs_status_norm.iat[position],
+                id=object_id,
+                typ=typs.iat[position],
+                customer_file=os.path.basename(file_path),
+                cr_status=status_bosch_ppx_norm.iat[position],
+                brs_status=brs_status_norm.iat[position]))
         logger.info(f"[CHECK NR.10 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.11
     @staticmethod
+    @HelperFunctions.uses_columns(
+        compare_columns=['Customer Id', 'Customer Status'],
+        optional=['externe CR-ID', 'ReqIF.ForeignID'])
     def check_cr_number_status(df, compare_df, file_path, compare_file_path, cr_number, report_folder):
         """
         Check Nr.11: Given a CR number (e.g. 'BRSPPE-312'), looks it up in the compare file's
@@ -628,35 +588,27 @@ class ProjectCheckerPPE:
         cr_status_col = 'CR-Status_Bosch_PPx'
         logger.info(f"[CHECK NR.11 START] CR Number Status extraction | CR: {cr_number} | File: {file_path}")
 
-        # --- Validate required columns in compare file ---
-        compare_required = ['Customer Id', 'Customer Status']
-        missing_compare = [c for c in compare_required if c not in compare_df.columns]
-        if missing_compare:
-            logger.warning(f"[CHECK NR.11] Missing columns in compare file: {missing_compare}. Skipping.")
-            return findings
-
         # --- Look up CR number in compare file ---
         cr_rows = compare_df[compare_df['Customer Id'].astype(str).str.strip() == cr_number.strip()]
         if cr_rows.empty:
             logger.warning(f"[CHECK NR.11] CR number '{cr_number}' not found in compare file column 'Customer Id'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.11',
-                'Object ID': 'N/A',
-                'Attribute': 'Customer Id',
-                'Issue': f"CR number '{cr_number}' was not found in the compare file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Compare File: {os.path.basename(compare_file_path)}\n"
-                    f"Column searched: 'Customer Id'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.11', 'N/A', 'N/A',
+                attribute='Customer Id',
+                issue=f"CR number '{cr_number}' was not found in the compare file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Compare File: {bosch_file}\n"
+                    "Column searched: 'Customer Id'"
+                ),
+                cr_number=cr_number,
+                bosch_file=os.path.basename(compare_file_path)))
             return findings
 
         customer_status = str(cr_rows.iloc[0]['Customer Status']).strip()
         logger.debug(f"[CHECK NR.11] Found Customer Status: '{customer_status}' for CR: {cr_number}")
 
-        # --- Validate required columns in customer file ---
+        # --- Validate columns in customer file (after the lookup, which reports an unknown CR number) ---
         customer_required = ['externe CR-ID', 'ReqIF.ForeignID']
         missing_customer = [c for c in customer_required if c not in df.columns]
         if missing_customer:
@@ -667,18 +619,17 @@ class ProjectCheckerPPE:
         matching = df[df['externe CR-ID'].astype(str).str.strip() == cr_number.strip()]
         if matching.empty:
             logger.info(f"[CHECK NR.11] No rows found in customer file with 'externe CR-ID' = '{cr_number}'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.11',
-                'Object ID': 'N/A',
-                'Attribute': 'externe CR-ID',
-                'Issue': f"CR number '{cr_number}' was not found in the customer file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Customer File: {os.path.basename(file_path)}\n"
-                    f"Column searched: 'externe CR-ID'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.11', 'N/A', 'N/A',
+                attribute='externe CR-ID',
+                issue=f"CR number '{cr_number}' was not found in the customer file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Customer File: {customer_file}\n"
+                    "Column searched: 'externe CR-ID'"
+                ),
+                cr_number=cr_number,
+                customer_file=os.path.basename(file_path)))
             return findings
 
         # --- Build and write TSV file ---
@@ -696,19 +647,20 @@ class ProjectCheckerPPE:
         tsv_df.to_csv(tsv_path, sep='\t', index=False)
         logger.info(f"[CHECK NR.11 END] TSV written: {tsv_path} ({len(tsv_rows)} rows)")
 
-        findings.append({
-            'Row': 'N/A',
-            'Check Number': 'Nr.11',
-            'Object ID': 'N/A',
-            'Attribute': 'CR-Status',
-            'Issue': f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
-            'Value': (
-                f"CR Number: {cr_number}\n"
-                f"Customer Status: {customer_status}\n"
-                f"TSV File: {tsv_filename}"
+        findings.append(Finding(
+            'Nr.11', 'N/A', 'N/A',
+            attribute='CR-Status',
+            issue=f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
+            severity=Finding.INFO,
+            status=customer_status,
+            template=(
+                "CR Number: {cr_number}\n"
+                "Customer Status: {customer_status}\n"
+                "TSV File: {tsv_filename}"
             ),
-            'Type': 'info'
-        })
+            cr_number=cr_number,
+            customer_status=customer_status,
+            tsv_filename=tsv_filename))
 
         return findings
 
@@ -717,24 +669,17 @@ class ProjectCheckerPPE:
 
     # Check Nr.1
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['CR-ID_Bosch_PPx', 'Typ', 'BRS-1Box_Status_Zulieferer_Bosch_PPx'], optional=['Object ID'])
     def check_cr_id_with_typ_and_brs_1box_status_zulieferer_bosch_ppx(df,
                                                                       file_path):
         """
         Checks if 'CR-ID_Bosch_PPx' is not empty and 'Typ' is 'Anforderung',
         then 'BRS-1Box_Status_Zulieferer_Bosch_PPx' must be 'akzeptiert' or 'abgelehnt'.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         logger.info(f"[CHECK NR.1 (EXPORT) START] CR-ID with Typ and BRS-Status Zulieferer | File: {file_path}")
-        # Check for required columns
-        required_columns = ['CR-ID_Bosch_PPx', 'Typ',
-                            'BRS-1Box_Status_Zulieferer_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        if missing_columns:
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns},"
-                f" in File: {file_path}")
-            return findings
 
         for index, row in df.iterrows():
             if not pd.isna(row['CR-ID_Bosch_PPx']) and \
@@ -742,43 +687,37 @@ class ProjectCheckerPPE:
                 if row['BRS-1Box_Status_Zulieferer_Bosch_PPx'] \
                         not in ["akzeptiert", "abgelehnt"]:
                     object_id = row.get('Object ID', None)
-                    object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                    typ_str = str(row['Typ']).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.1 (Export)',
-                        'Object ID': object_id_str,
-                        'Attribute': 'CR-ID_Bosch_PPx, Typ, 1Box_Status_Zulieferer_Bosch_PPx',
-                        'Issue': (
-                            "'CR-ID_Bosch_PPx' is not empty and 'Typ' is 'Anforderung', "
+                    findings.append(Finding(
+                        'Nr.1 (Export)', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                        attribute='CR-ID_Bosch_PPx, Typ, 1Box_Status_Zulieferer_Bosch_PPx',
+                        issue=("'CR-ID_Bosch_PPx' is not empty and 'Typ' is 'Anforderung', "
                             "but 'BRS-1Box_Status_Zulieferer_Bosch_PPx' is not 'akzeptiert' or 'abgelehnt'"),
-                        'Value': (
-                            f"Object ID: {object_id_str}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"CR-ID_Bosch_PPx: {row['CR-ID_Bosch_PPx']}\n"
-                            f"BRS-1Box_Status_Zulieferer_Bosch_PPx: {row['BRS-1Box_Status_Zulieferer_Bosch_PPx']}")
-                    })
+                        template=(
+                            "Object ID: {id!e}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "CR-ID_Bosch_PPx: {cr_id}\n"
+                            "BRS-1Box_Status_Zulieferer_Bosch_PPx: {brs_status}"
+                        ),
+                        status=row['BRS-1Box_Status_Zulieferer_Bosch_PPx'],
+                        id=object_id,
+                        typ=row['Typ'],
+                        cr_id=row['CR-ID_Bosch_PPx'],
+                        brs_status=row['BRS-1Box_Status_Zulieferer_Bosch_PPx']))
         logger.info(f"[CHECK NR.1 (EXPORT) END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.2
+    @HelperFunctions.uses_columns(
+        ['Typ', 'BRS-1Box_Status_Zulieferer_Bosch_PPx'], optional=['Object ID'])
     def check_typ_with_brs_1box_status_zulieferer_bosch_ppx(df, file_path):
         """
         Checks if 'Typ' is 'Überschrift' or 'Information', then 'BRS-1Box_Status_Zulieferer_Bosch_PPx' must be 'n/a'.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         logger.info(f"[CHECK NR.2 (EXPORT) START] Typ with BRS-Status Zulieferer | File: {file_path}")
-        required_columns = ['Typ', 'BRS-1Box_Status_Zulieferer_Bosch_PPx']
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-
-        if missing_columns:
-            logger.warning(f"Warning: Missing columns in the DataFrame: {missing_columns},"
-                f" in File: {file_path}")
-            return findings
 
         for index, row in df.iterrows():
             if row['Typ'] in ["Überschrift,", "Information,"]:
@@ -786,22 +725,22 @@ class ProjectCheckerPPE:
                     row['BRS-1Box_Status_Zulieferer_Bosch_PPx']).lower()
                 if value != "n/a":
                     object_id = row.get('Object ID', None)
-                    object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                    typ_str = str(row['Typ']).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.2 (Export)',
-                        'Object ID': object_id_str,
-                        'Attribute': 'Typ, BRS-1Box_Status_Zulieferer_Bosch_PPx',
-                        'Issue': ("'Typ' is 'Überschrift' or 'Information', "
+                    findings.append(Finding(
+                        'Nr.2 (Export)', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                        attribute='Typ, BRS-1Box_Status_Zulieferer_Bosch_PPx',
+                        issue=("'Typ' is 'Überschrift' or 'Information', "
                                   "but 'BRS-1Box_Status_Zulieferer_Bosch_PPx' is not 'n/a'"),
-                        'Value': (
-                            f"Object ID: {object_id_str}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"BRS-1Box_Status_Zulieferer_Bosch_PPx: {value}")
-                    })
+                        template=(
+                            "Object ID: {id!e}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "BRS-1Box_Status_Zulieferer_Bosch_PPx: {brs_status}"
+                        ),
+                        status=row['BRS-1Box_Status_Zulieferer_Bosch_PPx'],
+                        id=object_id,
+                        typ=row['Typ'],
+                        brs_status=value))
         logger.info(f"[CHECK NR.2 (EXPORT) END] Found {len(findings)} findings.")
         return findings
 
@@ -1,6 +1,9 @@
 import os
+import numpy as np
 import pandas as pd
 from HelperFunc import HelperFunctions
+from CompareIndex import CompareIndex
+from Finding import Finding
 from logger_config import logger
 
 
@@ -10,142 +13,117 @@ class ProjectCheckerSDV01:
 
     The structure mirrors ProjectCheckerPPE / ProjectCheckerSSP:
     - Static methods per check
-    - Each method returns a list of finding dicts:
-      { 'Row': int, 'Attribute': str, 'Issue': str, 'Value': str }
+    - Each method returns a list of Finding records (read like the former finding
+      dicts: { 'Row': int, 'Attribute': str, 'Issue': str, 'Value': str })
     """
 
     # Import Checks
 
     # Check Nr.1
     @staticmethod
-    def check_empty_object_id_with_forbidden_cr_status(df: pd.DataFrame, file_path: str) -> list[dict]:
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-Status_Bosch_SDV0.1'], optional=['Typ'])
+    def check_empty_object_id_with_forbidden_cr_status(df: pd.DataFrame, file_path: str) -> list[Finding]:
         """
         Checks if 'Object ID' is empty and 'CR-Status_Bosch_SDV0.1' has forbidden values (014, 031, or 100).
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
-        findings: list[dict] = []
-        # Check for required columns
-        required_columns = ['Object ID', 'CR-Status_Bosch_SDV0.1']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            logger.warning(f"Missing columns in file {file_path}: {missing_columns}")
-            return findings
-
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.1 START] Empty Object ID with forbidden CR-Status | File: {file_path}")
         # Values are stored with a trailing comma in other projects, mirror that here.
         forbidden_status = ['014,', '031,', '100,']
-        for index, row in df.iterrows():
-            if pd.isna(row['Object ID']) and row['CR-Status_Bosch_SDV0.1'] in forbidden_status:
-                logger.debug(
-                    f"Found issue at row {index + 2}: Empty Object ID with forbidden status "
-                    f"{row['CR-Status_Bosch_SDV0.1']}"
-                )
-                object_id = "Empty"
-                typ_value = row.get('Typ', None)
-                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                findings.append({
-                    'Row': index + 2,  # Excel rows start at 1; +2 accounts for header row
-                    'Check Number': 'Nr.1',
-                    'Object ID': object_id,
-                    'Attribute': 'Object ID, CR-Status_Bosch_SDV0.1',
-                    'Issue': (
-                        "Empty 'Object ID' with forbidden 'CR-Status_Bosch_SDV0.1' value "
-                        "(014, 031 or 100 are not allowed with empty Object ID)."
-                    ),
-                    'Value': (
-                        f"Object ID: {object_id}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"CR-Status_Bosch_SDV0.1: {row['CR-Status_Bosch_SDV0.1']}"
-                    )
-                })
+        violations = df['Object ID'].isna() & df['CR-Status_Bosch_SDV0.1'].isin(forbidden_status)
+
+        cr_statuses = df['CR-Status_Bosch_SDV0.1']
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            cr_status = cr_statuses.iat[position]
+            logger.debug(
+                f"Found issue at row {index + 2}: Empty Object ID with forbidden status "
+                f"{cr_status}"
+            )
+            object_id = "Empty"
+            findings.append(Finding(
+                'Nr.1', index + 2, object_id,
+                attribute='Object ID, CR-Status_Bosch_SDV0.1',
+                issue=("Empty 'Object ID' with forbidden 'CR-Status_Bosch_SDV0.1' value "
+                    "(014, 031 or 100 are not allowed with empty Object ID)."),
+                template=(
+                    "Object ID: {id}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "CR-Status_Bosch_SDV0.1: {cr_status}"
+                ),
+                status=cr_status,
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                cr_status=cr_status))
         logger.info(f"[CHECK NR.1 END] Found {len(findings)} findings.")
         return findings
-    
+
     # Check Nr.2
     @staticmethod
-    def check_cr_status_bosch_sdv01_conditions(df: pd.DataFrame, file_path: str) -> list[dict]:
+    @HelperFunctions.uses_columns(
+        ['CR-Status_Bosch_SDV0.1', 'CR-ID_Bosch_SDV0.1', 'BRS_Status_Hersteller_Bosch_SDV0.1'],
+        optional=['Object ID', 'Typ'])
+    def check_cr_status_bosch_sdv01_conditions(df: pd.DataFrame, file_path: str) -> list[Finding]:
         """
         Checks if 'CR-Status_Bosch_SDV0.1' is empty or '---' while:
         - 'CR-ID_Bosch_SDV0.1' is not empty, and
         - 'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.2 START] CR-Status empty/'---' with non-empty CR-ID | File: {file_path}")
 
-        required_columns = [
-            'CR-Status_Bosch_SDV0.1',
-            'CR-ID_Bosch_SDV0.1',
-            'BRS_Status_Hersteller_Bosch_SDV0.1',
-        ]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_cr_status_bosch_sdv01_conditions.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
-        for index, row in df.iterrows():
-            cr_status_raw = row['CR-Status_Bosch_SDV0.1']
-            cr_id_raw = row['CR-ID_Bosch_SDV0.1']
-            brs_status_raw = row['BRS_Status_Hersteller_Bosch_SDV0.1']
-
-            # Normalize BRS status for comparison (strip trailing comma)
-            if pd.isna(brs_status_raw) or str(brs_status_raw).strip() == "":
-                brs_status_norm = "Empty"
-            else:
-                brs_status_norm = str(brs_status_raw).strip().rstrip(',')
-
-            # Determine if CR-ID is present
-            cr_id_present = not (pd.isna(cr_id_raw) or str(cr_id_raw).strip() == "")
-
-            # CR status is invalid if empty OR exactly '---' (allow comma variants via rstrip)
-            if pd.isna(cr_status_raw) or str(cr_status_raw).strip() == "":
-                cr_status_invalid = True
-                cr_status_display = "Empty"
-            else:
-                cr_status_clean = str(cr_status_raw).strip().rstrip(',')
-                cr_status_invalid = cr_status_clean == "---"
-                cr_status_display = cr_status_raw
-
-            if cr_status_invalid and cr_id_present and brs_status_norm != "verworfen":
-                object_id = row.get('Object ID', 'N/A')
-                object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                typ_value = row.get('Typ', None)
-                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                findings.append({
-                    'Row': index + 2,
-                    'Check Number': 'Nr.2',
-                    'Object ID': object_id_str,
-                    'Attribute': (
-                        'CR-Status_Bosch_SDV0.1, CR-ID_Bosch_SDV0.1, '
-                        'BRS_Status_Hersteller_Bosch_SDV0.1'
-                    ),
-                    'Issue': (
-                        "'CR-Status_Bosch_SDV0.1' is empty/'---' whereas 'CR-ID_Bosch_SDV0.1' "
-                        "is not empty and 'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."
-                    ),
-                    'Value': (
-                        f"Object ID: {object_id_str}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"CR-Status_Bosch_SDV0.1: {cr_status_display}\n"
-                        f"CR-ID_Bosch_SDV0.1: {cr_id_raw}\n"
-                        f"BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status_norm}"
-                    )
-                })
+        cr_statuses = HelperFunctions.row_values(df, 'CR-Status_Bosch_SDV0.1')
+        cr_ids = HelperFunctions.row_values(df, 'CR-ID_Bosch_SDV0.1')
+        # BRS status normalised once for all rows (trailing comma stripped, blank -> "Empty")
+        brs_statuses_norm = HelperFunctions.normalize_status(
+            HelperFunctions.row_values(df, 'BRS_Status_Hersteller_Bosch_SDV0.1'))
+
+        # CR status is invalid if empty OR exactly '---' (allow comma variants via rstrip)
+        cr_status_empty = HelperFunctions.is_blank(cr_statuses)
+        cr_status_invalid = cr_status_empty | (HelperFunctions.normalize_status(cr_statuses) == "---")
+        violations = cr_status_invalid & ~HelperFunctions.is_blank(cr_ids) & (brs_statuses_norm != "verworfen")
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID') if 'Object ID' in df.columns else None
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            object_id = object_ids.iat[position] if object_ids is not None else 'N/A'
+            findings.append(Finding(
+                'Nr.2', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute=('CR-Status_Bosch_SDV0.1, CR-ID_Bosch_SDV0.1, '
+                    'BRS_Status_Hersteller_Bosch_SDV0.1'),
+                issue=("'CR-Status_Bosch_SDV0.1' is empty/'---' whereas 'CR-ID_Bosch_SDV0.1' "
+                    "is not empty and 'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."),
+                template=(
+                    "Object ID: {id!e}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "CR-Status_Bosch_SDV0.1: {cr_status!e}\n"
+                    "CR-ID_Bosch_SDV0.1: {cr_id}\n"
+                    "BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status}"
+                ),
+                status=cr_statuses.iat[position],
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                cr_status=cr_statuses.iat[position],
+                cr_id=cr_ids.iat[position],
+                brs_status=brs_statuses_norm.iat[position]))
 
         logger.info(f"[CHECK NR.2 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.3
     @staticmethod
-    def check_missing_release_for_verworfen_status(df: pd.DataFrame, file_path: str) -> list[dict]:
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'BRS_Status_Hersteller_Bosch_SDV0.1', 'EntfallRelease', 'ErsteinsatzRelease', 'Typ'])
+    def check_missing_release_for_verworfen_status(df: pd.DataFrame, file_path: str) -> list[Finding]:
         """
         Checks rows where:
         - 'BRS_Status_Hersteller_Bosch_SDV0.1' != 'verworfen'
@@ -153,88 +131,65 @@ class ProjectCheckerSDV01:
 
         A finding is created listing which release attributes are empty.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.3 START] Missing release for non-verworfen status | File: {file_path}")
 
-        required_columns = [
-            'Object ID',
-            'BRS_Status_Hersteller_Bosch_SDV0.1',
-            'EntfallRelease',
-            'ErsteinsatzRelease',
-            'Typ',
-        ]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_missing_release_for_verworfen_status.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
-        for index, row in df.iterrows():
-            object_id = row['Object ID']
-            brs_status_raw = row['BRS_Status_Hersteller_Bosch_SDV0.1']
-            object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-
-            # Only check requirements (Typ == 'Anforderung', comma-insensitive)
-            typ_value_raw = row.get('Typ', None)
-            typ_value_norm = "" if pd.isna(typ_value_raw) else str(typ_value_raw).strip().rstrip(',')
-            if typ_value_norm != 'Anforderung':
-                continue
-
-            # Normalize BRS status
-            if pd.isna(brs_status_raw) or str(brs_status_raw).strip() == "":
-                brs_status_norm = "Empty"
-            else:
-                brs_status_norm = str(brs_status_raw).strip().rstrip(',')
-
-            # Only apply when status is NOT 'verworfen'
-            if brs_status_norm == "verworfen":
-                continue
-
-            entfall = row['EntfallRelease']
-            ersteinsatz = row['ErsteinsatzRelease']
-
+        # Only check requirements (Typ == 'Anforderung', comma-insensitive)
+        typs_norm = HelperFunctions.normalize_status(HelperFunctions.row_values(df, 'Typ'), empty="")
+        brs_statuses_norm = HelperFunctions.normalize_status(
+            HelperFunctions.row_values(df, 'BRS_Status_Hersteller_Bosch_SDV0.1'))
+        entfall = HelperFunctions.row_values(df, 'EntfallRelease')
+        ersteinsatz = HelperFunctions.row_values(df, 'ErsteinsatzRelease')
+        entfall_empty = HelperFunctions.is_blank(entfall)
+        ersteinsatz_empty = HelperFunctions.is_blank(ersteinsatz)
+        # Only apply when status is NOT 'verworfen'
+        violations = ((typs_norm == 'Anforderung') & (brs_statuses_norm != "verworfen")
+                      & (entfall_empty | ersteinsatz_empty))
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID')
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            object_id = object_ids.iat[position]
             missing_attrs = []
-            if pd.isna(entfall) or str(entfall).strip() == "":
+            if entfall_empty.iat[position]:
                 missing_attrs.append('EntfallRelease')
-            if pd.isna(ersteinsatz) or str(ersteinsatz).strip() == "":
+            if ersteinsatz_empty.iat[position]:
                 missing_attrs.append('ErsteinsatzRelease')
 
-            if not missing_attrs:
-                continue
-
-            typ_str = typ_value_norm
-            findings.append({
-                'Row': index + 2,
-                'Check Number': 'Nr.3',
-                'Object ID': object_id_str,
-                'Attribute': ', '.join(missing_attrs),
-                'Issue': (
-                    f"{', '.join(missing_attrs)} is empty while "
-                    "'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."
+            findings.append(Finding(
+                'Nr.3', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute=', '.join(missing_attrs),
+                issue=(f"{', '.join(missing_attrs)} is empty while "
+                    "'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."),
+                template=(
+                    "Object ID: {id!e}\n"
+                    "Typ: {typ}\n"
+                    "\n"
+                    "---------------\n"
+                    "BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status}\n"
+                    "EntfallRelease: {entfall!m}\n"
+                    "ErsteinsatzRelease: {ersteinsatz!m}"
                 ),
-                'Value': (
-                    f"Object ID: {object_id_str}\n"
-                    f"Typ: {typ_str}\n"
-                    f"\n"
-                    f"---------------\n"
-                    f"BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status_norm}\n"
-                    f"EntfallRelease: {entfall if not pd.isna(entfall) else 'Empty'}\n"
-                    f"ErsteinsatzRelease: {ersteinsatz if not pd.isna(ersteinsatz) else 'Empty'}"
-                )
-            })
+                status=brs_statuses_norm.iat[position],
+                id=object_id,
+                typ=typs_norm.iat[position],
+                brs_status=brs_statuses_norm.iat[position],
+                entfall=entfall.iat[position],
+                ersteinsatz=ersteinsatz.iat[position]))
 
         logger.info(f"[CHECK NR.3 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.4
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-ID_Bosch_SDV0.1', 'BRS_Status_Hersteller_Bosch_SDV0.1', 'CR-Status_Bosch_SDV0.1', 'Typ'],
+        compare_columns=['Object ID', 'CR-ID_Bosch_SDV0.1', 'BRS_Status_Hersteller_Bosch_SDV0.1', 'CR-Status_Bosch_SDV0.1', 'Typ'])
     def compare_cr_id_and_brs_status_by_object_id(df: pd.DataFrame,
                                                   compare_df: pd.DataFrame,
                                                   file_path: str,
-                                                  compare_file_path: str) -> list[dict]:
+                                                  compare_file_path: str,
+                                                  compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Compares 'CR-ID_Bosch_SDV0.1' and 'BRS_Status_Hersteller_Bosch_SDV0.1'
         between the main file (customer ReqIF) and a reference Bosch Doors export,
@@ -247,112 +202,92 @@ class ProjectCheckerSDV01:
         - If any difference is found in either attribute, a finding is reported.
         - 'CR-Status_Bosch_SDV0.1' is shown in the report for context but is not compared.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.4 START] CR-ID and BRS-Status comparison by Object ID | File: {file_path}")
-        required_columns = [
-            'Object ID',
-            'CR-ID_Bosch_SDV0.1',
-            'BRS_Status_Hersteller_Bosch_SDV0.1',
-            'CR-Status_Bosch_SDV0.1',
-            'Typ',
-        ]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_reference_columns = [col for col in required_columns if col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.compare_cr_id_and_brs_status_by_object_id.__name__
-            logger.warning(
-                f"Warning: Missing columns in the customer DataFrame: {missing_columns}, "
-                f"in File: {file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        if missing_reference_columns:
-            check_name = __class__.compare_cr_id_and_brs_status_by_object_id.__name__
-            logger.warning(
-                f"Warning: Missing columns in the reference file: {missing_reference_columns}, "
-                f"in File: {compare_file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        for index, row in df.iterrows():
+        # Join on 'Object ID' through the compare index instead of filtering compare_df per row
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
+        ref_cr_ids = compare_index.column('CR-ID_Bosch_SDV0.1')
+        ref_brs_statuses = compare_index.column('BRS_Status_Hersteller_Bosch_SDV0.1')
+        ref_cr_statuses = compare_index.column('CR-Status_Bosch_SDV0.1')
+
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             typ_value = str(row['Typ']).rstrip(',')
-            if pd.isna(object_id) or typ_value != 'Anforderung':
+            if object_key is None or typ_value != 'Anforderung':
                 continue
 
-            # Find all rows in compare_df with the same Object ID
-            ref_matches = compare_df[compare_df['Object ID'] == object_id]
-            if ref_matches.empty:
+            # Find all rows in compare_df with the same Object ID (in file order)
+            ref_positions = compare_index.rows(HelperFunctions.id_key_column('Object ID'), object_key)
+            if not ref_positions:
                 continue  # No reference to compare
 
-            for _, ref_row in ref_matches.iterrows():
+            for position in ref_positions:
                 cr_id = row['CR-ID_Bosch_SDV0.1']
                 brs_status = row['BRS_Status_Hersteller_Bosch_SDV0.1']
                 cr_status = row['CR-Status_Bosch_SDV0.1']
 
-                ref_cr_id = ref_row['CR-ID_Bosch_SDV0.1']
-                ref_brs_status = ref_row['BRS_Status_Hersteller_Bosch_SDV0.1']
-                ref_cr_status = ref_row['CR-Status_Bosch_SDV0.1']
-
-                # Convert NaN to 'Empty' for reporting
-                cr_id_str = 'Empty' if pd.isna(cr_id) or str(cr_id).strip() == '' else cr_id
-                brs_status_str = 'Empty' if pd.isna(brs_status) or str(brs_status).strip() == '' else brs_status
-                cr_status_str = 'Empty' if pd.isna(cr_status) or str(cr_status).strip() == '' else cr_status
-
-                ref_cr_id_str = 'Empty' if pd.isna(ref_cr_id) or str(ref_cr_id).strip() == '' else ref_cr_id
-                ref_brs_status_str = 'Empty' if pd.isna(ref_brs_status) or str(ref_brs_status).strip() == '' else ref_brs_status
-                ref_cr_status_str = 'Empty' if pd.isna(ref_cr_status) or str(ref_cr_status).strip() == '' else ref_cr_status
+                ref_cr_id = ref_cr_ids[position]
+                ref_brs_status = ref_brs_statuses[position]
+                ref_cr_status = ref_cr_statuses[position]
 
                 # Normalize values for comparison
-                norm_cr_id = HelperFunctions.normalize_text(cr_id)
-                norm_ref_cr_id = HelperFunctions.normalize_text(ref_cr_id)
+                norm_cr_id = HelperFunctions.normalize_cached(cr_id)
+                norm_ref_cr_id = HelperFunctions.normalize_cached(ref_cr_id)
                 norm_brs_status = str(brs_status).rstrip(',') if not pd.isna(brs_status) else ''
                 norm_ref_brs_status = str(ref_brs_status).rstrip(',') if not pd.isna(ref_brs_status) else ''
 
                 if norm_cr_id != norm_ref_cr_id or norm_brs_status != norm_ref_brs_status:
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.4',
-                        'Object ID': str(object_id),
-                        'Attribute': (
-                            'CR-ID_Bosch_SDV0.1, '
+                    findings.append(Finding(
+                        'Nr.4', index + 2, str(object_id),
+                        attribute=('CR-ID_Bosch_SDV0.1, '
                             'BRS_Status_Hersteller_Bosch_SDV0.1, '
-                            'CR-Status_Bosch_SDV0.1'
-                        ),
-                        'Issue': (
-                            "'CR-ID_Bosch_SDV0.1' or "
+                            'CR-Status_Bosch_SDV0.1'),
+                        issue=("'CR-ID_Bosch_SDV0.1' or "
                             "'BRS_Status_Hersteller_Bosch_SDV0.1' "
-                            "differs from Bosch reference file."
+                            "differs from Bosch reference file."),
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer CR-ID_Bosch_SDV0.1: {customer_cr_id!e}\n"
+                            "       Customer BRS_Status_Hersteller_Bosch_SDV0.1: {customer_brs_status!e}\n"
+                            "       Customer CR-Status_Bosch_SDV0.1: {customer_cr_status!e}\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch CR-ID_Bosch_SDV0.1: {bosch_cr_id!e}\n"
+                            "       Bosch BRS_Status_Hersteller_Bosch_SDV0.1: {bosch_brs_status!e}\n"
+                            "       Bosch CR-Status_Bosch_SDV0.1: {bosch_cr_status!e}"
                         ),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer CR-ID_Bosch_SDV0.1: {cr_id_str}\n"
-                            f"       Customer BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status_str}\n"
-                            f"       Customer CR-Status_Bosch_SDV0.1: {cr_status_str}\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch CR-ID_Bosch_SDV0.1: {ref_cr_id_str}\n"
-                            f"       Bosch BRS_Status_Hersteller_Bosch_SDV0.1: {ref_brs_status_str}\n"
-                            f"       Bosch CR-Status_Bosch_SDV0.1: {ref_cr_status_str}"
-                        )
-                    })
+                        status=brs_status,
+                        id=object_id,
+                        typ=row.get('Typ', None),
+                        customer_file=os.path.basename(file_path),
+                        customer_cr_id=cr_id,
+                        customer_brs_status=brs_status,
+                        customer_cr_status=cr_status,
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_cr_id=ref_cr_id,
+                        bosch_brs_status=ref_brs_status,
+                        bosch_cr_status=ref_cr_status))
 
         logger.info(f"[CHECK NR.4 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.5
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'ReqIF.Text', 'BRS_Status_Hersteller_Bosch_SDV0.1'],
+        compare_columns=['Object ID', 'Object Text'],
+        optional=['Typ'])
     def check_reqif_text_with_status_hersteller_bosch_sdv01(df: pd.DataFrame,
                                                             compare_df: pd.DataFrame,
                                                             file_path: str,
-                                                            compare_file_path: str) -> list[dict]:
+                                                            compare_file_path: str,
+                                                            compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Compares the 'ReqIF.Text' attribute (customer ReqIF) with 'Object Text' (Bosch reference)
         based on 'Object ID'.
@@ -360,96 +295,77 @@ class ProjectCheckerSDV01:
         If the text differs, 'BRS_Status_Hersteller_Bosch_SDV0.1' must be 'neu/geändert'
         (accepts values with or without trailing comma). If not, a finding is reported.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.5 START] ReqIF.Text vs Object Text with BRS status | File: {file_path}")
 
-        required_columns = ['Object ID', 'ReqIF.Text', 'BRS_Status_Hersteller_Bosch_SDV0.1']
-        compare_required_columns = ['Object ID', 'Object Text']
-
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_compare_columns = [col for col in compare_required_columns if col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.check_reqif_text_with_status_hersteller_bosch_sdv01.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}\n\n"
-            )
-            return findings
-
-        if missing_compare_columns:
-            check_name = __class__.check_reqif_text_with_status_hersteller_bosch_sdv01.__name__
-            logger.warning(
-                f"Warning: Missing columns in the compare file: {missing_compare_columns}, "
-                f"in File: {compare_file_path}.\nSkipping check: {check_name}\n\n"
-            )
-            return findings
-
-        # Create a dictionary for quick lookup of 'Object Text' from compare file
-        compare_dict = compare_df.set_index('Object ID')['Object Text'].to_dict()
+        # Quick lookup of 'Object Text' from compare file (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
-        for index, row in df.iterrows():
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             reqif_text = row['ReqIF.Text']
             brs_status = row.get('BRS_Status_Hersteller_Bosch_SDV0.1', None)
 
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
-            if object_id not in compare_dict:
+            if not compare_index.contains(HelperFunctions.id_key_column('Object ID'), object_key):
                 continue
 
-            compare_text = compare_dict[object_id]
+            compare_text = compare_index.value(HelperFunctions.id_key_column('Object ID'), object_key, 'Object Text')
 
-            # Clean OLE Object artifacts before strict normalization
-            cleaned_reqif_text = HelperFunctions.clean_ole_object_text(reqif_text)
-            cleaned_compare_text = HelperFunctions.clean_ole_object_text(compare_text)
-
-            normalized_reqif_text = HelperFunctions.normalize_text(cleaned_reqif_text)
-            normalized_compare_text = HelperFunctions.normalize_text(cleaned_compare_text)
+            # Clean OLE Object artifacts and normalize (cached for the whole run)
+            normalized_reqif_text = HelperFunctions.normalize_cached(reqif_text, 'ole_text')
+            normalized_compare_text = HelperFunctions.normalize_cached(compare_text, 'ole_text')
 
             if normalized_reqif_text != normalized_compare_text:
                 brs_status_clean = str(brs_status).strip().rstrip(',') if not pd.isna(brs_status) else ""
                 # If text differs, status must be 'neu/geändert'
                 if brs_status_clean != 'neu/geändert':
-                    # Handle nan values in compare_text
-                    compare_text_display = 'Empty' if pd.isna(compare_text) or str(compare_text).strip() == '' else str(compare_text)
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.5',
-                        'Object ID': str(object_id),
-                        'Attribute': 'ReqIF.Text, BRS_Status_Hersteller_Bosch_SDV0.1',
-                        'Issue': (
-                            "'ReqIF.Text' differs from 'Object Text' but "
-                            "'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'neu/geändert'."
+                    findings.append(Finding(
+                        'Nr.5', index + 2, str(object_id),
+                        attribute='ReqIF.Text, BRS_Status_Hersteller_Bosch_SDV0.1',
+                        issue=("'ReqIF.Text' differs from 'Object Text' but "
+                            "'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'neu/geändert'."),
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer File ReqIF.Text: {customer_text}\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch File Object Text: {bosch_text!e}\n"
+                            "---------------\n"
+                            "       BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status!e}\n"
+                            "\n"
+                            "       Expected Status: neu/geändert"
                         ),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer File ReqIF.Text: {reqif_text}\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch File Object Text: {compare_text_display}\n"
-                            f"---------------\n"
-                            f"       BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status if not pd.isna(brs_status) and str(brs_status).strip() != '' else 'Empty'}\n\n"
-                            f"       Expected Status: neu/geändert"
-                        )
-                    })
+                        status=brs_status,
+                        id=object_id,
+                        typ=row.get('Typ', None),
+                        customer_file=os.path.basename(file_path),
+                        customer_text=reqif_text,
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_text=compare_text,
+                        brs_status=brs_status))
 
         logger.info(f"[CHECK NR.5 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.6
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'Object Text', 'RB_AS_Status'],
+        compare_columns=['Object ID', 'Object Text'],
+        compare_optional=['RB_AS_Status', 'Typ'])
     def check_object_text_with_rb_as_status(df: pd.DataFrame,
                                             compare_df: pd.DataFrame,
                                             file_path: str,
-                                            compare_file_path: str) -> list[dict]:
+                                            compare_file_path: str) -> list[Finding]:
         """
         Compares 'Object Text' in the main (Audi ReqIF) file with the compare (Bosch) file based on 'Object ID'.
         If 'Object Text' differs, 'RB_AS_Status' must NOT be one of:
@@ -457,95 +373,80 @@ class ProjectCheckerSDV01:
 
         If the text differs and RB_AS_Status is one of these prohibited values, a finding is reported.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.6 START] Object Text with RB_AS_Status | File: {file_path}")
 
-        required_columns = ['Object ID', 'Object Text', 'RB_AS_Status']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-
-        compare_required_columns = ['Object ID', 'Object Text']
-        missing_compare_columns = [col for col in compare_required_columns if col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.check_object_text_with_rb_as_status.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}\n\n"
-            )
-            return findings
-
-        if missing_compare_columns:
-            check_name = __class__.check_object_text_with_rb_as_status.__name__
-            logger.warning(
-                f"Warning: Missing columns in the compare file: {missing_compare_columns}, "
-                f"in File: {compare_file_path}.\nSkipping check: {check_name}\n\n"
-            )
-            return findings
-
-        # Customer (Audi ReqIF) object texts indexed by Object ID
-        customer_text_by_id = df.set_index('Object ID')['Object Text'].to_dict()
+        # Customer (Audi ReqIF) object texts indexed by canonical Object ID (last row wins)
+        customer_text_by_id = dict(zip(HelperFunctions.id_keys(df, 'Object ID'), df['Object Text']))
+        compare_keys = HelperFunctions.id_keys(compare_df, 'Object ID')
 
         # Iterate through rows in the compare (Bosch) file
-        for index, row in compare_df.iterrows():
+        for (index, row), object_key in zip(compare_df.iterrows(), compare_keys):
             object_id = row['Object ID']
             bosch_text = row['Object Text']
             rb_as_status = row.get('RB_AS_Status', None)
 
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
-            if object_id not in customer_text_by_id:
+            if object_key not in customer_text_by_id:
                 continue
 
-            customer_text = customer_text_by_id[object_id]
-
-            # Clean OLE Object artifacts before strict normalization
-            cleaned_customer_text = HelperFunctions.clean_ole_object_text(customer_text)
-            cleaned_bosch_text = HelperFunctions.clean_ole_object_text(bosch_text)
+            customer_text = customer_text_by_id[object_key]
 
-            # Normalize both texts
-            normalized_customer_text = HelperFunctions.normalize_text(cleaned_customer_text)
-            normalized_bosch_text = HelperFunctions.normalize_text(cleaned_bosch_text)
+            # Clean OLE Object artifacts and normalize (cached for the whole run)
+            normalized_customer_text = HelperFunctions.normalize_cached(customer_text, 'ole_text')
+            normalized_bosch_text = HelperFunctions.normalize_cached(bosch_text, 'ole_text')
 
             if normalized_customer_text != normalized_bosch_text:
                 # Only problematic when RB_AS_Status is in one of these values
                 if rb_as_status in ['accepted', 'no_req', 'canceled_closed']:
-                    # Handle nan values
-                    bosch_text_display = 'Empty' if pd.isna(bosch_text) or str(bosch_text).strip() == '' else str(bosch_text)
-                    customer_text_display = 'Empty' if pd.isna(customer_text) or str(customer_text).strip() == '' else str(customer_text)
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.6',
-                        'Object ID': str(object_id),
-                        'Attribute': 'Object Text, RB_AS_Status',
-                        'Issue': (
-                            "'Object Text' differs but 'RB_AS_Status' is one of the prohibited values "
-                            "('accepted', 'no_req', 'canceled_closed')."
+                    findings.append(Finding(
+                        'Nr.6', index + 2, str(object_id),
+                        attribute='Object Text, RB_AS_Status',
+                        issue=("'Object Text' differs but 'RB_AS_Status' is one of the prohibited values "
+                            "('accepted', 'no_req', 'canceled_closed')."),
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch File Object Text: {bosch_text!e}\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer File Object Text: {customer_text!e}\n"
+                            "---------------\n"
+                            "       RB_AS_Status: {rb_as_status}"
                         ),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch File Object Text: {bosch_text_display}\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer File Object Text: {customer_text_display}\n"
-                            f"---------------\n"
-                            f"       RB_AS_Status: {rb_as_status}"
-                        )
-                    })
+                        status=rb_as_status,
+                        id=object_id,
+                        typ=row.get('Typ', None),
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_text=bosch_text,
+                        customer_file=os.path.basename(file_path),
+                        customer_text=customer_text,
+                        rb_as_status=rb_as_status))
 
         logger.info(f"[CHECK NR.6 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.7
+    # Details of the findings; the Object ID line is left out for files without 'Object ID'
+    _REQUIRED_ATTRIBUTES_DETAILS = (
+        "Typ: {typ!t}\n"
+        "\n"
+        "---------------\n"
+        "Empty Attributes: {empty_attributes}\n"
+        "BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status}"
+    )
+    _REQUIRED_ATTRIBUTES_DETAILS_WITH_ID = "Object ID: {id!e}\n" + _REQUIRED_ATTRIBUTES_DETAILS
+
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['BRS_Status_Hersteller_Bosch_SDV0.1', ('Object ID', 'Object Text', 'Technikvariante', 'Typ')])
     def check_required_attributes_not_empty(df: pd.DataFrame,
-                                            file_path: str) -> list[dict]:
+                                            file_path: str) -> list[Finding]:
         """
         Checks if required attributes are empty where BRS_Status_Hersteller_Bosch_SDV0.1 is not 'verworfen'.
 
@@ -557,7 +458,7 @@ class ProjectCheckerSDV01:
 
         The check executes if at least one required attribute is present.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
 
         all_required_columns = ['Object ID', 'Object Text', 'Technikvariante', 'Typ']
         brs_status_column = 'BRS_Status_Hersteller_Bosch_SDV0.1'
@@ -565,70 +466,50 @@ class ProjectCheckerSDV01:
         # Which required columns actually exist?
         available_columns = [col for col in all_required_columns if col in df.columns]
 
-        # BRS status must exist
-        if brs_status_column not in df.columns:
-            logger.warning(f"Missing BRS status column '{brs_status_column}' in file {file_path}")
-            return findings
-
-        # At least one required attribute must be present
-        if not available_columns:
-            logger.warning(
-                f"None of the required attributes {all_required_columns} found in file {file_path}"
-            )
-            return findings
-
         logger.info(f"[CHECK NR.7 START] Required attributes not empty | File: {file_path}")
 
-        for index, row in df.iterrows():
-            brs_status = row[brs_status_column]
-            if pd.isna(brs_status) or str(brs_status).strip() == "":
-                brs_status_norm = "Empty"
-            else:
-                brs_status_norm = str(brs_status).strip().rstrip(',')
-
-            # Only enforce when status is not 'verworfen'
-            if brs_status_norm != "verworfen":
-                empty_columns = [
-                    col for col in available_columns
-                    if pd.isna(row[col]) or str(row[col]).strip() == ""
-                ]
-
-                if empty_columns:
-                    details = []
-                    object_id = row.get('Object ID', None)
-                    object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-                    if 'Object ID' in df.columns:
-                        details.append(f"Object ID: {object_id_str}")
-                    details.append(f"Typ: {typ_str}")
-                    details.append("")
-                    details.append("---------------")
-                    details.append(f"Empty Attributes: {', '.join(empty_columns)}")
-                    details.append(f"BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status_norm}")
-
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.7',
-                        'Object ID': object_id_str,
-                        'Attribute': ', '.join(empty_columns),
-                        'Issue': (
-                            f"{', '.join(empty_columns)} "
-                            f"{'is' if len(empty_columns) == 1 else 'are'} empty while "
-                            "BRS_Status_Hersteller_Bosch_SDV0.1 is not 'verworfen'."
-                        ),
-                        'Value': "\n".join(details)
-                    })
+        # Only enforce when status is not 'verworfen'
+        brs_statuses_norm = HelperFunctions.normalize_status(HelperFunctions.row_values(df, brs_status_column))
+        empty = pd.DataFrame({col: HelperFunctions.is_blank(HelperFunctions.row_values(df, col))
+                              for col in available_columns}, index=df.index)
+        violations = (brs_statuses_norm != "verworfen") & empty.any(axis=1)
+
+        object_ids = HelperFunctions.row_values(df, 'Object ID') if 'Object ID' in df.columns else None
+        typs = HelperFunctions.row_values(df, 'Typ') if 'Typ' in df.columns else None
+        empty_values = empty.to_numpy()
+        template = (ProjectCheckerSDV01._REQUIRED_ATTRIBUTES_DETAILS_WITH_ID if object_ids is not None
+                    else ProjectCheckerSDV01._REQUIRED_ATTRIBUTES_DETAILS)
+        for position in np.flatnonzero(violations.to_numpy()):
+            index = df.index[position]
+            empty_columns = [col for col, is_empty in zip(available_columns, empty_values[position]) if is_empty]
+
+            object_id = object_ids.iat[position] if object_ids is not None else None
+            findings.append(Finding(
+                'Nr.7', index + 2, HelperFunctions.empty_or_text(object_id, strip_comma=False),
+                attribute=', '.join(empty_columns),
+                issue=(f"{', '.join(empty_columns)} "
+                    f"{'is' if len(empty_columns) == 1 else 'are'} empty while "
+                    "BRS_Status_Hersteller_Bosch_SDV0.1 is not 'verworfen'."),
+                template=template,
+                status=brs_statuses_norm.iat[position],
+                id=object_id,
+                typ=typs.iat[position] if typs is not None else None,
+                empty_attributes=', '.join(empty_columns),
+                brs_status=brs_statuses_norm.iat[position]))
 
         logger.info(f"[CHECK NR.7 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.8
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-ID_Bosch_SDV0.1', 'Typ'],
+        compare_columns=['Object ID'])
     def check_new_requirements_without_cr_id(df: pd.DataFrame,
                                              compare_df: pd.DataFrame,
                                              file_path: str,
-                                             compare_file_path: str) -> list[dict]:
+                                             compare_file_path: str,
+                                             compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Check Nr.8: Checks for new requirements (Object IDs present in Customer but not in Bosch)
         that do not have a CR-ID assigned.
@@ -642,76 +523,63 @@ class ProjectCheckerSDV01:
             compare_df: The reference (Bosch) DataFrame to compare against.
             file_path: Path to the main file (for reporting).
             compare_file_path: Path to the reference file (for reporting).
+            compare_index: Prebuilt lookup of compare_df.
 
         Returns:
-            list of dict: Each dict describes a finding with row number, Object ID, and details.
+            list of Finding: One finding per requirement, with row number, Object ID, and details.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.8 START] New requirements without CR-ID | File: {file_path}")
-        required_columns = ['Object ID', 'CR-ID_Bosch_SDV0.1', 'Typ']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_reference_columns = ['Object ID'] if 'Object ID' not in compare_df.columns else []
-
-        if missing_columns:
-            check_name = __class__.check_new_requirements_without_cr_id.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        if missing_reference_columns:
-            check_name = __class__.check_new_requirements_without_cr_id.__name__
-            logger.warning(
-                f"Warning: Missing columns in the reference file: {missing_reference_columns}, "
-                f"in File: {compare_file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        bosch_object_ids = set(compare_df['Object ID'])
-        for index, row in df.iterrows():
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             cr_id = row['CR-ID_Bosch_SDV0.1']
             typ = row['Typ'] if 'Typ' in row else ''
 
             # Check if Object ID is not in Bosch and CR-ID_Bosch_SDV0.1 is empty
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
-            if object_id not in bosch_object_ids and (pd.isna(cr_id) or str(cr_id).strip() == ''):
-                typ_str = 'Empty' if pd.isna(typ) or str(typ).strip() == '' else str(typ).rstrip(',')
-                findings.append({
-                    'Row': index + 2,
-                    'Check Number': 'Nr.8',
-                    'Object ID': str(object_id),
-                    'Attribute': 'Object ID, CR-ID_Bosch_SDV0.1',
-                    'Issue': (
-                        "New requirement (Object ID) found in Customer document that does not exist "
+            if not compare_index.contains(HelperFunctions.id_key_column('Object ID'), object_key) and (pd.isna(cr_id) or str(cr_id).strip() == ''):
+                findings.append(Finding(
+                    'Nr.8', index + 2, str(object_id),
+                    attribute='Object ID, CR-ID_Bosch_SDV0.1',
+                    issue=("New requirement (Object ID) found in Customer document that does not exist "
                         "in Bosch document, and CR-ID_Bosch_SDV0.1 is missing. "
-                        "Hint: All new requirements should have a CR-ID assigned."
+                        "Hint: All new requirements should have a CR-ID assigned."),
+                    template=(
+                        "Object ID: {id}\n"
+                        "Typ: {typ!t}\n"
+                        "\n"
+                        "---------------\n"
+                        "       Customer File Name: {customer_file}\n"
+                        "       Customer CR-ID_Bosch_SDV0.1: {cr_id!e}\n"
+                        "---------------\n"
+                        "       Bosch File Name: {bosch_file}\n"
+                        "       Bosch Object ID: Not found"
                     ),
-                    'Value': (
-                        f"Object ID: {object_id}\n"
-                        f"Typ: {typ_str}\n"
-                        f"\n"
-                        f"---------------\n"
-                        f"       Customer File Name: {os.path.basename(file_path)}\n"
-                        f"       Customer CR-ID_Bosch_SDV0.1: {'Empty' if pd.isna(cr_id) or str(cr_id).strip() == '' else cr_id}\n"
-                        f"---------------\n"
-                        f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                        f"       Bosch Object ID: Not found"
-                    )
-                })
+                    id=object_id,
+                    typ=typ,
+                    customer_file=os.path.basename(file_path),
+                    cr_id=cr_id,
+                    bosch_file=os.path.basename(compare_file_path)))
 
         logger.info(f"[CHECK NR.8 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.9
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-ID_Bosch_SDV0.1', 'BRS_Status_Hersteller_Bosch_SDV0.1'],
+        compare_columns=['Object ID', 'BRS_Status_Hersteller_Bosch_SDV0.1'],
+        optional=['Typ'])
     def check_new_cr_exists_for_rejected_requirements(df: pd.DataFrame,
                                                       file_path: str,
                                                       compare_df: pd.DataFrame | None = None,
-                                                      compare_file_path: str | None = None) -> list[dict]:
+                                                      compare_file_path: str | None = None,
+                                                      compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Check Nr.9: Verworfen-without-CR-ID validation.
 
@@ -722,50 +590,21 @@ class ProjectCheckerSDV01:
 
         This avoids false positives for requirements already rejected in Bosch or not present there.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.9 START] Verworfen without CR-ID validation | File: {file_path}")
 
         if compare_df is None or compare_file_path is None:
             logger.info("[CHECK NR.9] No reference file provided. Skipping check.")
             return findings
 
-        required_columns = ['Object ID', 'CR-ID_Bosch_SDV0.1', 'BRS_Status_Hersteller_Bosch_SDV0.1']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            check_name = __class__.check_new_cr_exists_for_rejected_requirements.__name__
-            logger.warning(
-                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
-        ref_required_columns = ['Object ID', 'BRS_Status_Hersteller_Bosch_SDV0.1']
-        missing_reference_columns = [col for col in ref_required_columns if col not in compare_df.columns]
-        if missing_reference_columns:
-            check_name = __class__.check_new_cr_exists_for_rejected_requirements.__name__
-            logger.warning(
-                f"Warning: Missing columns in the reference file: {missing_reference_columns}, "
-                f"in File: {compare_file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
-        # Build lookup: Object ID -> normalized Bosch BRS status
-        ref_brs_by_id: dict = {}
-        for _, ref_row in compare_df.iterrows():
-            ref_object_id = ref_row.get('Object ID', None)
-            if pd.isna(ref_object_id) or str(ref_object_id).strip() == '':
-                continue
-            ref_brs_raw = ref_row.get('BRS_Status_Hersteller_Bosch_SDV0.1', None)
-            ref_brs_norm = (
-                "Empty"
-                if pd.isna(ref_brs_raw) or str(ref_brs_raw).strip() == ""
-                else str(ref_brs_raw).strip().rstrip(',')
-            )
-            ref_brs_by_id[ref_object_id] = ref_brs_norm
+        # Lookup: Object ID -> Bosch BRS status (last row of the Object ID)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
-        for index, row in df.iterrows():
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row.get('Object ID', None)
-            if pd.isna(object_id) or str(object_id).strip() == '':
+            if object_key is None:
                 continue
 
             brs_status_raw = row['BRS_Status_Hersteller_Bosch_SDV0.1']
@@ -786,47 +625,56 @@ class ProjectCheckerSDV01:
                 continue
 
             # Condition 3: Object ID must exist in Bosch and Bosch must NOT be 'verworfen'
-            if object_id not in ref_brs_by_id:
+            if not compare_index.contains(HelperFunctions.id_key_column('Object ID'), object_key):
                 continue
-            if ref_brs_by_id[object_id] == "verworfen":
+            ref_brs_raw = compare_index.value(HelperFunctions.id_key_column('Object ID'), object_key, 'BRS_Status_Hersteller_Bosch_SDV0.1')
+            ref_brs_norm = (
+                "Empty"
+                if pd.isna(ref_brs_raw) or str(ref_brs_raw).strip() == ""
+                else str(ref_brs_raw).strip().rstrip(',')
+            )
+            if ref_brs_norm == "verworfen":
                 continue
 
-            object_id_str = str(object_id)
-            typ_value = row.get('Typ', None)
-            typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-
-            findings.append({
-                'Row': index + 2,
-                'Check Number': 'Nr.9',
-                'Object ID': object_id_str,
-                'Attribute': 'CR-ID_Bosch_SDV0.1, BRS_Status_Hersteller_Bosch_SDV0.1',
-                'Issue': (
-                    "BRS_Status_Hersteller_Bosch_SDV0.1 is 'verworfen' but CR-ID_Bosch_SDV0.1 is empty. "
-                    "A rejected requirement must have a CR-ID assigned."
+            findings.append(Finding(
+                'Nr.9', index + 2, str(object_id),
+                attribute='CR-ID_Bosch_SDV0.1, BRS_Status_Hersteller_Bosch_SDV0.1',
+                issue=("BRS_Status_Hersteller_Bosch_SDV0.1 is 'verworfen' but CR-ID_Bosch_SDV0.1 is empty. "
+                    "A rejected requirement must have a CR-ID assigned."),
+                template=(
+                    "Object ID: {id}\n"
+                    "Typ: {typ!t}\n"
+                    "\n"
+                    "---------------\n"
+                    "       Customer File Name: {customer_file}\n"
+                    "       Customer BRS_Status_Hersteller_Bosch_SDV0.1: {customer_brs_status}\n"
+                    "       Customer CR-ID_Bosch_SDV0.1: Empty\n"
+                    "---------------\n"
+                    "       Bosch File Name: {bosch_file}\n"
+                    "       Bosch BRS_Status_Hersteller_Bosch_SDV0.1: {bosch_brs_status}"
                 ),
-                'Value': (
-                    f"Object ID: {object_id_str}\n"
-                    f"Typ: {typ_str}\n"
-                    f"\n"
-                    f"---------------\n"
-                    f"       Customer File Name: {os.path.basename(file_path)}\n"
-                    f"       Customer BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status_norm}\n"
-                    f"       Customer CR-ID_Bosch_SDV0.1: Empty\n"
-                    f"---------------\n"
-                    f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                    f"       Bosch BRS_Status_Hersteller_Bosch_SDV0.1: {ref_brs_by_id[object_id]}"
-                )
-            })
+                status=brs_status_norm,
+                id=object_id,
+                typ=row.get('Typ', None),
+                customer_file=os.path.basename(file_path),
+                customer_brs_status=brs_status_norm,
+                bosch_file=os.path.basename(compare_file_path),
+                bosch_brs_status=ref_brs_norm))
 
         logger.info(f"[CHECK NR.9 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.10
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['Object ID', 'CR-Status_Bosch_SDV0.1', 'CR-ID_Bosch_SDV0.1'],
+        compare_columns=['Object ID', 'CR-Status_Bosch_SDV0.1', 'CR-ID_Bosch_SDV0.1'],
+        optional=['Typ'])
     def check_cr_status_overwrite_protection(df: pd.DataFrame,
                                              compare_df: pd.DataFrame,
                                              file_path: str,
-                                             compare_file_path: str) -> list[dict]:
+                                             compare_file_path: str,
+                                             compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Check Nr.10: Prevents overwriting Bosch CR-Status when it is 100 or 31.
 
@@ -840,54 +688,40 @@ class ProjectCheckerSDV01:
         Wenn der CR-ID vorhanden ist, und bei Bosch CR-Status 31 oder 100 ist,
         dann darf der CR-Status nicht mit neuem CR-Status überschrieben werden.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         logger.info(f"[CHECK NR.10 START] CR-Status overwrite protection | File: {file_path}")
-        required_columns = ['Object ID', 'CR-Status_Bosch_SDV0.1', 'CR-ID_Bosch_SDV0.1']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_reference_columns = ['Object ID', 'CR-Status_Bosch_SDV0.1', 'CR-ID_Bosch_SDV0.1']
-        missing_reference_columns = [col for col in missing_reference_columns if col not in compare_df.columns]
-
-        if missing_columns:
-            check_name = __class__.check_cr_status_overwrite_protection.__name__
-            logger.warning(
-                f"Warning: Missing columns in the customer DataFrame: {missing_columns}, "
-                f"in File: {file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        if missing_reference_columns:
-            check_name = __class__.check_cr_status_overwrite_protection.__name__
-            logger.warning(
-                f"Warning: Missing columns in the reference file: {missing_reference_columns}, "
-                f"in File: {compare_file_path}. Skipping check: {check_name}\n\n"
-            )
-            return findings
-
-        for index, row in df.iterrows():
+        # Join on 'Object ID' through the compare index instead of filtering compare_df per row
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
+        ref_cr_statuses = compare_index.column('CR-Status_Bosch_SDV0.1')
+        ref_cr_ids = compare_index.column('CR-ID_Bosch_SDV0.1')
+
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row['Object ID']
             cr_id = row['CR-ID_Bosch_SDV0.1']
             customer_cr_status = row['CR-Status_Bosch_SDV0.1']
 
             # Skip if Object ID is empty
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Only check if CR-ID is present (as per explanation)
             if pd.isna(cr_id) or str(cr_id).strip() == "":
                 continue
-            norm_customer_cr_id = HelperFunctions.normalize_text(cr_id)
+            norm_customer_cr_id = HelperFunctions.normalize_cached(cr_id)
 
-            # Find all rows in compare_df with the same Object ID
-            ref_matches = compare_df[compare_df['Object ID'] == object_id]
-            if ref_matches.empty:
+            # Find all rows in compare_df with the same Object ID (in file order)
+            ref_positions = compare_index.rows(HelperFunctions.id_key_column('Object ID'), object_key)
+            if not ref_positions:
                 continue  # No reference to compare
 
-            for _, ref_row in ref_matches.iterrows():
-                bosch_cr_status = ref_row['CR-Status_Bosch_SDV0.1']
-                ref_cr_id = ref_row.get('CR-ID_Bosch_SDV0.1', None)
+            for position in ref_positions:
+                bosch_cr_status = ref_cr_statuses[position]
+                ref_cr_id = ref_cr_ids[position]
                 if pd.isna(ref_cr_id) or str(ref_cr_id).strip() == "":
                     continue
-                norm_ref_cr_id = HelperFunctions.normalize_text(ref_cr_id)
+                norm_ref_cr_id = HelperFunctions.normalize_cached(ref_cr_id)
 
                 # Only apply this protection when CR-ID matches between customer and Bosch
                 if norm_customer_cr_id != norm_ref_cr_id:
@@ -911,56 +745,56 @@ class ProjectCheckerSDV01:
 
                 # If customer status differs from Bosch status, report finding
                 if customer_cr_status_norm != bosch_cr_status_norm:
-                    customer_cr_status_str = 'Empty' if pd.isna(customer_cr_status) or str(customer_cr_status).strip() == '' else customer_cr_status
-                    bosch_cr_status_str = 'Empty' if pd.isna(bosch_cr_status) or str(bosch_cr_status).strip() == '' else bosch_cr_status
-                    customer_cr_id_str = 'Empty' if pd.isna(cr_id) or str(cr_id).strip() == '' else cr_id
-                    bosch_cr_id_str = 'Empty' if pd.isna(ref_cr_id) or str(ref_cr_id).strip() == '' else ref_cr_id
-                    typ_value = row.get('Typ', None)
-                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
-
-                    findings.append({
-                        'Row': index + 2,
-                        'Check Number': 'Nr.10',
-                        'Object ID': str(object_id),
-                        'Attribute': 'CR-Status_Bosch_SDV0.1, CR-ID_Bosch_SDV0.1',
-                        'Issue': (
-                            "'CR-Status_Bosch_SDV0.1' differs from Bosch file. "
+                    findings.append(Finding(
+                        'Nr.10', index + 2, str(object_id),
+                        attribute='CR-Status_Bosch_SDV0.1, CR-ID_Bosch_SDV0.1',
+                        issue=("'CR-Status_Bosch_SDV0.1' differs from Bosch file. "
                             "Bosch CR-Status is '100' or '31' and should not be overwritten "
-                            "(CR-ID matches between customer and Bosch)."
+                            "(CR-ID matches between customer and Bosch)."),
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer CR-ID_Bosch_SDV0.1: {customer_cr_id!e}\n"
+                            "       Customer CR-Status_Bosch_SDV0.1: {customer_cr_status!e}\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch CR-ID_Bosch_SDV0.1: {bosch_cr_id!e}\n"
+                            "       Bosch CR-Status_Bosch_SDV0.1: {bosch_cr_status!e}\n"
+                            "---------------\n"
+                            "       Note: Bosch CR-Status '100' or '31' must not be overwritten."
                         ),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {typ_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer CR-ID_Bosch_SDV0.1: {customer_cr_id_str}\n"
-                            f"       Customer CR-Status_Bosch_SDV0.1: {customer_cr_status_str}\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch CR-ID_Bosch_SDV0.1: {bosch_cr_id_str}\n"
-                            f"       Bosch CR-Status_Bosch_SDV0.1: {bosch_cr_status_str}\n"
-                            f"---------------\n"
-                            f"       Note: Bosch CR-Status '100' or '31' must not be overwritten."
-                        )
-                    })
+                        status=customer_cr_status,
+                        id=object_id,
+                        typ=row.get('Typ', None),
+                        customer_file=os.path.basename(file_path),
+                        customer_cr_id=cr_id,
+                        customer_cr_status=customer_cr_status,
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_cr_id=ref_cr_id,
+                        bosch_cr_status=bosch_cr_status))
 
         logger.info(f"[CHECK NR.10 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.11
     @staticmethod
+    @HelperFunctions.uses_columns(
+        compare_columns=['Customer Id', 'Customer Status'],
+        optional=['externe CR-ID', 'ReqIF.ForeignID'])
     def check_cr_number_status(df: pd.DataFrame, compare_df: pd.DataFrame,
                                file_path: str, compare_file_path: str,
                                cr_number: str, report_folder: str,
-                               doors_version: str = "Classic") -> list[dict]:
+                               doors_version: str = "Classic") -> list[Finding]:
         """
         Check Nr.11: Given a CR number (e.g. 'BRSSDV01-312'), looks it up in the compare file's
         'Customer Id' column to retrieve the 'Customer Status'. Then finds all rows in the
         customer file where 'externe CR-ID' matches the CR number and generates a TSV file
         with columns 'ForeignID' and 'CR-Status_Bosch_SDV0.1' filled with that customer status.
         """
-        findings: list[dict] = []
+        findings: list[Finding] = []
         cr_status_col = 'CR-Status_Bosch_SDV0.1'
         logger.info(f"[CHECK NR.11 START] CR Number Status extraction | CR: {cr_number} | File: {file_path} | Doors: {doors_version}")
 
@@ -969,35 +803,27 @@ class ProjectCheckerSDV01:
             logger.info("[CHECK NR.11] Doors NG path — not yet implemented, skipping.")
             return findings
 
-        # --- Validate required columns in compare file ---
-        compare_required = ['Customer Id', 'Customer Status']
-        missing_compare = [c for c in compare_required if c not in compare_df.columns]
-        if missing_compare:
-            logger.warning(f"[CHECK NR.11] Missing columns in compare file: {missing_compare}. Skipping.")
-            return findings
-
         # --- Look up CR number in compare file ---
         cr_rows = compare_df[compare_df['Customer Id'].astype(str).str.strip() == cr_number.strip()]
         if cr_rows.empty:
             logger.warning(f"[CHECK NR.11] CR number '{cr_number}' not found in compare file column 'Customer Id'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.11',
-                'Object ID': 'N/A',
-                'Attribute': 'Customer Id',
-                'Issue': f"CR number '{cr_number}' was not found in the compare file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Compare File: {os.path.basename(compare_file_path)}\n"
-                    f"Column searched: 'Customer Id'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.11', 'N/A', 'N/A',
+                attribute='Customer Id',
+                issue=f"CR number '{cr_number}' was not found in the compare file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Compare File: {bosch_file}\n"
+                    "Column searched: 'Customer Id'"
+                ),
+                cr_number=cr_number,
+                bosch_file=os.path.basename(compare_file_path)))
             return findings
 
         customer_status = str(cr_rows.iloc[0]['Customer Status']).strip()
         logger.debug(f"[CHECK NR.11] Found Customer Status: '{customer_status}' for CR: {cr_number}")
 
-        # --- Validate required columns in customer file ---
+        # --- Validate columns in customer file (after the lookup, which reports an unknown CR number) ---
         customer_required = ['externe CR-ID', 'ReqIF.ForeignID']
         missing_customer = [c for c in customer_required if c not in df.columns]
         if missing_customer:
@@ -1008,18 +834,17 @@ class ProjectCheckerSDV01:
         matching = df[df['externe CR-ID'].astype(str).str.strip() == cr_number.strip()]
         if matching.empty:
             logger.info(f"[CHECK NR.11] No rows found in customer file with 'externe CR-ID' = '{cr_number}'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.11',
-                'Object ID': 'N/A',
-                'Attribute': 'externe CR-ID',
-                'Issue': f"CR number '{cr_number}' was not found in the customer file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Customer File: {os.path.basename(file_path)}\n"
-                    f"Column searched: 'externe CR-ID'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.11', 'N/A', 'N/A',
+                attribute='externe CR-ID',
+                issue=f"CR number '{cr_number}' was not found in the customer file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Customer File: {customer_file}\n"
+                    "Column searched: 'externe CR-ID'"
+                ),
+                cr_number=cr_number,
+                customer_file=os.path.basename(file_path)))
             return findings
 
         # --- Build and write TSV file ---
@@ -1037,22 +862,35 @@ class ProjectCheckerSDV01:
         tsv_df.to_csv(tsv_path, sep='\t', index=False)
         logger.info(f"[CHECK NR.11 END] TSV written: {tsv_path} ({len(tsv_rows)} rows)")
 
-        findings.append({
-            'Row': 'N/A',
-            'Check Number': 'Nr.11',
-            'Object ID': 'N/A',
-            'Attribute': 'CR-Status',
-            'Issue': f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
-            'Value': (
-                f"CR Number: {cr_number}\n"
-                f"Customer Status: {customer_status}\n"
-                f"TSV File: {tsv_filename}"
+        findings.append(Finding(
+            'Nr.11', 'N/A', 'N/A',
+            attribute='CR-Status',
+            issue=f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
+            severity=Finding.INFO,
+            status=customer_status,
+            template=(
+                "CR Number: {cr_number}\n"
+                "Customer Status: {customer_status}\n"
+                "TSV File: {tsv_filename}"
             ),
-            'Type': 'info'
-        })
+            cr_number=cr_number,
+            customer_status=customer_status,
+            tsv_filename=tsv_filename))
 
         return findings
 
+    @staticmethod
+    def test_vectorised_checks(rows=20_000, seed=0):
+        """
+        Regression test of the vectorised checks Nr.1, Nr.2, Nr.3 and Nr.7 against
+        their row-wise reference implementations (ChecksSDV01Reference).
+
+        Returns:
+            bool: True when all findings are identical
+        """
+        from ChecksSDV01Reference import ProjectCheckerSDV01Reference  # Test-only module
+        return ProjectCheckerSDV01Reference.test_vectorised_checks(rows, seed)
+
     @staticmethod
     def import_checks(df: pd.DataFrame,
                       file_path: str,
@@ -1060,67 +898,18 @@ class ProjectCheckerSDV01:
                       compare_file_path: str | None = None,
                       cr_numbers: list[str] | None = None,
                       report_folder: str | None = None,
-                      doors_version: str = "Classic") -> list[dict]:
+                      doors_version: str = "Classic",
+                      compare_index: CompareIndex | None = None) -> list[Finding]:
         """
         Entry point for SDV01 import checks.
-        Executes all SDV01 import checks and aggregates their findings.
+        Executes all SDV01 import checks registered in CheckRegistry and aggregates their findings.
         """
-        logger.info(f"Running SDV01 import checks for file: {os.path.basename(file_path)}")
-        findings: list[dict] = []
-
-        # Check Nr.1
-        findings += ProjectCheckerSDV01.check_empty_object_id_with_forbidden_cr_status(df, file_path)
-
-        # Check Nr.2
-        findings += ProjectCheckerSDV01.check_cr_status_bosch_sdv01_conditions(df, file_path)
+        from CheckRegistry import CheckRegistry  # The registry imports this class
 
-        # Check Nr.3
-        findings += ProjectCheckerSDV01.check_missing_release_for_verworfen_status(df, file_path)
-
-        # Check Nr.4 – requires reference file
-        if compare_df is not None and compare_file_path is not None:
-            findings += ProjectCheckerSDV01.compare_cr_id_and_brs_status_by_object_id(
-                df, compare_df, file_path, compare_file_path
-            )
-
-            # Check Nr.5 – requires reference file
-            findings += ProjectCheckerSDV01.check_reqif_text_with_status_hersteller_bosch_sdv01(
-                df, compare_df, file_path, compare_file_path
-            )
-
-            # Check Nr.6 – requires reference file
-            findings += ProjectCheckerSDV01.check_object_text_with_rb_as_status(
-                df, compare_df, file_path, compare_file_path
-            )
-
-            # Check Nr.10 – requires reference file
-            findings += ProjectCheckerSDV01.check_cr_status_overwrite_protection(
-                df, compare_df, file_path, compare_file_path
-            )
-
-        # Check Nr.7 – does not require reference file
-        findings += ProjectCheckerSDV01.check_required_attributes_not_empty(df, file_path)
-
-        # Check Nr.8 – requires reference file
-        if compare_df is not None and compare_file_path is not None:
-            findings += ProjectCheckerSDV01.check_new_requirements_without_cr_id(
-                df, compare_df, file_path, compare_file_path
-            )
-
-        # Check Nr.9 – compare Bosch file if available
-        findings += ProjectCheckerSDV01.check_new_cr_exists_for_rejected_requirements(
-            df, file_path, compare_df, compare_file_path
-        )
-
-        # Check Nr.11 – requires compare file, cr_numbers, and report_folder
-        if compare_df is not None and compare_file_path is not None and cr_numbers and report_folder:
-            for cr in cr_numbers:
-                findings += ProjectCheckerSDV01.check_cr_number_status(
-                    df, compare_df, file_path, compare_file_path, cr, report_folder,
-                    doors_version
-                )
-
-        return findings
+        intermediates = {'compare_index': compare_index} if compare_index is not None else None
+        plan = CheckRegistry.plan(CheckRegistry.SDV01, CheckRegistry.IMPORT, compare_df, compare_file_path,
+                                  cr_numbers if report_folder else None, doors_version, intermediates)
+        return plan.run(df, file_path, report_folder)
 
     # Export Checks
 
@@ -1128,13 +917,13 @@ class ProjectCheckerSDV01:
     def export_checks(df: pd.DataFrame,
                       file_path: str,
                       compare_df: pd.DataFrame | None = None,
-                      compare_file_path: str | None = None) -> list[dict]:
+                      compare_file_path: str | None = None) -> list[Finding]:
         """
         Entry point for SDV01 export checks.
         Currently returns an empty list; real checks will be added later.
         """
         logger.info(f"Running SDV01 export checks for file: {os.path.basename(file_path)}")
-        findings: list[dict] = []
+        findings: list[Finding] = []
         # TODO: implement SDV01 export checks
         return findings
 
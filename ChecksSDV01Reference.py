@@ -0,0 +1,370 @@
+import random
+import time
+import pandas as pd
+from ChecksSDV01 import ProjectCheckerSDV01
+from CheckRegistry import CheckDefinition
+from Finding import Finding
+from logger_config import logger
+
+
+class ProjectCheckerSDV01Reference:
+    """
+    Row-wise reference implementations of the vectorised SDV01 checks, only used
+    by the tests.
+
+    Every method is the former implementation of the check of the same name in
+    ProjectCheckerSDV01, one df.iterrows() pass. test_vectorised_checks runs both
+    on generated tables and requires identical findings.
+    """
+
+    # Check Nr.1 (row-wise reference)
+    @staticmethod
+    def check_empty_object_id_with_forbidden_cr_status(df: pd.DataFrame, file_path: str) -> list[dict]:
+        """
+        Row-wise reference of check_empty_object_id_with_forbidden_cr_status, one df.iterrows() pass.
+        """
+        findings: list[dict] = []
+        # Check for required columns
+        required_columns = ['Object ID', 'CR-Status_Bosch_SDV0.1']
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            logger.warning(f"Missing columns in file {file_path}: {missing_columns}")
+            return findings
+
+        logger.info(f"[CHECK NR.1 START] Empty Object ID with forbidden CR-Status | File: {file_path}")
+        # Values are stored with a trailing comma in other projects, mirror that here.
+        forbidden_status = ['014,', '031,', '100,']
+        for index, row in df.iterrows():
+            if pd.isna(row['Object ID']) and row['CR-Status_Bosch_SDV0.1'] in forbidden_status:
+                logger.debug(
+                    f"Found issue at row {index + 2}: Empty Object ID with forbidden status "
+                    f"{row['CR-Status_Bosch_SDV0.1']}"
+                )
+                object_id = "Empty"
+                typ_value = row.get('Typ', None)
+                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
+                findings.append(Finding(
+                    'Nr.1', index + 2, object_id,
+                    attribute='Object ID, CR-Status_Bosch_SDV0.1',
+                    issue=("Empty 'Object ID' with forbidden 'CR-Status_Bosch_SDV0.1' value "
+                        "(014, 031 or 100 are not allowed with empty Object ID)."),
+                    template=(
+                        "Object ID: {id}\n"
+                        "Typ: {typ}\n"
+                        "\n"
+                        "---------------\n"
+                        "CR-Status_Bosch_SDV0.1: {cr_status}"
+                    ),
+                    id=object_id,
+                    typ=typ_str,
+                    cr_status=row['CR-Status_Bosch_SDV0.1']))
+        logger.info(f"[CHECK NR.1 END] Found {len(findings)} findings.")
+        return findings
+
+    # Check Nr.2 (row-wise reference)
+    @staticmethod
+    def check_cr_status_bosch_sdv01_conditions(df: pd.DataFrame, file_path: str) -> list[dict]:
+        """
+        Row-wise reference of check_cr_status_bosch_sdv01_conditions, one df.iterrows() pass.
+        """
+        findings: list[dict] = []
+        logger.info(f"[CHECK NR.2 START] CR-Status empty/'---' with non-empty CR-ID | File: {file_path}")
+
+        required_columns = [
+            'CR-Status_Bosch_SDV0.1',
+            'CR-ID_Bosch_SDV0.1',
+            'BRS_Status_Hersteller_Bosch_SDV0.1',
+        ]
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            check_name = __class__.check_cr_status_bosch_sdv01_conditions.__name__
+            logger.warning(
+                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
+                f"in File: {file_path}.\nSkipping check: {check_name}"
+            )
+            return findings
+
+        for index, row in df.iterrows():
+            cr_status_raw = row['CR-Status_Bosch_SDV0.1']
+            cr_id_raw = row['CR-ID_Bosch_SDV0.1']
+            brs_status_raw = row['BRS_Status_Hersteller_Bosch_SDV0.1']
+
+            # Normalize BRS status for comparison (strip trailing comma)
+            if pd.isna(brs_status_raw) or str(brs_status_raw).strip() == "":
+                brs_status_norm = "Empty"
+            else:
+                brs_status_norm = str(brs_status_raw).strip().rstrip(',')
+
+            # Determine if CR-ID is present
+            cr_id_present = not (pd.isna(cr_id_raw) or str(cr_id_raw).strip() == "")
+
+            # CR status is invalid if empty OR exactly '---' (allow comma variants via rstrip)
+            if pd.isna(cr_status_raw) or str(cr_status_raw).strip() == "":
+                cr_status_invalid = True
+                cr_status_display = "Empty"
+            else:
+                cr_status_clean = str(cr_status_raw).strip().rstrip(',')
+                cr_status_invalid = cr_status_clean == "---"
+                cr_status_display = cr_status_raw
+
+            if cr_status_invalid and cr_id_present and brs_status_norm != "verworfen":
+                object_id = row.get('Object ID', 'N/A')
+                object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
+                typ_value = row.get('Typ', None)
+                typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
+                findings.append(Finding(
+                    'Nr.2', index + 2, object_id_str,
+                    attribute=('CR-Status_Bosch_SDV0.1, CR-ID_Bosch_SDV0.1, '
+                        'BRS_Status_Hersteller_Bosch_SDV0.1'),
+                    issue=("'CR-Status_Bosch_SDV0.1' is empty/'---' whereas 'CR-ID_Bosch_SDV0.1' "
+                        "is not empty and 'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."),
+                    template=(
+                        "Object ID: {id}\n"
+                        "Typ: {typ}\n"
+                        "\n"
+                        "---------------\n"
+                        "CR-Status_Bosch_SDV0.1: {cr_status}\n"
+                        "CR-ID_Bosch_SDV0.1: {cr_id}\n"
+                        "BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status}"
+                    ),
+                    id=object_id_str,
+                    typ=typ_str,
+                    cr_status=cr_status_display,
+                    cr_id=cr_id_raw,
+                    brs_status=brs_status_norm))
+
+        logger.info(f"[CHECK NR.2 END] Found {len(findings)} findings.")
+        return findings
+
+    # Check Nr.3 (row-wise reference)
+    @staticmethod
+    def check_missing_release_for_verworfen_status(df: pd.DataFrame, file_path: str) -> list[dict]:
+        """
+        Row-wise reference of check_missing_release_for_verworfen_status, one df.iterrows() pass.
+        """
+        findings: list[dict] = []
+        logger.info(f"[CHECK NR.3 START] Missing release for non-verworfen status | File: {file_path}")
+
+        required_columns = [
+            'Object ID',
+            'BRS_Status_Hersteller_Bosch_SDV0.1',
+            'EntfallRelease',
+            'ErsteinsatzRelease',
+            'Typ',
+        ]
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            check_name = __class__.check_missing_release_for_verworfen_status.__name__
+            logger.warning(
+                f"Warning: Missing columns in the DataFrame: {missing_columns}, "
+                f"in File: {file_path}.\nSkipping check: {check_name}"
+            )
+            return findings
+
+        for index, row in df.iterrows():
+            object_id = row['Object ID']
+            brs_status_raw = row['BRS_Status_Hersteller_Bosch_SDV0.1']
+            object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
+
+            # Only check requirements (Typ == 'Anforderung', comma-insensitive)
+            typ_value_raw = row.get('Typ', None)
+            typ_value_norm = "" if pd.isna(typ_value_raw) else str(typ_value_raw).strip().rstrip(',')
+            if typ_value_norm != 'Anforderung':
+                continue
+
+            # Normalize BRS status
+            if pd.isna(brs_status_raw) or str(brs_status_raw).strip() == "":
+                brs_status_norm = "Empty"
+            else:
+                brs_status_norm = str(brs_status_raw).strip().rstrip(',')
+
+            # Only apply when status is NOT 'verworfen'
+            if brs_status_norm == "verworfen":
+                continue
+
+            entfall = row['EntfallRelease']
+            ersteinsatz = row['ErsteinsatzRelease']
+
+            missing_attrs = []
+            if pd.isna(entfall) or str(entfall).strip() == "":
+                missing_attrs.append('EntfallRelease')
+            if pd.isna(ersteinsatz) or str(ersteinsatz).strip() == "":
+                missing_attrs.append('ErsteinsatzRelease')
+
+            if not missing_attrs:
+                continue
+
+            typ_str = typ_value_norm
+            findings.append(Finding(
+                'Nr.3', index + 2, object_id_str,
+                attribute=', '.join(missing_attrs),
+                issue=(f"{', '.join(missing_attrs)} is empty while "
+                    "'BRS_Status_Hersteller_Bosch_SDV0.1' is not 'verworfen'."),
+                template=(
+                    "Object ID: {id}\n"
+                    "Typ: {typ}\n"
+                    "\n"
+                    "---------------\n"
+                    "BRS_Status_Hersteller_Bosch_SDV0.1: {brs_status}\n"
+                    "EntfallRelease: {entfall}\n"
+                    "ErsteinsatzRelease: {ersteinsatz}"
+                ),
+                id=object_id_str,
+                typ=typ_str,
+                brs_status=brs_status_norm,
+                entfall=entfall if not pd.isna(entfall) else 'Empty',
+                ersteinsatz=ersteinsatz if not pd.isna(ersteinsatz) else 'Empty'))
+
+        logger.info(f"[CHECK NR.3 END] Found {len(findings)} findings.")
+        return findings
+
+    # Check Nr.7 (row-wise reference)
+    @staticmethod
+    def check_required_attributes_not_empty(df: pd.DataFrame,
+                                            file_path: str) -> list[dict]:
+        """
+        Row-wise reference of check_required_attributes_not_empty, one df.iterrows() pass.
+        """
+        findings: list[dict] = []
+
+        all_required_columns = ['Object ID', 'Object Text', 'Technikvariante', 'Typ']
+        brs_status_column = 'BRS_Status_Hersteller_Bosch_SDV0.1'
+
+        # Which required columns actually exist?
+        available_columns = [col for col in all_required_columns if col in df.columns]
+
+        # BRS status must exist
+        if brs_status_column not in df.columns:
+            logger.warning(f"Missing BRS status column '{brs_status_column}' in file {file_path}")
+            return findings
+
+        # At least one required attribute must be present
+        if not available_columns:
+            logger.warning(
+                f"None of the required attributes {all_required_columns} found in file {file_path}"
+            )
+            return findings
+
+        logger.info(f"[CHECK NR.7 START] Required attributes not empty | File: {file_path}")
+
+        for index, row in df.iterrows():
+            brs_status = row[brs_status_column]
+            if pd.isna(brs_status) or str(brs_status).strip() == "":
+                brs_status_norm = "Empty"
+            else:
+                brs_status_norm = str(brs_status).strip().rstrip(',')
+
+            # Only enforce when status is not 'verworfen'
+            if brs_status_norm != "verworfen":
+                empty_columns = [
+                    col for col in available_columns
+                    if pd.isna(row[col]) or str(row[col]).strip() == ""
+                ]
+
+                if empty_columns:
+                    object_id = row.get('Object ID', None)
+                    object_id_str = 'Empty' if pd.isna(object_id) or str(object_id).strip() == '' else str(object_id)
+                    typ_value = row.get('Typ', None)
+                    typ_str = 'Empty' if pd.isna(typ_value) or str(typ_value).strip() == '' else str(typ_value).rstrip(',')
+                    findings.append(Finding(
+                        'Nr.7', index + 2, object_id_str,
+                        attribute=', '.join(empty_columns),
+                        issue=(f"{', '.join(empty_columns)} "
+                            f"{'is' if len(empty_columns) == 1 else 'are'} empty while "
+                            "BRS_Status_Hersteller_Bosch_SDV0.1 is not 'verworfen'."),
+                        template=(ProjectCheckerSDV01._REQUIRED_ATTRIBUTES_DETAILS_WITH_ID if 'Object ID' in df.columns
+                                  else ProjectCheckerSDV01._REQUIRED_ATTRIBUTES_DETAILS),
+                        id=object_id_str,
+                        typ=typ_str,
+                        empty_attributes=', '.join(empty_columns),
+                        brs_status=brs_status_norm))
+
+        logger.info(f"[CHECK NR.7 END] Found {len(findings)} findings.")
+        return findings
+
+    @staticmethod
+    def sample_check_frames(rows, seed):
+        """
+        Generated SDV01 tables for test_vectorised_checks: a text table with
+        missing, blank and comma variants of every status, a purely numeric table
+        (iterrows() upcasts its rows) and tables without the optional columns.
+        """
+        rng = random.Random(seed)
+        choices = {
+            'Object ID': [1, 2, 3.0, None, '', ' ', 'SDV-7'],
+            'CR-Status_Bosch_SDV0.1': ['014,', '031,', '100,', '---', '---,', ' --- ', '015,', 14, None, '', ' '],
+            'CR-ID_Bosch_SDV0.1': ['CR-1', 'CR-2,', 5, None, '', ' '],
+            'BRS_Status_Hersteller_Bosch_SDV0.1': ['verworfen', 'verworfen,', ' verworfen ', 'abgestimmt,',
+                                                   None, '', ' ', 'Empty'],
+            'Typ': ['Anforderung', 'Anforderung,', ' Anforderung ', 'Information,', None, '', ' '],
+            'EntfallRelease': ['R1', 1.5, None, '', ' '],
+            'ErsteinsatzRelease': ['R2', 2, None, '', ' '],
+            'Object Text': ['Text', None, '', ' '],
+            'Technikvariante': ['TV,', None, '', ' '],
+        }
+        text = pd.DataFrame({col: [rng.choice(values) for _ in range(rows)]
+                             for col, values in choices.items()})
+        text.index = text.index * 3 + 1  # Row numbers must come from the index
+
+        numeric = pd.DataFrame({
+            'Object ID': [rng.choice([1.0, float('nan')]) for _ in range(rows)],
+            'CR-Status_Bosch_SDV0.1': [rng.choice([14.0, float('nan')]) for _ in range(rows)],
+            'CR-ID_Bosch_SDV0.1': [rng.choice([7, 8]) for _ in range(rows)],
+            'BRS_Status_Hersteller_Bosch_SDV0.1': [rng.choice([0.5, float('nan')]) for _ in range(rows)],
+            'Typ': [rng.choice([1, 2]) for _ in range(rows)],
+            'EntfallRelease': [rng.choice([3, 4]) for _ in range(rows)],
+            'ErsteinsatzRelease': [rng.choice([1.5, float('nan')]) for _ in range(rows)],
+        })
+        return {
+            'text': text,
+            'numeric': numeric,
+            'without Typ': text.drop(columns=['Typ']),
+            'without Object ID': text.drop(columns=['Object ID']),
+        }
+
+    @staticmethod
+    def test_vectorised_checks(rows=20_000, seed=0):
+        """
+        Regression test: the vectorised checks Nr.1, Nr.2, Nr.3 and Nr.7 must return
+        exactly the findings of their row-wise reference implementations.
+
+        Args:
+            rows (int, optional): Rows of every generated table
+            seed (int, optional): Seed of the generated tables
+
+        Returns:
+            bool: True when all findings are identical
+        """
+        pairs = [
+            ('Nr.1', ProjectCheckerSDV01.check_empty_object_id_with_forbidden_cr_status,
+             ProjectCheckerSDV01Reference.check_empty_object_id_with_forbidden_cr_status),
+            ('Nr.2', ProjectCheckerSDV01.check_cr_status_bosch_sdv01_conditions,
+             ProjectCheckerSDV01Reference.check_cr_status_bosch_sdv01_conditions),
+            ('Nr.3', ProjectCheckerSDV01.check_missing_release_for_verworfen_status,
+             ProjectCheckerSDV01Reference.check_missing_release_for_verworfen_status),
+            ('Nr.7', ProjectCheckerSDV01.check_required_attributes_not_empty,
+             ProjectCheckerSDV01Reference.check_required_attributes_not_empty),
+        ]
+        print("\nTesting the vectorised SDV01 checks against the row-wise ones:")
+        print("-" * 50)
+        passed = True
+        for name, df in ProjectCheckerSDV01Reference.sample_check_frames(rows, seed).items():
+            for check_number, vectorised, rowwise in pairs:
+                start = time.perf_counter()
+                expected = rowwise(df, 'test.xlsx')
+                rowwise_time = time.perf_counter() - start
+
+                # Like CheckPlan.run, the vectorised check is not called without its required columns
+                start = time.perf_counter()
+                missing = CheckDefinition.missing_columns(vectorised.requires, df.columns)
+                actual = [] if missing else vectorised(df, 'test.xlsx')
+                vectorised_time = time.perf_counter() - start
+
+                same = expected == actual
+                passed = passed and same
+                print(f"{check_number} on {name} table: {len(expected)} findings, "
+                      f"row-wise {rowwise_time:.3f}s, vectorised {vectorised_time:.3f}s"
+                      f"{'' if same else ' MISMATCH'}")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
+        return passed
@@ -1,6 +1,9 @@
 import os
 import pandas as pd
 from HelperFunc import HelperFunctions
+from CompareIndex import CompareIndex
+from Finding import Finding
+from ModuleNameIndex import ModuleNameIndex
 from logger_config import logger
 import re
 
@@ -10,8 +13,12 @@ class ProjectCheckerSSP:
 
     # Check Nr.6
     @staticmethod
+    @HelperFunctions.uses_columns(
+        ['ReqIF.Text', ('ReqIF.ForeignID', 'Object ID'), 'Status OEM zu Lieferant R', ('ReqIF.Category', 'Typ')],
+        compare_columns=['Object Text', ('ForeignID', 'Object ID')])
     def check_object_text_with_status_oem_zu_lieferant_r(df, compare_df,
-                                                           file_path, compare_file_path):
+                                                           file_path, compare_file_path,
+                                                           compare_index=None):
         """
         Compares the 'ReqIF.Text' attribute with 'Object Text' attribute from a compare file.
         If 'Object Text' differs from 'ReqIF.Text', ensure 'Status OEM zu Lieferant R' is 'zu bewerten'.
@@ -31,30 +38,14 @@ class ProjectCheckerSSP:
         # Check which category/type column exists
         category_col = 'ReqIF.Category' if 'ReqIF.Category' in df.columns else 'Typ'
 
-        required_columns = ['ReqIF.Text', identifier_col,
-                            'Status OEM zu Lieferant R', category_col]
-        compare_required_columns = ['Object Text', compare_identifier_col]
-
-        # Check for missing columns in both DataFrames
-        missing_columns = [col for col in required_columns if
-                           col not in df.columns]
-        missing_compare_columns = [col for col in compare_required_columns if
-                                   col not in compare_df.columns]
-
-        if missing_columns or missing_compare_columns:
-            logger.warning(f"Missing columns in files:")
-            if missing_columns:
-                logger.warning(f"Customer file: {missing_columns}")
-            if missing_compare_columns:
-                logger.warning(f"Compare file: {missing_compare_columns}")
-            return findings
-
-        # Create a dictionary for quick lookup of 'Object Text' from compare file
-        compare_dict = compare_df.set_index(compare_identifier_col)[
-            'Object Text'].to_dict()
+        # Quick lookup of 'Object Text' from compare file (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
         # Iterate through rows in the main DataFrame
-        for index, row in df.iterrows():
+        compare_key_column = HelperFunctions.id_key_column(compare_identifier_col)
+        object_keys = HelperFunctions.id_keys(df, identifier_col)
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row[identifier_col]
             object_text = row['ReqIF.Text']
             oem_status = row.get('Status OEM zu Lieferant R', None)
@@ -64,7 +55,7 @@ class ProjectCheckerSSP:
                 oem_status = "Empty"
             
             # Skip rows with missing 'Object ID'
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Skip if category is 'Überschrift' or 'Information'
@@ -74,8 +65,8 @@ class ProjectCheckerSSP:
                     continue
 
             # Check if the 'Object ID' exists in the compare file
-            if object_id in compare_dict:
-                compare_text = compare_dict[object_id]
+            if compare_index.contains(compare_key_column, object_key):
+                compare_text = compare_index.value(compare_key_column, object_key, 'Object Text')
 
                 # Convert to string and strip whitespace
                 object_text_str = str(object_text) if not pd.isna(
@@ -89,56 +80,56 @@ class ProjectCheckerSSP:
                 if not object_text_str and not compare_text_str:
                     continue
 
-                # Normalize special symbols in both texts
-                object_text_str = HelperFunctions.normalize_symbols(object_text_str)
-                compare_text_str = HelperFunctions.normalize_symbols(compare_text_str)
-
-                # Clean OLE Object artifacts before strict normalization
-                cleaned_object_text = HelperFunctions.clean_ole_object_text(object_text_str)
-                cleaned_compare_text = HelperFunctions.clean_ole_object_text(compare_text_str)
-
-                # Normalize both object_text and compare_text
-                normalized_object_text = HelperFunctions.normalize_text(cleaned_object_text)
-                normalized_compare_text = HelperFunctions.normalize_text(cleaned_compare_text)
+                # Normalize special symbols, clean OLE Object artifacts and normalize (cached for the whole run)
+                normalized_object_text = HelperFunctions.normalize_cached(object_text_str, 'symbols_ole_text')
+                normalized_compare_text = HelperFunctions.normalize_cached(compare_text_str, 'symbols_ole_text')
                 if normalized_object_text != normalized_compare_text:
                     # Strip any trailing comma from oem_status for comparison
                     oem_status_clean = oem_status.rstrip(',')
                     if oem_status_clean not in ['zu bewerten', 'verworfen']:
-                        category_str = 'Empty' if pd.isna(category) or str(category).strip() == '' else str(category).rstrip(',')
-                        findings.append({
-                            'Row': index + 2,  # Adjust for Excel row numbering
-                            'Check Number': 'Nr.6',
-                            'Object ID': str(object_id),
-                            'Attribute': 'ReqIF.Text, Status OEM zu Lieferant R',
-                            'Issue': (
-                                f"'ReqIF.Text' differs from 'Object Text' but 'Status OEM zu Lieferant R' is not 'zu bewerten."
+                        findings.append(Finding(
+                            'Nr.6', index + 2, str(object_id),
+                            attribute='ReqIF.Text, Status OEM zu Lieferant R',
+                            issue=f"'ReqIF.Text' differs from 'Object Text' but 'Status OEM zu Lieferant R' is not 'zu bewerten.",
+                            template=(
+                                "Object ID: {id}\n"
+                                "Typ: {typ!t}\n"
+                                "\n"
+                                "---------------\n"
+                                "       Customer File Name: {customer_file}\n"
+                                "       Customer File Object Text: {customer_text}\n"
+                                "---------------\n"
+                                "       Bosch File Name: {bosch_file}\n"
+                                "       Bosch File Object Text: {bosch_text}\n"
+                                "---------------\n"
+                                "       Status OEM zu Lieferant R: {oem_status}\n"
+                                "\n"
+                                "       Expected Status: zu bewerten"
                             ),
-                            'Value': (
-                                f"Object ID: {object_id}\n"
-                                f"Typ: {category_str}\n"
-                                f"\n"
-                                f"---------------\n"
-                                f"       Customer File Name: {os.path.basename(file_path)}\n"
-                                f"       Customer File Object Text: {object_text_str}\n"
-                                f"---------------\n"
-                                f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                                f"       Bosch File Object Text: {compare_text_str}\n"
-                                f"---------------\n"
-                                f"       Status OEM zu Lieferant R: {oem_status}\n\n"
-                                f"       Expected Status: zu bewerten"
-
-                            )
-                        })
+                            status=row.get('Status OEM zu Lieferant R', None),
+                            id=object_id,
+                            typ=category,
+                            customer_file=os.path.basename(file_path),
+                            customer_text=HelperFunctions.normalize_symbols(object_text_str),
+                            bosch_file=os.path.basename(compare_file_path),
+                            bosch_text=HelperFunctions.normalize_symbols(compare_text_str),
+                            oem_status=oem_status))
 
         logger.info(f"[CHECK NR.6 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.8
     @staticmethod
+    @HelperFunctions.uses_columns(
+        [('ReqIF.ForeignID', 'Object ID'), 'Status OEM zu Lieferant R', ('ReqIF.Category', 'Typ')],
+        compare_columns=[('ForeignID', 'Object ID')],
+        optional=['ASIL', 'Reifegrad', 'Feature', 'Sonstige-Varianten'],
+        compare_optional=['ASIL', 'Category', 'Typ', 'Reifegrad', 'Feature', 'Sonstige-Varianten'])
     def check_multiple_attributes_with_status_oem_zu_lieferant_r(df,
                                                                  compare_df,
                                                                  file_path,
-                                                                 compare_file_path):
+                                                                 compare_file_path,
+                                                                 compare_index=None):
         """
         Compares multiple attributes between customer file and Bosch file:
         - 'ReqIF.Category' with 'Category'
@@ -219,13 +210,10 @@ class ProjectCheckerSSP:
             logger.warning("No attributes found to check")
             return findings  # Return empty findings only if there are truly no attributes to check
 
-        # Validate all required columns exist in customer file
-        customer_required_cols = [identifier_col, 'Status OEM zu Lieferant R', category_col] + [pair[0] for pair in attribute_pairs]
-        missing_customer_cols = [col for col in customer_required_cols if col not in df.columns]
-
-        # Validate all required columns exist in Bosch file
-        bosch_required_cols = [compare_identifier_col] + [pair[1] for pair in attribute_pairs]
-        missing_bosch_cols = [col for col in bosch_required_cols if col not in compare_df.columns]
+        # The compared attributes depend on the category column of the customer file,
+        # so they are validated here rather than declared as required columns
+        missing_customer_cols = [pair[0] for pair in attribute_pairs if pair[0] not in df.columns]
+        missing_bosch_cols = [pair[1] for pair in attribute_pairs if pair[1] not in compare_df.columns]
 
         # Handle missing required columns
         if missing_customer_cols:
@@ -245,11 +233,9 @@ class ProjectCheckerSSP:
             attribute_pairs = [pair for pair in attribute_pairs if pair != ('ASIL', 'ASIL')]
             logger.warning("ASIL comparison disabled due to missing ASIL columns")
 
-        # Create dictionary mappings for each Bosch attribute for quick lookup
-        compare_dicts = {}
-        for _, bosch_attr in attribute_pairs:
-            compare_dicts[bosch_attr] = \
-            compare_df.set_index(compare_identifier_col)[bosch_attr].to_dict()
+        # Quick lookup of the Bosch attributes (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
         # Thoroughly normalize text for comparison
         def normalize_for_comparison(text):
@@ -276,7 +262,9 @@ class ProjectCheckerSSP:
             return set(items)
 
         # Iterate through rows in the customer DataFrame
-        for index, row in df.iterrows():
+        compare_key_column = HelperFunctions.id_key_column(compare_identifier_col)
+        object_keys = HelperFunctions.id_keys(df, identifier_col)
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row[identifier_col]
             oem_status = row.get('Status OEM zu Lieferant R', None)
             category = row.get(category_col, None)
@@ -285,7 +273,7 @@ class ProjectCheckerSSP:
                 oem_status = "Empty"
 
             # Skip rows with missing identifier
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Skip if category is 'Überschrift' or 'Information'
@@ -300,7 +288,7 @@ class ProjectCheckerSSP:
                 oem_status = "Empty"
 
             # Check if the object ID exists in the Bosch file
-            if object_id in compare_dicts[attribute_pairs[0][1]]:  # Check using the first attribute's dictionary
+            if compare_index.contains(compare_key_column, object_key):
                 # Flag to track if any attribute differs
                 any_attribute_differs = False
                 # Store attribute differences for reporting
@@ -309,7 +297,7 @@ class ProjectCheckerSSP:
                 # Check each attribute pair
                 for customer_attr, bosch_attr in attribute_pairs:
                     customer_value = row.get(customer_attr, None)
-                    bosch_value = compare_dicts[bosch_attr].get(object_id, None)
+                    bosch_value = compare_index.value(compare_key_column, object_key, bosch_attr)
 
                     # Special handling for ASIL comparison
                     if customer_attr == 'ASIL' and bosch_attr == 'ASIL':
@@ -363,39 +351,49 @@ class ProjectCheckerSSP:
                     # Display status as "Empty" if it's nan or empty string
                     display_status = "Empty" if pd.isna(row.get('Status OEM zu Lieferant R')) or str(row.get('Status OEM zu Lieferant R', '')).strip() == "" else oem_status
 
-                    category_str = 'Empty' if pd.isna(category) or str(category).strip() == '' else str(category).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,  # Adjust for Excel row numbering
-                        'Check Number': 'Nr.8',
-                        'Object ID': str(object_id),
-                        'Attribute': attribute_list,
-                        'Issue': "Attributes differ but 'Status OEM zu Lieferant R' is not 'zu bewerten'.",
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {category_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"---------------\n"
-                            f"Attribute Comparison:\n{attribute_details.rstrip()}\n\n"
-                            f"---------------\n"
-                            f"       Status OEM zu Lieferant R: {display_status}\n\n"
-                            f"       Expected Status: zu bewerten"
-                        )
-                    })
+                    findings.append(Finding(
+                        'Nr.8', index + 2, str(object_id),
+                        attribute=attribute_list,
+                        issue="Attributes differ but 'Status OEM zu Lieferant R' is not 'zu bewerten'.",
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "---------------\n"
+                            "Attribute Comparison:\n"
+                            "{attribute_details}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Status OEM zu Lieferant R: {display_status}\n"
+                            "\n"
+                            "       Expected Status: zu bewerten"
+                        ),
+                        status=row.get('Status OEM zu Lieferant R', None),
+                        id=object_id,
+                        typ=category,
+                        customer_file=os.path.basename(file_path),
+                        bosch_file=os.path.basename(compare_file_path),
+                        attribute_details=attribute_details.rstrip(),
+                        display_status=display_status))
 
         logger.info(f"[CHECK NR.8 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.9
     @staticmethod
-    def check_quelle_with_status_oem_zu_lieferant_r(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        ['Quelle', ('ReqIF.ForeignID', 'Object ID'), 'Status OEM zu Lieferant R', ('ReqIF.Category', 'Typ')],
+        compare_columns=['Quelle', ('ForeignID', 'Object ID')])
+    def check_quelle_with_status_oem_zu_lieferant_r(df, compare_df, file_path, compare_file_path,
+                                                    compare_index=None):
         """
         Compares 'Quelle' attribute between customer and Bosch files.
         If 'Quelle' differs, ensures 'Status OEM zu Lieferant R' is 'zu bewerten'.
         Ignores items with ReqIF.Category/Typ 'Überschrift' or 'Information'.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         # Determine the identifier column dynamically
@@ -408,27 +406,14 @@ class ProjectCheckerSSP:
         logger.info(f"[CHECK NR.9 START] Quelle comparison | File: {file_path}")
         logger.debug(f"Using identifier columns: {identifier_col} and {compare_identifier_col}")
 
-        # Check for required columns
-        required_columns = ['Quelle', identifier_col, 'Status OEM zu Lieferant R', category_col]
-        compare_required_columns = ['Quelle', compare_identifier_col]
-
-        # Check for missing columns in both DataFrames
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_compare_columns = [col for col in compare_required_columns if col not in compare_df.columns]
-
-        if missing_columns or missing_compare_columns:
-            logger.warning(f"Missing columns in files:")
-            if missing_columns:
-                logger.warning(f"Customer file: {missing_columns}")
-            if missing_compare_columns:
-                logger.warning(f"Compare file: {missing_compare_columns}")
-            return findings
-
-        # Create a dictionary for quick lookup of 'Quelle' from compare file
-        compare_dict = compare_df.set_index(compare_identifier_col)['Quelle'].to_dict()
+        # Quick lookup of 'Quelle' from compare file (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
         # Iterate through rows in the main DataFrame
-        for index, row in df.iterrows():
+        compare_key_column = HelperFunctions.id_key_column(compare_identifier_col)
+        object_keys = HelperFunctions.id_keys(df, identifier_col)
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row[identifier_col]
             quelle = row['Quelle']
             oem_status = row.get('Status OEM zu Lieferant R', None)
@@ -440,7 +425,7 @@ class ProjectCheckerSSP:
                 oem_status = str(oem_status).rstrip(',')
 
             # Skip rows with missing 'Object ID'
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Skip if category is 'Überschrift' or 'Information'
@@ -450,8 +435,8 @@ class ProjectCheckerSSP:
                     continue
 
             # Check if the 'Object ID' exists in the compare file
-            if object_id in compare_dict:
-                compare_quelle = compare_dict[object_id]
+            if compare_index.contains(compare_key_column, object_key):
+                compare_quelle = compare_index.value(compare_key_column, object_key, 'Quelle')
 
                 # Convert to string and strip whitespace
                 quelle_str = str(quelle) if not pd.isna(quelle) else ""
@@ -464,51 +449,58 @@ class ProjectCheckerSSP:
                     continue
 
                 # Normalize both Quelle values
-                normalized_quelle = HelperFunctions.normalize_text(quelle_str)
-                normalized_compare_quelle = HelperFunctions.normalize_text(compare_quelle_str)
+                normalized_quelle = HelperFunctions.normalize_cached(quelle_str)
+                normalized_compare_quelle = HelperFunctions.normalize_cached(compare_quelle_str)
 
                 if normalized_quelle != normalized_compare_quelle:
                     if oem_status not in ['zu bewerten,', 'verworfen,']:
-                        category_str = 'Empty' if pd.isna(category) or str(category).strip() == '' else str(category).rstrip(',')
-                        findings.append({
-                            'Row': index + 2,  # Adjust for Excel row numbering
-                            'Check Number': 'Nr.9',
-                            'Object ID': str(object_id),
-                            'Attribute': 'Quelle, Status OEM zu Lieferant R',
-                            'Issue': (
-                                f"'Quelle' differs between files but 'Status OEM zu Lieferant R' is not 'zu bewerten'."
+                        findings.append(Finding(
+                            'Nr.9', index + 2, str(object_id),
+                            attribute='Quelle, Status OEM zu Lieferant R',
+                            issue=f"'Quelle' differs between files but 'Status OEM zu Lieferant R' is not 'zu bewerten'.",
+                            template=(
+                                "Object ID: {id}\n"
+                                "Typ: {typ!t}\n"
+                                "\n"
+                                "---------------\n"
+                                "       Customer File Name: {customer_file}\n"
+                                "       Customer Attribute: Quelle\n"
+                                "          Atrribute Value: {customer_quelle}\n"
+                                "---------------\n"
+                                "       Bosch File Name: {bosch_file}\n"
+                                "       Bosch Attribute: Quelle\n"
+                                "       Attribute Value: {bosch_quelle}\n"
+                                "---------------\n"
+                                "       Status OEM zu Lieferant R: {oem_status}\n"
+                                "\n"
+                                "       Expected Status: zu bewerten"
                             ),
-                            'Value': (
-                                f"Object ID: {object_id}\n"
-                                f"Typ: {category_str}\n"
-                                f"\n"
-                                f"---------------\n"
-                                f"       Customer File Name: {os.path.basename(file_path)}\n"
-                                f"       Customer Attribute: Quelle\n"
-                                f"          Atrribute Value: {quelle_str}\n"
-                                f"---------------\n"
-                                f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                                f"       Bosch Attribute: Quelle\n"
-                                f"       Attribute Value: {compare_quelle_str}\n"
-                                f"---------------\n"
-                                f"       Status OEM zu Lieferant R: {oem_status}\n\n"
-                                f"       Expected Status: zu bewerten"
-                            )
-                        })
+                            status=row.get('Status OEM zu Lieferant R', None),
+                            id=object_id,
+                            typ=category,
+                            customer_file=os.path.basename(file_path),
+                            customer_quelle=quelle_str,
+                            bosch_file=os.path.basename(compare_file_path),
+                            bosch_quelle=compare_quelle_str,
+                            oem_status=oem_status))
 
         logger.info(f"[CHECK NR.9 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.10
     @staticmethod
-    def check_text_differences_without_status_validation(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        ['ReqIF.Text', ('ReqIF.ForeignID', 'Object ID'), 'Status OEM zu Lieferant R', ('ReqIF.Category', 'Typ')],
+        compare_columns=['Object Text', ('ForeignID', 'Object ID')])
+    def check_text_differences_without_status_validation(df, compare_df, file_path, compare_file_path,
+                                                         compare_index=None):
         """
         Compares 'ReqIF.Text' from customer file with 'Object Text' from Bosch file.
         Reports any differences found, regardless of 'Status OEM zu Lieferant R' value.
         Ignores differences in embedded objects (images, .wmf files, etc.).
         Skips findings if 'Status OEM zu Lieferant R' is 'verworfen'.
         Uses the same text normalization as Check Nr. 6.
-        Returns findings as a list of dictionaries.
+        Returns findings as a list of Finding records.
         """
         findings = []
         # Determine the identifier column dynamically
@@ -521,24 +513,9 @@ class ProjectCheckerSSP:
         logger.info(f"[CHECK NR.10 START] Text differences without status validation (ReqIF.Text vs Object Text) | File: {file_path}")
         logger.debug(f"Using identifier columns: {identifier_col} and {compare_identifier_col}")
 
-        # Check for required columns
-        required_columns = ['ReqIF.Text', identifier_col, 'Status OEM zu Lieferant R', category_col]
-        compare_required_columns = ['Object Text', compare_identifier_col]
-
-        # Check for missing columns in both DataFrames
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        missing_compare_columns = [col for col in compare_required_columns if col not in compare_df.columns]
-
-        if missing_columns or missing_compare_columns:
-            logger.warning(f"Missing columns in files:")
-            if missing_columns:
-                logger.warning(f"Customer file: {missing_columns}")
-            if missing_compare_columns:
-                logger.warning(f"Compare file: {missing_compare_columns}")
-            return findings
-
-        # Create a dictionary for quick lookup of 'Object Text' from compare file
-        compare_dict = compare_df.set_index(compare_identifier_col)['Object Text'].to_dict()
+        # Quick lookup of 'Object Text' from compare file (shared by all checks)
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
         # Function to remove embedded object references
         def remove_embedded_objects(text):
@@ -549,7 +526,9 @@ class ProjectCheckerSSP:
             return text.strip()
 
         # Iterate through rows in the main DataFrame
-        for index, row in df.iterrows():
+        compare_key_column = HelperFunctions.id_key_column(compare_identifier_col)
+        object_keys = HelperFunctions.id_keys(df, identifier_col)
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row[identifier_col]
             reqif_text = row['ReqIF.Text']
             oem_status = row.get('Status OEM zu Lieferant R', None)
@@ -561,7 +540,7 @@ class ProjectCheckerSSP:
                 oem_status = str(oem_status).rstrip(',')
 
             # Skip rows with missing 'Object ID'
-            if pd.isna(object_id):
+            if object_key is None:
                 continue
 
             # Skip if status is 'verworfen'
@@ -569,8 +548,8 @@ class ProjectCheckerSSP:
                 continue
 
             # Check if the 'Object ID' exists in the compare file
-            if object_id in compare_dict:
-                compare_text = compare_dict[object_id]
+            if compare_index.contains(compare_key_column, object_key):
+                compare_text = compare_index.value(compare_key_column, object_key, 'Object Text')
 
                 # Convert to string and strip whitespace
                 reqif_text_str = str(reqif_text) if not pd.isna(reqif_text) else ""
@@ -586,49 +565,49 @@ class ProjectCheckerSSP:
                 reqif_text_str = remove_embedded_objects(reqif_text_str)
                 compare_text_str = remove_embedded_objects(compare_text_str)
 
-                # Normalize special symbols in both texts
-                reqif_text_str = HelperFunctions.normalize_symbols(reqif_text_str)
-                compare_text_str = HelperFunctions.normalize_symbols(compare_text_str)
-
-                # Clean OLE Object artifacts before strict normalization
-                cleaned_reqif_text = HelperFunctions.clean_ole_object_text(reqif_text_str)
-                cleaned_compare_text = HelperFunctions.clean_ole_object_text(compare_text_str)
-
-                # Normalize both texts using the same function as Check Nr. 6
-                normalized_reqif_text = HelperFunctions.normalize_text(cleaned_reqif_text)
-                normalized_compare_text = HelperFunctions.normalize_text(cleaned_compare_text)
+                # Normalize special symbols, clean OLE Object artifacts and normalize (cached for the whole run)
+                normalized_reqif_text = HelperFunctions.normalize_cached(reqif_text_str, 'symbols_ole_text')
+                normalized_compare_text = HelperFunctions.normalize_cached(compare_text_str, 'symbols_ole_text')
 
                 if normalized_reqif_text != normalized_compare_text:
-                    category_str = 'Empty' if pd.isna(category) or str(category).strip() == '' else str(category).rstrip(',')
-                    findings.append({
-                        'Row': index + 2,  # Adjust for Excel row numbering
-                        'Check Number': 'Nr.10',
-                        'Object ID': str(object_id),
-                        'Attribute': 'ReqIF.Text, Object Text',
-                        'Issue': (
-                            f"'ReqIF.Text' differs from 'Object Text' between files, may be the translation is needed (FOR INTERNAL USE ONLY!)."
+                    findings.append(Finding(
+                        'Nr.10', index + 2, str(object_id),
+                        attribute='ReqIF.Text, Object Text',
+                        issue=f"'ReqIF.Text' differs from 'Object Text' between files, may be the translation is needed (FOR INTERNAL USE ONLY!).",
+                        template=(
+                            "Object ID: {id}\n"
+                            "Typ: {typ!t}\n"
+                            "\n"
+                            "---------------\n"
+                            "       Customer File Name: {customer_file}\n"
+                            "       Customer File Object Text: {customer_text}\n"
+                            "---------------\n"
+                            "       Bosch File Name: {bosch_file}\n"
+                            "       Bosch File Object Text: {bosch_text}\n"
+                            "---------------\n"
+                            "       Status OEM zu Lieferant R: {oem_status}"
                         ),
-                        'Value': (
-                            f"Object ID: {object_id}\n"
-                            f"Typ: {category_str}\n"
-                            f"\n"
-                            f"---------------\n"
-                            f"       Customer File Name: {os.path.basename(file_path)}\n"
-                            f"       Customer File Object Text: {reqif_text_str}\n"
-                            f"---------------\n"
-                            f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                            f"       Bosch File Object Text: {compare_text_str}\n"
-                            f"---------------\n"
-                            f"       Status OEM zu Lieferant R: {oem_status}"
-                        )
-                    })
+                        status=row.get('Status OEM zu Lieferant R', None),
+                        id=object_id,
+                        typ=category,
+                        customer_file=os.path.basename(file_path),
+                        customer_text=HelperFunctions.normalize_symbols(reqif_text_str),
+                        bosch_file=os.path.basename(compare_file_path),
+                        bosch_text=HelperFunctions.normalize_symbols(compare_text_str),
+                        oem_status=oem_status))
 
         logger.info(f"[CHECK NR.10 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.11
     @staticmethod
-    def check_rb_update_for_changed_requirements(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        ['Object ID'],
+        compare_columns=['Object ID'],
+        optional=['ReqIF.Text', 'English_Translation', 'Typ', 'Type'],
+        compare_optional=['Object Text', 'Object Text English', 'Typ'])
+    def check_rb_update_for_changed_requirements(df, compare_df, file_path, compare_file_path,
+                                                 compare_index=None):
         """
         Check Nr.11: Detects RB updates when key attributes differ between customer and Bosch files.
 
@@ -648,29 +627,8 @@ class ProjectCheckerSSP:
         findings = []
         logger.info(f"[CHECK NR.11 START] RB update detection (ReqIF.Text, English_Translation, Typ) | File: {file_path}")
 
-        # This check is defined for Object ID based comparison (LAH vs DOORS export)
-        # Always require 'Object ID' in both files; other attributes are checked flexibly.
-        required_customer_cols = ['Object ID']
-        required_bosch_cols = ['Object ID']
-
-        missing_customer = [c for c in required_customer_cols if c not in df.columns]
-        missing_bosch = [c for c in required_bosch_cols if c not in compare_df.columns]
-
-        check_name = __class__.check_rb_update_for_changed_requirements.__name__
-        if missing_customer:
-            logger.warning(
-                f"Missing required columns in the customer DataFrame: {missing_customer}, "
-                f"in File: {file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
-        if missing_bosch:
-            logger.warning(
-                f"Missing required columns in the Bosch file: {missing_bosch}, "
-                f"in File: {compare_file_path}.\nSkipping check: {check_name}"
-            )
-            return findings
-
+        # This check is defined for Object ID based comparison (LAH vs DOORS export):
+        # 'Object ID' is required in both files, other attributes are checked flexibly.
         # Determine which attributes are available for flexible comparison
         reqif_enabled = 'ReqIF.Text' in df.columns and 'Object Text' in compare_df.columns
         # Compare Object Text English (Bosch) with English_Translation (Customer)
@@ -689,24 +647,22 @@ class ProjectCheckerSSP:
             )
             return findings
 
-        # Build quick lookup for Bosch rows by Object ID
-        bosch_rows_by_id = {}
-        for _, ref_row in compare_df.iterrows():
-            ref_object_id = ref_row.get('Object ID', None)
-            if pd.isna(ref_object_id) or str(ref_object_id).strip() == "":
-                continue
-            bosch_rows_by_id.setdefault(str(ref_object_id), []).append(ref_row)
+        # Quick lookup of Bosch rows by canonical Object ID
+        if compare_index is None:
+            compare_index = CompareIndex(compare_df)
 
         seen_object_ids = set()
+        object_keys = HelperFunctions.id_keys(df, 'Object ID')
 
-        for index, row in df.iterrows():
+        for (index, row), object_key in zip(df.iterrows(), object_keys):
             object_id = row.get('Object ID', None)
-            if pd.isna(object_id) or str(object_id).strip() == "":
+            if object_key is None:
                 continue
 
             object_id_str = str(object_id)
 
-            if object_id_str not in bosch_rows_by_id:
+            bosch_positions = compare_index.rows(HelperFunctions.id_key_column('Object ID'), object_key)
+            if not bosch_positions:
                 continue
 
             # Read customer attributes only if enabled / available
@@ -738,24 +694,20 @@ class ProjectCheckerSSP:
             typ_diff = False
 
             # Compare against each Bosch row with same Object ID; one match is enough
-            for ref_row in bosch_rows_by_id[object_id_str]:
-                bosch_text = ref_row.get('Object Text', None) if reqif_enabled else None
+            for position in bosch_positions:
+                bosch_text = compare_index.column('Object Text')[position] if reqif_enabled else None
                 # For English, use 'Object Text English' on Bosch side
-                bosch_eng = ref_row.get('Object Text English', None) if eng_enabled else None
-                bosch_typ = ref_row.get('Typ', None) if typ_enabled else None
+                bosch_eng = compare_index.column('Object Text English')[position] if eng_enabled else None
+                bosch_typ = compare_index.column('Typ')[position] if typ_enabled else None
 
                 # --- ReqIF.Text vs Object Text ---
                 if reqif_enabled:
                     customer_reqif_str = "" if pd.isna(customer_reqif) else str(customer_reqif).strip()
                     bosch_text_str = "" if pd.isna(bosch_text) else str(bosch_text).strip()
 
-                    # Normalize special symbols, then clean and normalize for comparison
-                    customer_reqif_str = HelperFunctions.normalize_symbols(customer_reqif_str)
-                    bosch_text_str = HelperFunctions.normalize_symbols(bosch_text_str)
-                    cleaned_reqif = HelperFunctions.clean_ole_object_text(customer_reqif_str)
-                    cleaned_bosch_text = HelperFunctions.clean_ole_object_text(bosch_text_str)
-                    norm_reqif = HelperFunctions.normalize_text(cleaned_reqif).replace('-', '').lower()
-                    norm_bosch_text = HelperFunctions.normalize_text(cleaned_bosch_text).replace('-', '').lower()
+                    # Normalize special symbols, then clean and normalize for comparison (cached for the whole run)
+                    norm_reqif = HelperFunctions.normalize_cached(customer_reqif_str, 'symbols_ole_text').replace('-', '').lower()
+                    norm_bosch_text = HelperFunctions.normalize_cached(bosch_text_str, 'symbols_ole_text').replace('-', '').lower()
                     if norm_reqif != norm_bosch_text:
                         reqif_diff = True
 
@@ -764,12 +716,9 @@ class ProjectCheckerSSP:
                     customer_eng_str = "" if pd.isna(customer_eng) else str(customer_eng).strip()
                     bosch_eng_str = "" if pd.isna(bosch_eng) else str(bosch_eng).strip()
 
-                    customer_eng_str = HelperFunctions.normalize_symbols(customer_eng_str)
-                    bosch_eng_str = HelperFunctions.normalize_symbols(bosch_eng_str)
-                    cleaned_eng_customer = HelperFunctions.clean_ole_object_text(customer_eng_str)
-                    cleaned_eng_bosch = HelperFunctions.clean_ole_object_text(bosch_eng_str)
-                    norm_eng_customer = HelperFunctions.normalize_text(cleaned_eng_customer).replace('-', '').lower()
-                    norm_eng_bosch = HelperFunctions.normalize_text(cleaned_eng_bosch).replace('-', '').lower()
+                    # Normalize special symbols, clean OLE Object artifacts and normalize (cached for the whole run)
+                    norm_eng_customer = HelperFunctions.normalize_cached(customer_eng_str, 'symbols_ole_text').replace('-', '').lower()
+                    norm_eng_bosch = HelperFunctions.normalize_cached(bosch_eng_str, 'symbols_ole_text').replace('-', '').lower()
                     if norm_eng_customer != norm_eng_bosch:
                         eng_diff = True
 
@@ -786,9 +735,9 @@ class ProjectCheckerSSP:
                 continue
 
             # Avoid duplicate findings per Object ID
-            if object_id_str in seen_object_ids:
+            if object_key in seen_object_ids:
                 continue
-            seen_object_ids.add(object_id_str)
+            seen_object_ids.add(object_key)
 
             changed_attrs = []
             if reqif_diff:
@@ -800,41 +749,50 @@ class ProjectCheckerSSP:
 
             changed_attrs_str = ", ".join(changed_attrs)
 
-            findings.append({
-                'Row': index + 2,  # Excel-style row number
-                'Check Number': 'Nr.11',
-                'Category': 'rb_update',
-                'Object ID': object_id_str,
-                'Attribute': changed_attrs_str,
-                'Issue': (
-                    "For the same Object ID, at least one of the following attributes differs "
+            findings.append(Finding(
+                'Nr.11', index + 2, object_id_str,
+                attribute=changed_attrs_str,
+                issue=("For the same Object ID, at least one of the following attributes differs "
                     "between the Customer file and the Bosch file: Original text (ReqIF.Text vs Object Text), "
-                    "English text (English_Translation vs Object Text English), or Typ."
+                    "English text (English_Translation vs Object Text English), or Typ."),
+                category='rb_update',
+                template=(
+                    "Object ID: {id}\n"
+                    "\n"
+                    "---------------\n"
+                    "       Customer File Name: {customer_file}\n"
+                    "       Customer ReqIF.Text: {customer_text}\n"
+                    "       Customer Object Text English: {customer_english}\n"
+                    "       Customer Typ: {customer_typ}\n"
+                    "---------------\n"
+                    "       Bosch File Name: {bosch_file}\n"
+                    "       Bosch Object Text: {bosch_text}\n"
+                    "       Bosch Object Text English: {bosch_english}\n"
+                    "       Bosch Typ: {bosch_typ}\n"
+                    "---------------\n"
+                    "       RB_Update_detected: Yes"
                 ),
-                'Value': (
-                    f"Object ID: {object_id_str}\n"
-                    f"\n"
-                    f"---------------\n"
-                    f"       Customer File Name: {os.path.basename(file_path)}\n"
-                    f"       Customer ReqIF.Text: {customer_reqif if reqif_enabled and not pd.isna(customer_reqif) else 'Empty'}\n"
-                    f"       Customer Object Text English: {customer_eng if eng_enabled and not pd.isna(customer_eng) else 'Empty'}\n"
-                    f"       Customer Typ: {customer_typ_norm or 'Empty'}\n"
-                    f"---------------\n"
-                    f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                    f"       Bosch Object Text: {bosch_text_str if reqif_enabled and 'bosch_text_str' in locals() and bosch_text_str else 'Empty'}\n"
-                    f"       Bosch Object Text English: {bosch_eng_str if eng_enabled and 'bosch_eng_str' in locals() and bosch_eng_str else 'Empty'}\n"
-                    f"       Bosch Typ: {bosch_typ_norm if typ_enabled else 'Empty'}\n"
-                    f"---------------\n"
-                    f"       RB_Update_detected: Yes"
-                )
-            })
+                id=object_id_str,
+                customer_file=os.path.basename(file_path),
+                customer_text=customer_reqif if reqif_enabled and not pd.isna(customer_reqif) else 'Empty',
+                customer_english=customer_eng if eng_enabled and not pd.isna(customer_eng) else 'Empty',
+                customer_typ=customer_typ_norm or 'Empty',
+                bosch_file=os.path.basename(compare_file_path),
+                bosch_text=HelperFunctions.normalize_symbols(bosch_text_str) if reqif_enabled and 'bosch_text_str' in locals() and bosch_text_str else 'Empty',
+                bosch_english=HelperFunctions.normalize_symbols(bosch_eng_str) if eng_enabled and 'bosch_eng_str' in locals() and bosch_eng_str else 'Empty',
+                bosch_typ=bosch_typ_norm if typ_enabled else 'Empty'))
 
         logger.info(f"[CHECK NR.11 END] Found {len(findings)} findings.")
         return findings
 
     # Check Nr.12
     @staticmethod
-    def check_missing_object_ids_from_bosch(df, compare_df, file_path, compare_file_path):
+    @HelperFunctions.uses_columns(
+        compare_columns=['Modulename'],
+        optional=['ReqIF.ForeignID', 'Object ID'],
+        compare_optional=['ForeignID', 'Object ID', 'Object Text'])
+    def check_missing_object_ids_from_bosch(df, compare_df, file_path, compare_file_path,
+                                            module_index=None):
         """
         Check Nr.12: Detects Object IDs present in the Bosch file (for the matching module)
         that are missing from the customer file. Purpose: prevent accidental deletion of
@@ -847,57 +805,24 @@ class ProjectCheckerSSP:
           or LAH-ID-only fallback).
         - For each Object ID present in the matched Bosch rows but absent in the
           customer file, a finding is generated.
+
+        module_index (ModuleNameIndex, optional) is a prebuilt index of compare_df['Modulename'].
         """
         findings = []
         logger.info(f"[CHECK NR.12 START] Missing Object ID detection | File: {file_path}")
 
-        # --- Validate Modulename column (required for module matching) ---
-        if 'Modulename' not in compare_df.columns:
-            logger.warning(f"[CHECK NR.12] 'Modulename' column not found in Bosch file: {compare_file_path}. Skipping.")
-            return findings
-
         # --- Extract module name from customer filename ---
         filename = os.path.basename(file_path)
-        _filename_re = re.compile(r'^(?P<base>.+?)_[0-9a-fA-F]+_local_conversion\.xlsx$', re.IGNORECASE)
-        m = _filename_re.match(filename)
-        if not m:
+        source_module = ModuleNameIndex.source_module(file_path)
+        if source_module is None:
             logger.warning(f"[CHECK NR.12] Filename does not match expected pattern: {filename}. Skipping.")
             return findings
-        source_module = m.group('base')
         logger.debug(f"[CHECK NR.12] Extracted module name from filename: {source_module}")
 
-        # --- Fuzzy matching helpers (same logic as find_moduleName.py) ---
-        def _norm(s: str) -> str:
-            s = s.strip()
-            s = re.sub(r'[ _.]', '.', s)
-            s = re.sub(r'\.{2,}', '.', s)
-            return s.lower()
-
-        def _extract_key(modulename: str) -> str:
-            """Take last path segment and strip leading AS_NNN_ prefix."""
-            segment = str(modulename).strip().split('/')[-1]
-            segment = re.sub(r'^[A-Z]+_\d+_', '', segment)
-            return segment.strip()
-
-        src_norm = _norm(source_module)
-
-        # ID-only fallback: just the LAH code (e.g. "LAH.000.900.CM"), stops before first "_"
-        _lah_id_re = re.compile(r'^(LAH[A-Za-z0-9.]+)', re.IGNORECASE)
-        id_m = _lah_id_re.match(source_module)
-        lah_id_norm = (_norm(id_m.group(1)) + '.') if id_m else None
-
-        def _matches_module(modulename) -> bool:
-            if pd.isna(modulename):
-                return False
-            key_norm = _norm(_extract_key(str(modulename)))
-            if key_norm.startswith(src_norm):
-                return True
-            if lah_id_norm and key_norm.startswith(lah_id_norm):
-                return True
-            return False
-
-        # --- Filter Bosch rows for this module ---
-        bosch_module_df = compare_df[compare_df['Modulename'].apply(_matches_module)]
+        # --- Filter Bosch rows for this module (fuzzy matching, same logic as find_moduleName.py) ---
+        if module_index is None:
+            module_index = ModuleNameIndex(compare_df['Modulename'].tolist())
+        bosch_module_df = compare_df.iloc[module_index.rows(source_module)]
 
         if bosch_module_df.empty:
             logger.warning(f"[CHECK NR.12] No matching module found in Bosch file for: {source_module}. Skipping.")
@@ -933,48 +858,32 @@ class ProjectCheckerSSP:
         # --- Validate identifier columns ---
         if customer_id_col not in df.columns:
             logger.warning(f"[CHECK NR.12] '{customer_id_col}' column not found in customer file: {file_path}.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.12',
-                'Object ID': 'N/A',
-                'Attribute': customer_id_col,
-                'Issue': f"'{customer_id_col}' column is missing entirely from the customer file.",
-                'Value': (
-                    f"Customer File Name: {os.path.basename(file_path)}\n"
-                    f"\n"
-                    f"       The '{customer_id_col}' column could not be found in the customer file.\n"
-                    f"       All IDs from the corresponding Bosch module are therefore unverifiable.\n"
-                    f"\n"
-                    f"       Action Required:\n"
-                    f"       Please discuss with the customer why the '{customer_id_col}' column has been\n"
-                    f"       removed from the file and request written clarification. Ensure the\n"
-                    f"       file is re-exported correctly before proceeding with further checks."
-                )
-            })
+            findings.append(Finding(
+                'Nr.12', 'N/A', 'N/A',
+                attribute=customer_id_col,
+                issue=f"'{customer_id_col}' column is missing entirely from the customer file.",
+                template=(
+                    "Customer File Name: {customer_file}\n"
+                    "\n"
+                    "       The '{customer_id_col}' column could not be found in the customer file.\n"
+                    "       All IDs from the corresponding Bosch module are therefore unverifiable.\n"
+                    "\n"
+                    "       Action Required:\n"
+                    "       Please discuss with the customer why the '{customer_id_col}' column has been\n"
+                    "       removed from the file and request written clarification. Ensure the\n"
+                    "       file is re-exported correctly before proceeding with further checks."
+                ),
+                customer_file=os.path.basename(file_path),
+                customer_id_col=customer_id_col))
             return findings
         if bosch_id_col not in bosch_module_df.columns:
             logger.warning(f"[CHECK NR.12] '{bosch_id_col}' column not found in Bosch file: {compare_file_path}. Skipping.")
             return findings
 
-        # --- Collect IDs from both sides ---
-        def _norm_id(oid) -> str:
-            """Normalize ID: strip trailing .0 so '12150732.0' == '12150732'."""
-            s = str(oid).strip()
-            try:
-                return str(int(float(s)))
-            except (ValueError, TypeError):
-                return s
-
-        bosch_ids = {
-            _norm_id(oid)
-            for oid in bosch_module_df[bosch_id_col]
-            if not pd.isna(oid) and str(oid).strip() != ''
-        }
-        customer_ids = {
-            _norm_id(oid)
-            for oid in df[customer_id_col]
-            if not pd.isna(oid) and str(oid).strip() != ''
-        }
+        # --- Collect IDs from both sides (canonical keys, '12150732.0' == '12150732') ---
+        bosch_keys = HelperFunctions.id_keys(bosch_module_df, bosch_id_col)
+        bosch_ids = set(bosch_keys.dropna())
+        customer_ids = set(HelperFunctions.id_keys(df, customer_id_col).dropna())
 
         missing_ids = bosch_ids - customer_ids
 
@@ -985,42 +894,47 @@ class ProjectCheckerSSP:
         # --- Build a lookup for Bosch Object Text (for context in findings) ---
         bosch_text_lookup = {}
         if 'Object Text' in bosch_module_df.columns:
-            for _, row in bosch_module_df.iterrows():
-                oid = str(row.get(bosch_id_col, '')).strip()
-                text = row.get('Object Text', '')
-                if oid and oid not in bosch_text_lookup:
+            for oid, text in zip(bosch_keys, bosch_module_df['Object Text']):
+                if oid is not None and oid not in bosch_text_lookup:
                     bosch_text_lookup[oid] = '' if pd.isna(text) else str(text).strip()
 
         # --- Generate findings ---
         for missing_id in sorted(missing_ids):
             object_text = bosch_text_lookup.get(missing_id, '')
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.12',
-                'Object ID': missing_id,
-                'Attribute': customer_id_col,
-                'Issue': f"ID ({bosch_id_col}) exists in Bosch file but is missing in customer file (possible deletion).",
-                'Value': (
-                    f"{customer_id_col}: {missing_id}\n"
-                    f"\n"
-                    f"---------------\n"
-                    f"       Customer File Name: {os.path.basename(file_path)}\n"
-                    f"       Status: ID NOT FOUND in customer file\n"
-                    f"---------------\n"
-                    f"       Bosch File Name: {os.path.basename(compare_file_path)}\n"
-                    f"       Bosch Module: {source_module}\n"
-                    f"       File Type: {file_type}\n"
-                    f"       Bosch Object Text: {object_text if object_text else 'Empty'}\n"
-                    f"---------------\n"
-                    f"       Action Required: Verify if this ID was intentionally deleted."
-                )
-            })
+            findings.append(Finding(
+                'Nr.12', 'N/A', missing_id,
+                attribute=customer_id_col,
+                issue=f"ID ({bosch_id_col}) exists in Bosch file but is missing in customer file (possible deletion).",
+                template=(
+                    "{customer_id_col}: {id}\n"
+                    "\n"
+                    "---------------\n"
+                    "       Customer File Name: {customer_file}\n"
+                    "       Status: ID NOT FOUND in customer file\n"
+                    "---------------\n"
+                    "       Bosch File Name: {bosch_file}\n"
+                    "       Bosch Module: {source_module}\n"
+                    "       File Type: {file_type}\n"
+                    "       Bosch Object Text: {bosch_text}\n"
+                    "---------------\n"
+                    "       Action Required: Verify if this ID was intentionally deleted."
+                ),
+                customer_id_col=customer_id_col,
+                id=missing_id,
+                customer_file=os.path.basename(file_path),
+                bosch_file=os.path.basename(compare_file_path),
+                source_module=source_module,
+                file_type=file_type,
+                bosch_text=object_text if object_text else 'Empty'))
 
         logger.info(f"[CHECK NR.12 END] Found {len(findings)} missing IDs.")
         return findings
 
     # Check Nr.13
     @staticmethod
+    @HelperFunctions.uses_columns(
+        compare_columns=['Customer Id', 'Customer Status'],
+        optional=['externe CR-ID', 'ReqIF.ForeignID'])
     def check_cr_number_status(df, compare_df, file_path, compare_file_path, cr_number, report_folder):
         """
         Check Nr.13: Given a CR number (e.g. 'BRSSSP-312'), looks it up in the compare file's
@@ -1032,35 +946,27 @@ class ProjectCheckerSSP:
         cr_status_col = 'CR-Status_Bosch_SSP'
         logger.info(f"[CHECK NR.13 START] CR Number Status extraction | CR: {cr_number} | File: {file_path}")
 
-        # --- Validate required columns in compare file ---
-        compare_required = ['Customer Id', 'Customer Status']
-        missing_compare = [c for c in compare_required if c not in compare_df.columns]
-        if missing_compare:
-            logger.warning(f"[CHECK NR.13] Missing columns in compare file: {missing_compare}. Skipping.")
-            return findings
-
         # --- Look up CR number in compare file ---
         cr_rows = compare_df[compare_df['Customer Id'].astype(str).str.strip() == cr_number.strip()]
         if cr_rows.empty:
             logger.warning(f"[CHECK NR.13] CR number '{cr_number}' not found in compare file column 'Customer Id'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.13',
-                'Object ID': 'N/A',
-                'Attribute': 'Customer Id',
-                'Issue': f"CR number '{cr_number}' was not found in the compare file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Compare File: {os.path.basename(compare_file_path)}\n"
-                    f"Column searched: 'Customer Id'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.13', 'N/A', 'N/A',
+                attribute='Customer Id',
+                issue=f"CR number '{cr_number}' was not found in the compare file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Compare File: {bosch_file}\n"
+                    "Column searched: 'Customer Id'"
+                ),
+                cr_number=cr_number,
+                bosch_file=os.path.basename(compare_file_path)))
             return findings
 
         customer_status = str(cr_rows.iloc[0]['Customer Status']).strip()
         logger.debug(f"[CHECK NR.13] Found Customer Status: '{customer_status}' for CR: {cr_number}")
 
-        # --- Validate required columns in customer file ---
+        # --- Validate columns in customer file (after the lookup, which reports an unknown CR number) ---
         customer_required = ['externe CR-ID', 'ReqIF.ForeignID']
         missing_customer = [c for c in customer_required if c not in df.columns]
         if missing_customer:
@@ -1071,18 +977,17 @@ class ProjectCheckerSSP:
         matching = df[df['externe CR-ID'].astype(str).str.strip() == cr_number.strip()]
         if matching.empty:
             logger.info(f"[CHECK NR.13] No rows found in customer file with 'externe CR-ID' = '{cr_number}'.")
-            findings.append({
-                'Row': 'N/A',
-                'Check Number': 'Nr.13',
-                'Object ID': 'N/A',
-                'Attribute': 'externe CR-ID',
-                'Issue': f"CR number '{cr_number}' was not found in the customer file.",
-                'Value': (
-                    f"CR Number: {cr_number}\n"
-                    f"Customer File: {os.path.basename(file_path)}\n"
-                    f"Column searched: 'externe CR-ID'"
-                )
-            })
+            findings.append(Finding(
+                'Nr.13', 'N/A', 'N/A',
+                attribute='externe CR-ID',
+                issue=f"CR number '{cr_number}' was not found in the customer file.",
+                template=(
+                    "CR Number: {cr_number}\n"
+                    "Customer File: {customer_file}\n"
+                    "Column searched: 'externe CR-ID'"
+                ),
+                cr_number=cr_number,
+                customer_file=os.path.basename(file_path)))
             return findings
 
         # --- Build and write TSV file ---
@@ -1100,18 +1005,19 @@ class ProjectCheckerSSP:
         tsv_df.to_csv(tsv_path, sep='\t', index=False)
         logger.info(f"[CHECK NR.13 END] TSV written: {tsv_path} ({len(tsv_rows)} rows)")
 
-        findings.append({
-            'Row': 'N/A',
-            'Check Number': 'Nr.13',
-            'Object ID': 'N/A',
-            'Attribute': 'CR-Status',
-            'Issue': f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
-            'Value': (
-                f"CR Number: {cr_number}\n"
-                f"Customer Status: {customer_status}\n"
-                f"TSV File: {tsv_filename}"
+        findings.append(Finding(
+            'Nr.13', 'N/A', 'N/A',
+            attribute='CR-Status',
+            issue=f"CR '{cr_number}' found. TSV file generated with {len(tsv_rows)} requirement(s).",
+            severity=Finding.INFO,
+            status=customer_status,
+            template=(
+                "CR Number: {cr_number}\n"
+                "Customer Status: {customer_status}\n"
+                "TSV File: {tsv_filename}"
             ),
-            'Type': 'info'
-        })
+            cr_number=cr_number,
+            customer_status=customer_status,
+            tsv_filename=tsv_filename))
 
         return findings
\ No newline at end of file
@@ -0,0 +1,127 @@
+import numpy
+import pandas as pd
+from HelperFunc import HelperFunctions
+
+
+class CompareIndex:
+    """
+    Lookups over the compare (Bosch) file, built once per run and shared by
+    every check and every customer file.
+
+    The column values are extracted once; ID lookups group the row positions
+    of the compare file by normalised ID so a check finds all rows of an
+    Object ID in O(1) instead of building its own dictionary or filtering
+    compare_df per customer row.
+    """
+
+    def __init__(self, compare_df, columns=None):
+        """
+        Build the index.
+
+        Args:
+            compare_df (DataFrame): The loaded compare file; the canonical ID key
+                                    columns (see HelperFunctions.add_id_keys) are
+                                    added when the loader did not add them
+            columns (iterable, optional): Columns whose values are extracted, e.g.
+                                          the compare columns the consuming checks
+                                          declare; the key columns of the ID columns
+                                          among them are included. None extracts all.
+        """
+        compare_df = HelperFunctions.add_id_keys(compare_df)
+        self.df = compare_df
+        self.columns = compare_df.columns
+        extracted = compare_df.columns.unique()
+        if columns is not None:
+            columns = set(columns)
+            columns.update(HelperFunctions.id_key_column(col) for col in list(columns))
+            extracted = [col for col in extracted if col in columns]
+        self._values = {col: compare_df[col].tolist() for col in extracted}
+        self._groups = {}  # (ID column, key function) -> {key: [row positions]}
+
+    @staticmethod
+    def normalize_id(value):
+        """
+        Normalise an ID value for lookups.
+
+        Equal IDs map to the same key whatever their type (5, 5.0, numpy.int64(5)),
+        exactly like the equality pandas and dict lookups use.
+
+        Args:
+            value: ID cell value
+
+        Returns:
+            Hashable key, None for empty cells
+        """
+        if pd.isna(value):
+            return None
+        if isinstance(value, numpy.generic):
+            value = value.item()  # numpy scalar -> Python scalar
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def column(self, column):
+        """
+        Values of a compare file column in row order.
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            list: Cell values (NaN for empty cells)
+        """
+        return self._values[column]
+
+    def _group(self, id_column, key):
+        group = self._groups.get((id_column, key))
+        if group is None:
+            group = {}
+            for position, value in enumerate(self._values[id_column]):
+                if pd.isna(value):
+                    continue
+                group.setdefault(key(value), []).append(position)
+            self._groups[(id_column, key)] = group
+        return group
+
+    def rows(self, id_column, object_id, key=None):
+        """
+        Positions of all compare rows with the given ID, in file order.
+
+        Args:
+            id_column (str): ID column of the compare file (e.g. 'Object ID')
+            object_id: ID to look up
+            key (callable, optional): Key function applied to both sides instead
+                                      of normalize_id (e.g. str); lookups are cached
+                                      per function object, so pass a named function
+
+        Returns:
+            list: Row positions, empty when the ID does not occur
+        """
+        if pd.isna(object_id):
+            return []
+        key = key or self.normalize_id
+        return self._group(id_column, key).get(key(object_id), [])
+
+    def contains(self, id_column, object_id, key=None):
+        """Check whether the ID occurs in id_column (see rows)."""
+        return bool(self.rows(id_column, object_id, key))
+
+    def value(self, id_column, object_id, column, default=None, key=None):
+        """
+        Value of column for the ID, taken from its last row in the compare file
+        (same as compare_df.set_index(id_column)[column].to_dict()[object_id]).
+
+        Args:
+            id_column (str): ID column of the compare file
+            object_id: ID to look up
+            column (str): Column to read
+            default: Returned when the ID does not occur
+            key (callable, optional): Key function, see rows
+
+        Returns:
+            The cell value or default
+        """
+        positions = self.rows(id_column, object_id, key)
+        if not positions:
+            return default
+        return self._values[column][positions[-1]]
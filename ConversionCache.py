@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from logger_config import logger
+
+try:
+    import pyarrow
+    import pyarrow.feather
+except ImportError:  # Feather needs pyarrow, fall back to pickle files without it
+    pyarrow = None
+
+
+class ConversionCache:
+    """
+    Persistent cache of converted ReqIF modules.
+
+    Entries are keyed by the SHA-256 of the ReqIF content plus the converter
+    version, so an unchanged module is loaded from disk instead of being
+    parsed again. Tables are stored as Feather (Arrow IPC) files when pyarrow
+    is available, otherwise as pandas pickles. The cache folder is kept below
+    max_bytes by deleting the least recently used entries.
+    """
+
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+    _HEADER_KEY = b"excel_columns"
+
+    def __init__(self, cache_folder, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_folder (str): Folder holding the cache entries
+            max_bytes (int, optional): Size limit of the cache folder. Defaults to 2 GiB.
+        """
+        self.cache_folder = cache_folder
+        self.max_bytes = max_bytes
+        self.extension = ".feather" if pyarrow is not None else ".pkl"
+        os.makedirs(cache_folder, exist_ok=True)
+
+    @staticmethod
+    def content_key(stream, version):
+        """
+        Build the cache key of a ReqIF file.
+
+        Args:
+            stream (file object): Binary stream with the ReqIF content
+            version (str): Converter version; part of the key so a converter
+                           change never serves stale tables
+
+        Returns:
+            str: Hex digest identifying the converted table
+        """
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+        digest.update(b"\0" + version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_folder, key + self.extension)
+
+    def load(self, key):
+        """
+        Load a cached table.
+
+        Args:
+            key (str): Key from content_key
+
+        Returns:
+            tuple: (DataFrame, Excel header list) or (None, None) on a cache miss
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None, None
+        try:
+            if pyarrow is not None:
+                table = pyarrow.feather.read_table(path)
+                metadata = table.schema.metadata or {}
+                df = table.to_pandas()
+                # Arrow hands back missing strings as None, the Excel reader used NaN
+                df = df.where(df.notna(), np.nan)
+                header = json.loads(metadata.get(self._HEADER_KEY, b"null"))
+            else:
+                df, header = pd.read_pickle(path)
+            # Mark the entry as recently used for the LRU eviction
+            os.utime(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None, None
+        return df, header or list(df.columns)
+
+    def store(self, key, df, header):
+        """
+        Store a converted table.
+
+        Args:
+            key (str): Key from content_key
+            df (DataFrame): Converted table
+            header (list): Column names as written to the Excel header
+        """
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if pyarrow is not None:
+                table = pyarrow.Table.from_pandas(df, preserve_index=False)
+                metadata = dict(table.schema.metadata or {})
+                metadata[self._HEADER_KEY] = json.dumps(header).encode("utf-8")
+                pyarrow.feather.write_feather(table.replace_schema_metadata(metadata), temp_path)
+            else:
+                pd.to_pickle((df, header), temp_path)
+            # Atomic rename so parallel workers never see half written entries
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits into max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_folder):
+            path = os.path.join(self.cache_folder, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                logger.debug(f"Evicted cache entry {os.path.basename(path)}")
+            except OSError:
+                continue
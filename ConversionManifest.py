@@ -0,0 +1,119 @@
+import json
+import os
+from logger_config import logger
+
+
+class ConversionManifest:
+    """
+    Record of the last conversion run: source archive -> member -> content
+    hash -> produced output. Stored as JSON next to the converted Excel files
+    so a re-run only converts new or changed members.
+    """
+
+    FILE_NAME = "conversion_manifest.json"
+
+    def __init__(self, folder, version):
+        """
+        Load the manifest of a conversion folder.
+
+        Args:
+            folder (str): Folder holding the converted Excel files
+            version (str): Converter version; a different version invalidates
+                           all recorded hashes
+        """
+        self.path = os.path.join(folder, self.FILE_NAME)
+        self.version = version
+        self.exists = False
+        self.archives = {}  # archive path -> {"size", "mtime", "members": {source name: hash}}
+        self.outputs = {}   # output file name -> {"source": [...], "hash": str, "excel": bool}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable conversion manifest {self.path}: {e}")
+            return
+
+        self.exists = True
+        self.outputs = data.get("outputs", {})
+        if data.get("version") != self.version:
+            logger.info("Converter version changed, all members will be converted again")
+            for entry in self.outputs.values():
+                entry["hash"] = None
+            return
+        self.archives = data.get("archives", {})
+
+    def hash_sources(self, sources, open_source, content_key, source_name):
+        """
+        Content hash of every source. Archives whose size and modification time
+        are unchanged reuse the recorded hashes instead of being read again.
+
+        Args:
+            sources (list): Source tuples (archive path, member[, nested member ...])
+            open_source (callable): Opens a source tuple as a binary stream
+            content_key (callable): Computes the hash of a binary stream
+            source_name (callable): Readable name of a source tuple
+
+        Returns:
+            dict: Source tuple -> content hash
+        """
+        by_archive = {}
+        for source in sources:
+            by_archive.setdefault(source[0], []).append(source)
+
+        hashes = {}
+        archives = {}
+        for archive, members in by_archive.items():
+            stat = os.stat(archive)
+            names = [source_name(source) for source in members]
+            recorded = self.archives.get(archive)
+            if (recorded is not None
+                    and recorded.get("size") == stat.st_size
+                    and recorded.get("mtime") == stat.st_mtime_ns
+                    and set(recorded.get("members", {})) == set(names)):
+                member_hashes = recorded["members"]
+            else:
+                member_hashes = {}
+                for source, name in zip(members, names):
+                    with open_source(source) as stream:
+                        member_hashes[name] = content_key(stream)
+            for source, name in zip(members, names):
+                hashes[source] = member_hashes[name]
+            archives[archive] = {"size": stat.st_size, "mtime": stat.st_mtime_ns,
+                                 "members": member_hashes}
+
+        self.archives = archives
+        return hashes
+
+    def is_current(self, output_name, source, content_hash):
+        """Check whether output_name was produced from this exact source content."""
+        entry = self.outputs.get(output_name)
+        return (entry is not None
+                and entry.get("hash") == content_hash
+                and tuple(entry.get("source", ())) == tuple(source))
+
+    def has_excel(self, output_name):
+        """Check whether the Excel file of output_name was written."""
+        entry = self.outputs.get(output_name)
+        return entry is not None and entry.get("excel", False)
+
+    def record(self, output_name, source, content_hash, excel):
+        """Register a produced output."""
+        self.outputs[output_name] = {"source": list(source), "hash": content_hash,
+                                     "excel": excel}
+
+    def forget(self, output_name):
+        """Drop an output from the manifest."""
+        self.outputs.pop(output_name, None)
+
+    def save(self):
+        """Write the manifest atomically."""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.version, "archives": self.archives,
+                       "outputs": self.outputs}, f, indent=2)
+        os.replace(temp_path, self.path)
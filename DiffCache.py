@@ -0,0 +1,237 @@
+import hashlib
+import os
+import sqlite3
+import time
+from logger_config import logger
+
+
+class DiffCache:
+    """
+    Persistent cache of highlighted text differences, shared across reports and runs.
+
+    The same text pair is highlighted again for every report it shows up in
+    (repeated runs on the same drop, one report per CR suffix, HTML and Excel
+    runs). Entries are keyed by the SHA-256 of the normalised text pair plus the
+    signature of the diff engine, so a changed engine or budget never serves old
+    highlighting. They are stored in one SQLite file, which parallel worker
+    processes can share. New entries and hits are kept in memory and written by
+    flush, once per report; flush also deletes the least recently used entries
+    until the cache fits into max_bytes.
+    """
+
+    FILE_NAME = "diff_cache.sqlite"
+    DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+    # Per-entry overhead in bytes (key, row and index), so that many small
+    # entries also count against the bound
+    ENTRY_OVERHEAD = 160
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Create the cache; the database file is opened, and created if needed, on first use.
+
+        Args:
+            path (str): Path of the SQLite file
+            max_bytes (int, optional): Size limit of the cached entries. Defaults to 256 MiB.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending = {}  # key -> (html1, html2), not yet written
+        self._touched = set()  # Keys of hits, their last use is updated by flush
+        self._db = None
+        self._pid = None
+        self._disabled = False
+
+    def _connection(self):
+        """Connection of this process; a worker process never uses the one of its parent."""
+        if self._pid != os.getpid():
+            if self._pid is not None:
+                # Copied into a worker process: the entries are the parent's to write
+                self._pending.clear()
+                self._touched.clear()
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS diffs (key TEXT PRIMARY KEY, html1 TEXT NOT NULL, "
+                             "html2 TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS diffs_used ON diffs (used)")
+            self._db.commit()
+            self._pid = os.getpid()
+        return self._db
+
+    def _disable(self, error):
+        """Stop using the cache after a database error; reports are still generated."""
+        logger.warning(f"Diff cache {self.path} disabled: {error}")
+        self._disabled = True
+        self._pending.clear()
+        self._touched.clear()
+
+    @staticmethod
+    def key(text1, text2, signature):
+        """
+        Build the cache key of a text pair.
+
+        Args:
+            text1 (str): Normalised customer text
+            text2 (str): Normalised Bosch text
+            signature (str): Diff engine and budget producing the highlighting
+
+        Returns:
+            str: Hex digest identifying the highlighted pair
+        """
+        digest = hashlib.sha256(signature.encode("utf-8"))
+        for text in (text1, text2):
+            digest.update(b"\0" + text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Look up a highlighted text pair.
+
+        Args:
+            key (str): Key from DiffCache.key
+
+        Returns:
+            tuple: (html1, html2), or None on a cache miss
+        """
+        if self._disabled:
+            return None
+        result = self._pending.get(key)
+        if result is None:
+            try:
+                row = self._connection().execute(
+                    "SELECT html1, html2 FROM diffs WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+            if row is None:
+                self.misses += 1
+                return None
+            result = row
+            self._touched.add(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Add a highlighted text pair; it is written by the next flush.
+
+        Args:
+            key (str): Key from DiffCache.key
+            result (tuple): (html1, html2)
+        """
+        if not self._disabled:
+            self._pending[key] = result
+
+    def flush(self):
+        """Write the new entries and the last use of the hits, then evict down to max_bytes."""
+        if self._disabled or not (self._pending or self._touched):
+            return
+        now = time.time()
+        try:
+            db = self._connection()
+            with db:
+                db.executemany("INSERT OR REPLACE INTO diffs VALUES (?, ?, ?, ?, ?)",
+                               ((key, html1, html2, self._size(html1, html2), now)
+                                for key, (html1, html2) in self._pending.items()))
+                db.executemany("UPDATE diffs SET used = ? WHERE key = ?",
+                               ((now, key) for key in self._touched))
+            self._pending.clear()
+            self._touched.clear()
+            self._evict(db)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _size(self, html1, html2):
+        return len(html1) + len(html2) + self.ENTRY_OVERHEAD
+
+    def _evict(self, db):
+        """Delete least recently used entries until the cache fits into max_bytes."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM diffs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        expired = []
+        cursor = db.execute("SELECT key, size FROM diffs ORDER BY used")
+        for key, size in cursor:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        cursor.close()
+        with db:
+            db.executemany("DELETE FROM diffs WHERE key = ?", expired)
+        self.evictions += len(expired)
+        logger.debug(f"Evicted {len(expired)} diff cache entries")
+
+    def close(self):
+        """Flush and close the connection of this process."""
+        self.flush()
+        if self._db is not None and self._pid == os.getpid():
+            self._db.close()
+        self._db = None
+        self._pid = None
+
+    def statistics(self):
+        """
+        Usage statistics of the cache in this process.
+
+        Returns:
+            dict: hits, misses, hit_rate and evictions
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+        }
+
+    def log_statistics(self):
+        """Write the usage statistics to the log."""
+        stats = self.statistics()
+        logger.info(
+            f"Diff cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.1%}), {stats['evictions']} evictions")
+
+    @staticmethod
+    def test_diff_cache():
+        """Check hits across cache instances (runs) and the size bound."""
+        import tempfile
+
+        print("\nTesting the diff cache:")
+        print("-" * 50)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, DiffCache.FILE_NAME)
+            keys = [DiffCache.key(f"text {i}", f"text {i + 1}", "test") for i in range(50)]
+            cache = DiffCache(path)
+            misses = [cache.get(key) for key in keys]
+            for i, key in enumerate(keys):
+                cache.put(key, (f"<del>{i}</del>", f"<add>{i + 1}</add>"))
+            cache.close()
+
+            # A later run reads the entries written by the first one
+            cache = DiffCache(path)
+            hits = [cache.get(key) for key in keys]
+            cache.close()
+
+            # Bounded to about ten entries, the least recently used ones are evicted
+            cache = DiffCache(path, max_bytes=10 * (DiffCache.ENTRY_OVERHEAD + 20))
+            cache.get(keys[0])
+            cache.put(DiffCache.key("new", "text", "test"), ("<del>new</del>", "<add>text</add>"))
+            cache.close()
+            cache = DiffCache(path)
+            kept = [cache.get(key) is not None for key in keys]
+            cache.close()
+
+        passed = (
+            misses == [None] * len(keys)
+            and hits[7] == ("<del>7</del>", "<add>8</add>")
+            and None not in hits
+            and kept[0] and sum(kept) < 10 and not kept[1]
+            and DiffCache.key("a", "bc", "test") != DiffCache.key("ab", "c", "test")
+        )
+        print(f"Hits of a second run: {sum(hit is not None for hit in hits)}/{len(keys)}, "
+              f"kept after eviction: {sum(kept)}")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
@@ -0,0 +1,260 @@
+from collections.abc import Mapping
+from string import Formatter
+import pandas as pd
+
+
+class Finding(Mapping):
+    """
+    One finding of a check.
+
+    The checks do not format the details text ('Value' of the reports) anymore. A
+    finding keeps the details template of its check, shared by all its findings,
+    and the typed values of the template fields as read from the files; the text
+    is rendered only when a report is written. The report writers take the
+    compared values from the fields instead of searching them in the text.
+
+    Field names: a value read from both files is customer_<attribute> and
+    bosch_<attribute>, any other value is <attribute> (e.g. typ, brs_status).
+    Names with a meaning for the reports:
+        id / foreign_id: Requirement ID (foreign_id for ReqIF.ForeignID)
+        customer_text / bosch_text: Compared requirement texts (highlighted)
+        customer_typ / bosch_typ: Compared 'Typ' values (highlighted)
+
+    A template field can name how its value is shown, with a conversion after the
+    name (see CONVERSIONS):
+        {name!e}: 'Empty' for a missing or blank value, otherwise the value
+        {name!t}: Like !e, without trailing commas (e.g. 'Anforderung,')
+        {name!m}: 'Empty' for a missing value only, blank text is shown as it is
+    The report writers use text_template and display_values, in which the
+    conversions are applied.
+
+    A finding reads like the dict of the former checks ('Row', 'Check Number',
+    'Object ID', 'Attribute', 'Issue', 'Value', plus 'Category' and 'Type' when
+    set), so the report writers and pd.DataFrame can use it unchanged. The
+    arguments of __init__ cannot be used as field names.
+    """
+
+    __slots__ = ('check', 'row', 'object_id', 'attribute', 'issue', 'category', 'severity',
+                 'status', 'template', 'values')
+
+    WARNING = 'warning'
+    INFO = 'info'  # Shown as information, not counted as finding
+
+    @staticmethod
+    def _is_missing(value):
+        return value is None or (not isinstance(value, str) and pd.isna(value))
+
+    @staticmethod
+    def _is_empty(value):
+        return Finding._is_missing(value) or str(value).strip() == ''
+
+    CONVERSIONS = {
+        'e': lambda value: 'Empty' if Finding._is_empty(value) else str(value),
+        't': lambda value: 'Empty' if Finding._is_empty(value) else str(value).rstrip(','),
+        'm': lambda value: 'Empty' if Finding._is_missing(value) else str(value),
+    }
+
+    _fields = {}  # template -> names of its fields in order of first occurrence
+    _layouts = {}  # template -> (template without conversions, {name: conversion})
+
+    def __init__(self, check, row, object_id, attribute, issue, template, category=None,
+                 severity=WARNING, status=None, **values):
+        """
+        Create a finding.
+
+        Args:
+            check (str): Check number, e.g. 'Nr.6'
+            row: Excel row number, or 'N/A'
+            object_id (str): ID shown in the report header
+            attribute (str): Checked attributes
+            issue (str): Description of the issue
+            template (str): Details template of the check (str.format syntax)
+            category (str, optional): Finding category, e.g. 'rb_update'. Defaults to None.
+            severity (str, optional): WARNING or INFO. Defaults to WARNING.
+            status (optional): Status value of the requirement the finding is about
+                               (e.g. its BRS status), as read from the file. Defaults to None.
+            **values: Value of every field of the template; values the template
+                      does not use are not kept
+
+        Raises:
+            TypeError: When a field of the template has no value
+        """
+        names = self.fields(template)
+        missing = [name for name in names if name not in values]
+        if missing:
+            raise TypeError(f"Finding {check}: no value for the template fields {missing}")
+        self.check = check
+        self.row = row
+        self.object_id = object_id
+        self.attribute = attribute
+        self.issue = issue
+        self.category = category
+        self.severity = severity
+        self.status = status
+        self.template = template
+        self.values = tuple(values[name] for name in names)
+
+    @classmethod
+    def fields(cls, template):
+        """
+        Field names of a details template, in order of first occurrence.
+
+        Args:
+            template (str): Details template
+
+        Returns:
+            tuple: The field names
+        """
+        names = cls._fields.get(template)
+        if names is None:
+            names = tuple(dict.fromkeys(name for _, name, _, _ in Formatter().parse(template)
+                                        if name is not None))
+            cls._fields[template] = names
+        return names
+
+    @classmethod
+    def layout(cls, template):
+        """
+        Template without the conversions of its fields, and the conversions.
+
+        Args:
+            template (str): Details template
+
+        Returns:
+            tuple: (template with plain {name} fields, {name: conversion function})
+        """
+        layout = cls._layouts.get(template)
+        if layout is None:
+            parts = []
+            conversions = {}
+            for literal, name, spec, conversion in Formatter().parse(template):
+                parts.append(literal.replace('{', '{{').replace('}', '}}'))
+                if name is not None:
+                    parts.append(f"{{{name}:{spec}}}" if spec else f"{{{name}}}")
+                    if conversion is not None:
+                        conversions.setdefault(name, cls.CONVERSIONS[conversion])
+            layout = (''.join(parts), conversions)
+            cls._layouts[template] = layout
+        return layout
+
+    @property
+    def text_template(self):
+        """The details template with plain {name} fields, for display_values."""
+        return self.layout(self.template)[0]
+
+    def field(self, name, default=None):
+        """
+        Value of a template field.
+
+        Args:
+            name (str): Field name
+            default: Returned when the template has no such field
+
+        Returns:
+            The typed value as passed by the check
+        """
+        names = self.fields(self.template)
+        return self.values[names.index(name)] if name in names else default
+
+    def field_values(self):
+        """Template fields as {name: value}, the values as passed by the check."""
+        return dict(zip(self.fields(self.template), self.values))
+
+    def display_values(self):
+        """Template fields as {name: value}, converted as the template says (e.g. 'Empty')."""
+        conversions = self.layout(self.template)[1]
+        values = self.field_values()
+        for name, conversion in conversions.items():
+            values[name] = conversion(values[name])
+        return values
+
+    @property
+    def value(self):
+        """The details text, rendered from the template."""
+        return self.text_template.format_map(self.display_values())
+
+    def _keys(self):
+        keys = ['Row', 'Check Number']
+        if self.category is not None:
+            keys.append('Category')
+        keys += ['Object ID', 'Attribute', 'Issue', 'Value']
+        if self.severity == self.INFO:
+            keys.append('Type')
+        return keys
+
+    def __getitem__(self, key):
+        if key == 'Row':
+            return self.row
+        if key == 'Check Number':
+            return self.check
+        if key == 'Object ID':
+            return self.object_id
+        if key == 'Attribute':
+            return self.attribute
+        if key == 'Issue':
+            return self.issue
+        if key == 'Value':
+            return self.value
+        if key == 'Category' and self.category is not None:
+            return self.category
+        if key == 'Type' and self.severity == self.INFO:
+            return self.severity
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return f"Finding({self.check!r}, row={self.row!r}, object_id={self.object_id!r})"
+
+    @staticmethod
+    def test_finding():
+        """Check the report record (Mapping), the rendered details and the template fields."""
+        print("\nTesting the finding records:")
+        print("-" * 50)
+        template = ("Object ID: {id!e}\n"
+                    "Typ: {typ!t}\n"
+                    "Customer CR-ID: {customer_cr_id!e}\n"
+                    "Bosch CR-ID: {bosch_cr_id!e}\n"
+                    "Count: {count}\n"
+                    "Release: {release!m} / {first_release!m}")
+        finding = Finding('Nr.4', 7, '1234', attribute='CR-ID', issue='CR-ID differs.',
+                          template=template, status='neu/geändert,', id=1234, typ='Anforderung,',
+                          customer_cr_id=float('nan'), bosch_cr_id='  ', count=3, release=' ',
+                          first_release=None, unused='dropped')
+        info = Finding('Nr.11', 'N/A', 'N/A', attribute='CR-Status', issue='CR found.',
+                       template="CR: {cr_number}", severity=Finding.INFO, category='rb_update',
+                       cr_number='CR-1')
+        try:
+            Finding('Nr.1', 2, 'x', attribute='a', issue='i', template=template, id=1)
+            missing_field = False
+        except TypeError:
+            missing_field = True
+
+        value = ("Object ID: 1234\n"
+                 "Typ: Anforderung\n"
+                 "Customer CR-ID: Empty\n"
+                 "Bosch CR-ID: Empty\n"
+                 "Count: 3\n"
+                 "Release:   / Empty")
+        passed = (
+            list(finding) == ['Row', 'Check Number', 'Object ID', 'Attribute', 'Issue', 'Value']
+            and dict(finding) == {'Row': 7, 'Check Number': 'Nr.4', 'Object ID': '1234',
+                                  'Attribute': 'CR-ID', 'Issue': 'CR-ID differs.', 'Value': value}
+            and finding.get('Type') is None and 'Category' not in finding
+            and list(info) == ['Row', 'Check Number', 'Category', 'Object ID', 'Attribute',
+                               'Issue', 'Value', 'Type']
+            and info['Type'] == Finding.INFO and info['Value'] == 'CR: CR-1'
+            and finding.field('typ') == 'Anforderung,' and finding.field('unused') is None
+            and finding.status == 'neu/geändert,'
+            and finding.text_template.startswith("Object ID: {id}\nTyp: {typ}\n")
+            and finding.display_values()['customer_cr_id'] == 'Empty'
+            and finding.display_values()['count'] == 3
+            and missing_field
+        )
+        print(f"Rendered details: {finding['Value']!r}")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
@@ -1,9 +1,263 @@
+import random
 import re
+import sys
+import time
+import numpy as np
 import pandas as pd
+from NormalizationCache import NormalizationCache
 
 
 class HelperFunctions:
 
+    # Normalisation pipelines of normalize_cached, steps applied in order
+    NORMALIZATION_PROFILES = {
+        'text': ('normalize_text',),
+        'ole_text': ('clean_ole_object_text', 'normalize_text'),
+        'symbols_ole_text': ('normalize_symbols', 'clean_ole_object_text', 'normalize_text'),
+    }
+
+    # Shared by all checks and files of a ChecksProcessor run (one per worker
+    # process); process_folder empties it at the start and end of every run
+    text_cache = NormalizationCache()
+
+    # Requirement ID columns of customer and compare files; add_id_keys adds a
+    # canonical key column for each of them
+    ID_COLUMNS = ('Object ID', 'ReqIF.ForeignID', 'ForeignID')
+
+    # Quotes removed by normalize_text
+    NORMALIZE_TEXT_QUOTES = [
+        '"', "'", '“', '”', '„', '‟', '‹', '›', '‘', '’', '‚', '‛',
+        '`', '´', '′', '″', '❝', '❞', '❮', '❯', '❛', '❜', '❟', '＂', '＇'
+    ]
+
+    # Character replacements at the end of normalize_text
+    NORMALIZE_TEXT_REPLACEMENTS = {'⏐': '|', '½': '|', '…': '...', '–': '-', '—': '-'}
+
+    # Characters removed by normalize_text after the OLE placeholders: whitespace
+    # (every character \s matches), invisible characters, semicolons and
+    # encoding artifacts
+    NORMALIZE_TEXT_REMOVED = [
+        '\t', '\n', '\x0b', '\x0c', '\r', '\x1c', '\x1d', '\x1e', '\x1f', ' ', '\x85',
+        '\u00A0', '\u1680', '\u2000', '\u2001', '\u2002', '\u2003', '\u2004', '\u2005',
+        '\u2006', '\u2007', '\u2008', '\u2009', '\u200A', '\u2028', '\u2029', '\u202F',
+        '\u205F', '\u3000',
+        '\u00AD', '\u200B', '\u200C', '\u200D', '\u200E', '\u200F', '\uFEFF',
+        ';', '?', '◊',
+    ]
+
+    # Cell separators for normalize_text_series; none of them is touched by
+    # normalize_text, the first one missing in the column is used
+    _CELL_SEPARATORS = ['\x00', '\x01', '\x02', '\ue000']
+
+    # Both Bosch DOORS OLE placeholder forms of normalize_text in one pattern. It
+    # starts with the literal 'o' and looks back from there, which lets the regex
+    # engine skip ahead to the next 'o' instead of testing the lookbehind everywhere.
+    _OLE_PLACEHOLDER = re.compile(r'o(?<![a-z\u00E4\u00F6\u00FC\u00DF]o)(?:\?|(?=[A-Z]))')
+
+    @staticmethod
+    def uses_columns(columns=(), compare_columns=(), optional=(), compare_optional=()):
+        """
+        Declare the columns a check reads, so ChecksProcessor can load only those.
+
+        This is the only declaration of a check's columns: the checks do not test
+        for their required columns themselves, CheckPlan skips a check whose
+        required columns are missing (see CheckDefinition.requires). Optional
+        columns are loaded but only used when present (e.g. 'Typ' for the report).
+
+        Args:
+            columns (iterable): Required customer file columns; a tuple entry means
+                                "one of these columns"
+            compare_columns (iterable): Required compare file columns, same format
+            optional (iterable): Optional customer file columns
+            compare_optional (iterable): Optional compare file columns
+
+        Returns:
+            callable: Decorator storing the declaration on the check function
+        """
+        def flatten(entries):
+            return tuple(col for entry in entries
+                         for col in (entry if isinstance(entry, tuple) else (entry,)))
+
+        def decorator(check):
+            check.requires = tuple(columns)
+            check.compare_requires = tuple(compare_columns)
+            check.columns = flatten(columns) + tuple(optional)
+            check.compare_columns = flatten(compare_columns) + tuple(compare_optional)
+            return check
+        return decorator
+
+    @staticmethod
+    def row_values(df, column):
+        """
+        Values of a column as the rows of df.iterrows() show them, for checks that
+        work on whole columns but must report exactly what the row-wise checks did.
+
+        iterrows() returns the cells unchanged when the frame has a single dtype or
+        a text column; otherwise every row is upcast to a common dtype (int -> float),
+        which changes how numbers are printed.
+
+        Args:
+            df (DataFrame): The checked table
+            column (str): Column name
+
+        Returns:
+            Series: The values (object dtype) with the index of df
+        """
+        dtypes = set(df.dtypes)
+        if len(dtypes) <= 1 or any(dtype == object for dtype in dtypes):
+            values = df[column].tolist()
+        else:
+            values = df.to_numpy()[:, df.columns.get_loc(column)].tolist()
+        return pd.Series(values, index=df.index, dtype=object)
+
+    @staticmethod
+    def is_blank(values):
+        """
+        Rows of a column (see row_values) that are missing or contain only whitespace.
+
+        Args:
+            values (Series): Column values
+
+        Returns:
+            Series: Boolean mask
+        """
+        return values.isna() | (values.map(str).str.strip() == "")
+
+    @staticmethod
+    def normalize_status(values, empty="Empty"):
+        """
+        Normalise a status column (see row_values) once for all rows: surrounding
+        whitespace and trailing commas are removed, missing or blank cells become empty.
+
+        Args:
+            values (Series): Column values
+            empty (str, optional): Value for missing or blank cells. Defaults to "Empty".
+
+        Returns:
+            Series: The normalised statuses
+        """
+        return values.map(str).str.strip().str.rstrip(',').where(~HelperFunctions.is_blank(values), empty)
+
+    @staticmethod
+    def empty_or_text(value, strip_comma=True):
+        """
+        Report form of a cell value: 'Empty' for missing or blank cells, otherwise
+        the text (without trailing commas by default).
+        """
+        if pd.isna(value) or str(value).strip() == '':
+            return 'Empty'
+        return str(value).rstrip(',') if strip_comma else str(value)
+
+    @staticmethod
+    def canonical_id(value):
+        """
+        Canonical form of a requirement ID cell for joins and lookups.
+
+        The same ID arrives as 12150732, 12150732.0, '12150732' or ' 12150732 '
+        depending on the file and how it was read; all of them map to the interned
+        string '12150732'. Other IDs (e.g. 'SSP-12') are kept with surrounding
+        whitespace removed.
+
+        Args:
+            value: ID cell value
+
+        Returns:
+            str: The key, None for missing or blank cells
+        """
+        if isinstance(value, str):
+            text = value.strip()
+            if not text:
+                return None
+            try:
+                return sys.intern(str(int(text)))
+            except ValueError:
+                pass
+            try:
+                number = float(text)
+            except ValueError:
+                return sys.intern(text)
+            if number.is_integer():
+                return sys.intern(str(int(number)))
+            return sys.intern(text)
+        if pd.isna(value):
+            return None
+        if isinstance(value, np.generic):
+            value = value.item()  # numpy scalar -> Python scalar
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return sys.intern(str(value))
+
+    @staticmethod
+    def id_key_column(column):
+        """Name of the canonical key column of an ID column (see add_id_keys)."""
+        return f"{column} [key]"
+
+    @staticmethod
+    def id_keys(df, column):
+        """
+        Canonical keys (see canonical_id) of an ID column, taken from the key column
+        added at load time, or computed when the frame was not loaded through
+        add_id_keys.
+
+        Args:
+            df (DataFrame): Customer or compare table
+            column (str): ID column
+
+        Returns:
+            Series: The keys (None for empty cells) with the index of df
+        """
+        key_column = HelperFunctions.id_key_column(column)
+        if key_column in df.columns:
+            return df[key_column]
+        keys = {}  # IDs repeat across rows, each distinct value is converted once
+        values = [keys[value] if value in keys else keys.setdefault(value, HelperFunctions.canonical_id(value))
+                  for value in df[column].tolist()]
+        return pd.Series(values, index=df.index, dtype=object)
+
+    @staticmethod
+    def add_id_keys(df):
+        """
+        Add the canonical key column of every ID column present (see ID_COLUMNS),
+        once per loaded table, so checks join on the keys instead of converting
+        the raw cells again in every lookup.
+
+        Args:
+            df (DataFrame): Customer or compare table
+
+        Returns:
+            DataFrame: df with the key columns added (a new frame; df is unchanged)
+        """
+        keys = {HelperFunctions.id_key_column(column): HelperFunctions.id_keys(df, column)
+                for column in HelperFunctions.ID_COLUMNS
+                if column in df.columns and HelperFunctions.id_key_column(column) not in df.columns}
+        return df.assign(**keys) if keys else df
+
+    @staticmethod
+    def normalize_cached(text, profile='text'):
+        """
+        Run a normalisation pipeline through the run-wide text cache.
+
+        Args:
+            text: Raw value; only strings are cached, other values (NaN, numbers)
+                  are passed through the pipeline directly
+            profile (str): Key of NORMALIZATION_PROFILES, e.g. 'symbols_ole_text' for
+                           normalize_symbols, clean_ole_object_text and normalize_text
+
+        Returns:
+            str: The normalised text, identical to calling the steps one by one
+        """
+        if profile not in HelperFunctions.NORMALIZATION_PROFILES:
+            raise ValueError(f"Unknown normalisation profile: {profile}")
+        if not isinstance(text, str):
+            return HelperFunctions._run_profile(text, profile)
+        return HelperFunctions.text_cache.get(profile, text, HelperFunctions._run_profile)
+
+    @staticmethod
+    def _run_profile(text, profile):
+        for step in HelperFunctions.NORMALIZATION_PROFILES[profile]:
+            text = getattr(HelperFunctions, step)(text)
+        return text
+
     @staticmethod
     def normalize_text(text, ignore_spaces_and_semicolons=False):
         """
@@ -18,11 +272,7 @@ class HelperFunctions:
             return ""
 
         # Remove all types of quotes
-        quotes = [
-            '"', "'", '“', '”', '„', '‟', '‹', '›', '‘', '’', '‚', '‛',
-            '`', '´', '′', '″', '❝', '❞', '❮', '❯', '❛', '❜', '❟', '＂', '＇'
-        ]
-        for q in quotes:
+        for q in HelperFunctions.NORMALIZE_TEXT_QUOTES:
             text = text.replace(q, '')
 
         # Remove Bosch DOORS OLE object placeholder 'o'. Bosch exports embedded
@@ -63,15 +313,133 @@ class HelperFunctions:
         # Remove other formatting characters if needed (dashes, etc.)
         # text = text.replace('-', '')  # Uncomment if you want to ignore dashes too
 
-        # Replace special characters with standard ones (optional, for wording only)
-        text = text.replace('⏐', '|')  # Replace box drawing character
-        text = text.replace('½', '|')  # Replace half fraction
-        text = text.replace('…', '...')  # Replace ellipsis
-        text = text.replace('–', '-')  # Replace en dash
-        text = text.replace('—', '-')  # Replace em dash
+        # Replace special characters with standard ones (optional, for wording only):
+        # box drawing character and half fraction -> '|', ellipsis -> '...',
+        # en dash and em dash -> '-'
+        for special, standard in HelperFunctions.NORMALIZE_TEXT_REPLACEMENTS.items():
+            text = text.replace(special, standard)
 
         return text.strip()
 
+    @staticmethod
+    def normalize_text_series(texts):
+        """
+        Batch form of normalize_text for a whole column.
+
+        All cells are joined into one string, so each step is a single str.replace
+        (or one regex for the OLE placeholders) over the whole column instead of
+        the chain of replace calls and regexes per cell, and characters that do
+        not occur in the column are skipped. No step touches the cell
+        separator and an 'o' next to it sees the same context as at the start or
+        end of a cell, so the results are exactly those of normalize_text.
+
+        Args:
+            texts (Series): Values to normalize
+
+        Returns:
+            Series: Same index as texts, normalize_text of every value ("" for
+                    non-string values such as NaN)
+        """
+        is_text = np.fromiter((isinstance(value, str) for value in texts), dtype=bool, count=len(texts))
+        result = np.full(len(texts), "", dtype=object)
+        strings = texts.to_numpy(dtype=object)[is_text]
+        if len(strings):
+            # No step introduces a character a later step acts on, so the
+            # characters of the original column decide which steps are needed
+            present = set("".join(strings))
+            separator = next((sep for sep in HelperFunctions._CELL_SEPARATORS if sep not in present), None)
+            if separator is None:
+                result[is_text] = [HelperFunctions.normalize_text(text) for text in strings]
+            else:
+                column = separator.join(strings)
+                for quote in HelperFunctions.NORMALIZE_TEXT_QUOTES:
+                    if quote in present:
+                        column = column.replace(quote, '')
+                if 'o' in present:
+                    column = HelperFunctions._OLE_PLACEHOLDER.sub('', column)
+                for character in HelperFunctions.NORMALIZE_TEXT_REMOVED:
+                    if character in present:
+                        column = column.replace(character, '')
+                for special, standard in HelperFunctions.NORMALIZE_TEXT_REPLACEMENTS.items():
+                    if special in present:
+                        column = column.replace(special, standard)
+                # All whitespace is gone, so the final strip() of normalize_text
+                # has nothing left to do
+                result[is_text] = column.split(separator)
+        return pd.Series(result, index=texts.index, name=texts.name, dtype=object)
+
+    @staticmethod
+    def _sample_requirement_texts(count, seed):
+        """Requirement-like texts with the characters normalize_text treats specially."""
+        sentences = [
+            'Das Steuergerät muss das Signal „KL15“ innerhalb von 100 ms auswerten.',
+            'Die Spannung ≥ 12 V; sonst ist der Fehler ‚DTC_0815‘ zu setzen…',
+            'oTabelle 8-1: Standard TABLES der DOOLE Object*) Die Angabe der PRE-CONDITION',
+            'Bild o? zeigt den Ablauf – siehe Kapitel 3.2 — „Zustandsautomat“',
+            'Motor control unit shall report "ready" when the state is \'idle\'.',
+            'Überprüfung der Größe: ½ Umdrehung ⏐ 90° ± 5° ◊ Toleranz?',
+            'Anforderung\u00A0mit\u200Bunsichtbaren\u00ADZeichen\uFEFF und\ttabs\r\nZeilen',
+            'Fußnote: oA oB ooC äoD öo? Xo?Y „o“Z',
+        ]
+        alphabet = list('aoOzAZäöüßÄ?◊;-–—…⏐½ \x00\t\n\u00A0\u2003\u3000\u200B\u200E\uFEFF\u00AD\x1c') \
+            + HelperFunctions.NORMALIZE_TEXT_QUOTES
+        rng = random.Random(seed)
+        texts = []
+        for i in range(count):
+            if i % 3 == 0:
+                texts.append(rng.choice(sentences))
+            elif i % 3 == 1:
+                texts.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))))
+            else:
+                sentence = rng.choice(sentences)
+                start = rng.randint(0, len(sentence))
+                texts.append(sentence[start:] + ''.join(rng.choice(alphabet) for _ in range(5))
+                             + sentence[:start])
+        for i in range(0, count, 97):
+            texts[i] = rng.choice([None, float('nan'), 42, 4.2, pd.NA])
+        return texts
+
+    @staticmethod
+    def test_normalize_text_series(texts=None, count=100_000, seed=0):
+        """
+        Property test: normalize_text_series must return exactly normalize_text of
+        every value, and be faster on a large column.
+
+        Args:
+            texts (iterable, optional): Texts to check, e.g. the 'Object Text' column
+                                        of a real export; random requirement-like
+                                        texts are generated when omitted
+            count (int, optional): Number of generated texts
+            seed (int, optional): Seed of the generated texts
+
+        Returns:
+            bool: True when all results are identical
+        """
+        if texts is None:
+            texts = HelperFunctions._sample_requirement_texts(count, seed)
+        series = pd.Series(list(texts), dtype=object)
+
+        start = time.perf_counter()
+        expected = [HelperFunctions.normalize_text(text) for text in series]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = HelperFunctions.normalize_text_series(series).tolist()
+        batch_time = time.perf_counter() - start
+
+        mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+
+        print("\nTesting normalize_text_series against normalize_text:")
+        print("-" * 50)
+        print(f"Values: {len(series)}")
+        print(f"normalize_text: {scalar_time:.3f}s, normalize_text_series: {batch_time:.3f}s "
+              f"({scalar_time / max(batch_time, 1e-9):.1f}x)")
+        for i in mismatches[:5]:
+            print(f"Mismatch for {series[i]!r}: {expected[i]!r} != {actual[i]!r}")
+        print(f"Test {'PASSED' if not mismatches else 'FAILED'}")
+        print("-" * 50)
+        return not mismatches
+
     @staticmethod
     def clean_ole_object_text(text):
         """
@@ -1,24 +1,25 @@
 import os
+import copy
 import pandas as pd
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from ReportGenerator import ReportGenerator
-from ChecksPPE import ProjectCheckerPPE
-from ChecksSSP import ProjectCheckerSSP
-from ChecksSDV01 import ProjectCheckerSDV01
+from CheckRegistry import CheckRegistry
+from HelperFunc import HelperFunctions
 import sys
 from utils import get_exe_directory
 
 
 class CheckConfiguration:
     """Holds configuration and constants for checks."""
-    IMPORT_CHECK = 0
-    EXPORT_CHECK = 1
+    IMPORT_CHECK = CheckRegistry.IMPORT
+    EXPORT_CHECK = CheckRegistry.EXPORT
 
     PROJECT = {
-        "PPE_MLBW": "PPE/MLBW",
-        "SSP": "SSP",
-        "SDV01": "SDV01",
+        "PPE_MLBW": CheckRegistry.PPE,
+        "SSP": CheckRegistry.SSP,
+        "SDV01": CheckRegistry.SDV01,
     }
 
     @staticmethod
@@ -34,9 +35,10 @@ class CheckConfiguration:
         cls.EXTRACT_FOLDER = os.path.join(base_dir, "extract")
         cls.EXCEL_FOLDER = os.path.join(base_dir, "excel")
         cls.REPORT_FOLDER = os.path.join(base_dir, "report")
+        cls.CACHE_FOLDER = os.path.join(base_dir, "cache")
 
         # Create all folders
-        for folder in [cls.EXTRACT_FOLDER, cls.EXCEL_FOLDER, cls.REPORT_FOLDER]:
+        for folder in [cls.EXTRACT_FOLDER, cls.EXCEL_FOLDER, cls.REPORT_FOLDER, cls.CACHE_FOLDER]:
             os.makedirs(folder, exist_ok=True)
             
         return cls.EXTRACT_FOLDER, cls.EXCEL_FOLDER, cls.REPORT_FOLDER
@@ -51,7 +53,11 @@ class CheckConfiguration:
 class ChecksProcessor:
     """Main processor for Excel file Checks."""
 
-    def __init__(self, project_type, check_type, excel_folder, compare_file=None, report_type="HTML", cr_numbers=None):
+    # Processor copy of a check worker process, set by _init_worker
+    _worker = None
+
+    def __init__(self, project_type, check_type, excel_folder, compare_file=None, report_type="HTML", cr_numbers=None,
+                 dataframes=None, max_workers=1):
         self.project = project_type
         self.check_type = check_type
         self.report_folder = CheckConfiguration.REPORT_FOLDER
@@ -60,6 +66,17 @@ class ChecksProcessor:
         self.compare_file = compare_file
         self.cr_numbers = cr_numbers  # List of CR numbers for Check Nr.13/11 TSV generation
         self.compare_df = None  # Dataframe to hold compare file data
+        self.plan = None  # Checks of this run with their shared intermediates, see CheckRegistry
+        # Converted modules handed over in memory by ReqIF2ExcelProcessor
+        # ({Excel file name: DataFrame}); None reads the Excel files from excel_folder
+        self.dataframes = dataframes
+        # Worker processes for process_folder: 1 checks the files one after another,
+        # None uses all CPU cores
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Only the columns declared by the selected checks are loaded
+        self.columns, self.compare_columns = self._required_columns()
+        # Highlighted text differences are cached here across reports and runs
+        self.diff_cache_folder = getattr(CheckConfiguration, 'CACHE_FOLDER', None)
 
         # if compare_file is provided, read it into a DataFrame
         if self.compare_file:
@@ -67,26 +84,85 @@ class ChecksProcessor:
                 if self.compare_file.lower().endswith('.csv'):
                     for enc in ('utf-8', 'utf-16', 'latin-1'):
                         try:
-                            self.compare_df = pd.read_csv(self.compare_file,
-                                                          keep_default_na=False,
-                                                          na_values=[''],
-                                                          sep=None,
-                                                          engine='python',
-                                                          encoding=enc)
+                            self.compare_df = self._read_columns(pd.read_csv,
+                                                                 self.compare_file,
+                                                                 self.compare_columns,
+                                                                 keep_default_na=False,
+                                                                 na_values=[''],
+                                                                 sep=None,
+                                                                 engine='python',
+                                                                 encoding=enc)
                             break
                         except UnicodeDecodeError:
                             continue
                 else:
-                    self.compare_df = pd.read_excel(self.compare_file,
-                                                    keep_default_na=False,
-                                                    na_values=[''])
-
+                    self.compare_df = self._read_columns(pd.read_excel,
+                                                         self.compare_file,
+                                                         self.compare_columns,
+                                                         keep_default_na=False,
+                                                         na_values=[''])
+
+                # Canonical ID keys for the joins of the compare checks
+                self.compare_df = HelperFunctions.add_id_keys(self.compare_df)
                 print(
                     f"Compare file '{self.compare_file}' loaded successfully.")
             except Exception as e:
                 print(f"Error loading compare file '{self.compare_file}': {e}")
                 self.compare_df = None
 
+        self.plan = CheckRegistry.plan(self.project, self.check_type, self.compare_df, self.compare_file,
+                                       self.cr_numbers)
+
+    def _required_columns(self):
+        """
+        Union of the columns declared by the checks that apply to this run.
+
+        Returns:
+            tuple: (customer file columns, compare file columns) as sets
+        """
+        columns = set()
+        compare_columns = set()
+        for definition in CheckRegistry.select(self.project, self.check_type,
+                                               with_compare=bool(self.compare_file),
+                                               with_cr_numbers=bool(self.cr_numbers)):
+            columns.update(definition.columns)
+            compare_columns.update(definition.compare_columns)
+        return columns, compare_columns
+
+    @staticmethod
+    def _keeps_row_values(df):
+        """
+        Check whether df.iterrows() returns the cell values unchanged. Rows of a
+        table without any text column but with mixed dtypes are upcast (int -> float),
+        so such a projection has to keep the remaining columns.
+        """
+        dtypes = set(df.dtypes)
+        return len(dtypes) <= 1 or any(dtype == object for dtype in dtypes)
+
+    @classmethod
+    def _read_columns(cls, read, path, columns, **kwargs):
+        """
+        Read only the given columns of a table file.
+
+        Args:
+            read (callable): pd.read_excel or pd.read_csv
+            path (str): File to read
+            columns (set): Columns to load; columns missing in the file are ignored
+            **kwargs: Passed on to read
+
+        Returns:
+            DataFrame: The projected table
+        """
+        df = read(path, usecols=lambda col: col in columns, **kwargs)
+        if not cls._keeps_row_values(df):
+            df = read(path, **kwargs)
+        return df
+
+    def _project(self, df):
+        """Drop the columns of an in-memory table that no selected check reads."""
+        projected = df[[col for col in df.columns if col in self.columns]]
+        return projected if self._keeps_row_values(projected) else df
+
     def process_folder(self):
         """Process all Excel files in the specified folder."""
         # Create a project-specific, timestamped report folder so that
@@ -102,134 +178,94 @@ class ChecksProcessor:
             CheckConfiguration.REPORT_FOLDER, project_name_fs, timestamp
         )
         os.makedirs(self.report_folder, exist_ok=True)
+        # Texts of an earlier run in this process (e.g. from the GUI) are not reused
+        HelperFunctions.text_cache.clear()
 
-        reports = []
-        for file_name in os.listdir(self.folder_path):
-            if file_name.endswith('.xlsx'):
-                file_path = os.path.join(self.folder_path, file_name)
-                report = self._process_file(file_path)
-                reports.append(report)
+        if self.dataframes is not None:
+            # File paths are kept for report names and module matching only
+            tasks = [(os.path.join(self.folder_path, file_name), self._project(df))
+                     for file_name, df in sorted(self.dataframes.items())]
+        else:
+            tasks = [(os.path.join(self.folder_path, file_name), None)
+                     for file_name in os.listdir(self.folder_path)
+                     if file_name.endswith('.xlsx')]
 
+        try:
+            if self.max_workers <= 1 or len(tasks) <= 1:
+                reports = [self._process_file(file_path, df) for file_path, df in tasks]
+                HelperFunctions.text_cache.log_statistics()
+                if ReportGenerator.diff_cache is not None:
+                    ReportGenerator.diff_cache.log_statistics()
+                return reports
+            return self._process_parallel(tasks)
+        finally:
+            HelperFunctions.text_cache.clear()
+
+    def _process_parallel(self, tasks):
+        """
+        Check the files in worker processes.
+
+        Every worker gets a copy of this processor (with the compare file data and
+        the check plan) once at start-up, so only the file path or module table is
+        sent per task. The shared intermediates of the plan are rebuilt in every worker. The
+        largest files are scheduled first so they do not end up running alone at the end.
+
+        Args:
+            tasks (list): (file path, DataFrame or None) per file
+
+        Returns:
+            list: Reports in the order of tasks
+        """
+        def task_size(task):
+            file_path, df = task
+            if df is not None:
+                return df.size
+            return os.path.getsize(file_path)
+
+        order = sorted(range(len(tasks)), key=lambda i: task_size(tasks[i]), reverse=True)
+        worker = copy.copy(self)
+        worker.dataframes = None  # Sent per task, not to every worker
+
+        reports = [None] * len(tasks)
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks)),
+                                 initializer=ChecksProcessor._init_worker,
+                                 initargs=(worker,)) as executor:
+            futures = {executor.submit(ChecksProcessor._process_in_worker, *tasks[i]): i
+                       for i in order}
+            for future in as_completed(futures):
+                reports[futures[future]] = future.result()
         return reports
 
-    def _process_file(self, file_path):
-        """Process a single Excel file."""
-        # Read Excel file with special handling of missing values:
-        #   - keep_default_na=False: Preserves strings like 'n/a', 'N/A', 'NA' as actual strings instead of converting them to NaN
-        #   - na_values=['']: Only treats completely empty cells as missing values (NaN)
-        # Read Excel file: preserve 'n/a' as string (keep_default_na=False) and only treat empty cells as NaN (na_values=[''])
-        df = pd.read_excel(file_path, keep_default_na=False, na_values=[''])
-        findings = []
-
-        # Select Project
-        if self.project == CheckConfiguration.PROJECT["PPE_MLBW"]:
-            # Select checks based on type
-            # Import check AUDI ==> BOSCH
-            if self.check_type == CheckConfiguration.IMPORT_CHECK:
-                findings = (
-                        # Check Nr.1
-                        ProjectCheckerPPE.check_empty_object_id_with_forbidden_cr_status(
-                            df, file_path) +
-
-                        # Check Nr.3
-                        ProjectCheckerPPE.check_cr_status_bosch_ppx_conditions(
-                            df, file_path) +
-
-                        # Check Nr.4
-                        ProjectCheckerPPE.check_anlaufkonfiguration_empty(
-                            df, file_path) +
-
-                        # Check Nr.8
-                        ProjectCheckerPPE.check_required_attributes_not_empty(
-                            df, file_path) +
-
-                        # Check Nr.10
-                        ProjectCheckerPPE.check_cr_status_bosch_ppx_015_and_brs_status_not_abgestimmt(
-                            df, file_path)
-                )
-                if self.compare_df is not None:
-                    # Check Nr.5
-                    findings += ProjectCheckerPPE.compare_cr_id_and_brs_status_by_object_id(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # Check Nr.6
-                    findings += ProjectCheckerPPE.check_object_text_with_status_hersteller_bosch_ppx(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # Check Nr.9
-                    findings += ProjectCheckerPPE.check_new_requirements_without_cr_id(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # Check Nr.11 – CR Number TSV (only when CR numbers were provided)
-                    if self.cr_numbers:
-                        for cr in self.cr_numbers:
-                            findings += ProjectCheckerPPE.check_cr_number_status(
-                                df, self.compare_df, file_path, self.compare_file,
-                                cr, self.report_folder)
-
-                    # Check Nr.7
-                    findings += ProjectCheckerPPE.check_object_text_with_rb_as_status(
-                        df, self.compare_df, file_path, self.compare_file)
-
-            else:
-                # Export check BOSCH ==> AUDI
-                findings = (
-                        ProjectCheckerPPE.check_cr_id_with_typ_and_brs_1box_status_zulieferer_bosch_ppx(
-                            df, file_path)
-                        +
-                        ProjectCheckerPPE.check_typ_with_brs_1box_status_zulieferer_bosch_ppx(
-                            df, file_path)
-                )
-        elif self.project == CheckConfiguration.PROJECT["SSP"]:
-            if self.check_type == CheckConfiguration.IMPORT_CHECK:
-                # Here implement check 1 - 5
-                if self.compare_df is not None:
-                    # check 6
-                    findings += ProjectCheckerSSP.check_object_text_with_status_oem_zu_lieferant_r(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # check 8
-                    findings += ProjectCheckerSSP.check_multiple_attributes_with_status_oem_zu_lieferant_r(
-                        df, self.compare_df, file_path, self.compare_file)
-                    
-                    #check 9
-                    findings += ProjectCheckerSSP.check_quelle_with_status_oem_zu_lieferant_r(
-                        df, self.compare_df, file_path, self.compare_file)
-                    
-                    #check 10
-                    findings += ProjectCheckerSSP.check_text_differences_without_status_validation(
-                        df, self.compare_df, file_path, self.compare_file)
-                    
-                    #check 11
-                    findings += ProjectCheckerSSP.check_rb_update_for_changed_requirements(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # check 12
-                    findings += ProjectCheckerSSP.check_missing_object_ids_from_bosch(
-                        df, self.compare_df, file_path, self.compare_file)
-
-                    # check 13 – CR Number TSV (only when CR numbers were provided)
-                    if self.cr_numbers:
-                        for cr in self.cr_numbers:
-                            findings += ProjectCheckerSSP.check_cr_number_status(
-                                df, self.compare_df, file_path, self.compare_file,
-                                cr, self.report_folder)
-            else:
-                # Export check BOSCH ==> AUDI
-                print("[SSP] NO EXPORT CHECKS DEFINED SOFAR")
-        elif self.project == CheckConfiguration.PROJECT["SDV01"]:
-            # SDV01 uses its own checker class;
-            if self.check_type == CheckConfiguration.IMPORT_CHECK:
-                findings = ProjectCheckerSDV01.import_checks(
-                    df, file_path, self.compare_df, self.compare_file,
-                    self.cr_numbers, self.report_folder
-                )
-            else:
-                findings = ProjectCheckerSDV01.export_checks(
-                    df, file_path, self.compare_df, self.compare_file
-                )
+    @staticmethod
+    def _init_worker(processor):
+        """Keep the processor of a worker process for its tasks."""
+        ChecksProcessor._worker = processor
+
+    @staticmethod
+    def _process_in_worker(file_path, df):
+        """Check one file inside a worker process."""
+        report = ChecksProcessor._worker._process_file(file_path, df)
+        HelperFunctions.text_cache.log_statistics()  # Caches of this worker so far
+        if ReportGenerator.diff_cache is not None:
+            ReportGenerator.diff_cache.log_statistics()
+        return report
+
+    def _process_file(self, file_path, df=None):
+        """Process a single Excel file, or the DataFrame converted from it."""
+        if df is None:
+            # Read Excel file with special handling of missing values:
+            #   - keep_default_na=False: Preserves strings like 'n/a', 'N/A', 'NA' as actual strings instead of converting them to NaN
+            #   - na_values=['']: Only treats completely empty cells as missing values (NaN)
+            # Read Excel file: preserve 'n/a' as string (keep_default_na=False) and only treat empty cells as NaN (na_values=[''])
+            # Only the columns used by the selected checks are loaded (usecols)
+            df = self._read_columns(pd.read_excel, file_path, self.columns,
+                                    keep_default_na=False, na_values=[''])
+        # Canonical ID keys, matched against those of the compare file
+        df = HelperFunctions.add_id_keys(df)
+        findings = self.plan.run(df, file_path, self.report_folder)
 
         # Generate report
+        ReportGenerator.use_diff_cache(self.diff_cache_folder)
         if self.cr_numbers:
             cr_safe = '_'.join(
                 cr.replace('/', '_').replace('\\', '_').replace(' ', '_')
@@ -1,5 +1,6 @@
 import sys
 import os
+import multiprocessing
 from ImportExportChecks import CheckConfiguration
 import webbrowser
 import tempfile
@@ -282,6 +283,13 @@ class ImportExportGui:
                             style='TRadiobutton').grid(row=0, column=2, padx=10,
                                                        sticky="w")
 
+            # Paged HTML Report Radio Button (for modules with very many findings)
+            ttk.Radiobutton(self.report_type_frame, text="HTML (paged)",
+                            variable=self.report_type_var,
+                            value="Paged HTML",
+                            style='TRadiobutton').grid(row=0, column=3, padx=10,
+                                                       sticky="w")
+
             # Status bar
             self.status_bar = ttk.Label(master, text="", relief=tk.SUNKEN,
                                         anchor=tk.W, font=("Helvetica", 10))
@@ -379,8 +387,9 @@ class ImportExportGui:
             logger.info(f"Starting conversion of files from: {reqif_folder}")
             
             # Process files
-            self.processor = ReqIF2ExcelProcessor(reqif_folder, self.extract_folder, self.excel_folder)
-            self.processor.process()
+            self.processor = ReqIF2ExcelProcessor(reqif_folder, self.extract_folder, self.excel_folder,
+                                                  cache_folder=CheckConfiguration.CACHE_FOLDER)
+            self.processor.process(progress_callback=self.conversion_progress)
             
             logger.info("Conversion completed successfully")
             self.execute_button.config(state=tk.NORMAL)
@@ -392,6 +401,12 @@ class ImportExportGui:
             messagebox.showerror("Error", error_msg)
             self.status_bar.config(text="Error during conversion")
 
+    def conversion_progress(self, done, total, file, error):
+        """Show the conversion progress in the status bar"""
+        state = "failed" if error else "converted"
+        self.update_status_bar(f"[{done}/{total}] {os.path.basename(file)} {state}")
+        self.master.update_idletasks()
+
     def execute_checks(self):
         """Execute checks without progress bar"""
         try:
@@ -422,8 +437,14 @@ class ImportExportGui:
                     return
             logger.debug(f"CR numbers: {cr_numbers}")
 
+            # Reuse the tables of the last conversion instead of re-reading the Excel files
+            dataframes = None
+            if getattr(self, 'processor', None) is not None and self.processor.dataframes:
+                dataframes = self.processor.dataframes
+
             processor = ChecksProcessor(project_type, check_type, self.excel_folder,
-                                     reference_file, report_type, cr_numbers)
+                                     reference_file, report_type, cr_numbers, dataframes,
+                                     max_workers=None)
             reports = processor.process_folder()
             
             logger.info(f"Processed {len(reports)} files")
@@ -606,4 +627,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the conversion worker processes in the frozen executable
+    multiprocessing.freeze_support()
     main()
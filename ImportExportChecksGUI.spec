@@ -103,6 +103,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('icons', 'icons'),  # Icon files for the application
+        ('ReportGenerator_paged.js', '.'),  # Script of the paged HTML report
         # Add any additional data files here
     ],
     hiddenimports=[
@@ -0,0 +1,141 @@
+import os
+import re
+from bisect import bisect_left
+import pandas as pd
+
+
+class ModuleNameIndex:
+    """
+    Sorted index of the DOORS module names of a compare (tracking) file.
+
+    Module names are normalised once: the last path segment without its AS_NNN_
+    prefix, with spaces, underscores and dots treated as equivalent. A customer
+    module matches every key it is a prefix of, or, as a fallback for differing
+    descriptions, every key that starts with its LAH ID. Keys sharing a prefix
+    are adjacent in sorted order, so a lookup is a binary search plus the matches.
+    """
+
+    _FILENAME_PATTERN = re.compile(r'^(?P<base>.+?)_[0-9a-fA-F]+_local_conversion\.xlsx$', re.IGNORECASE)
+    # ID-only fallback: just the LAH code (e.g. "LAH.000.900.CM"), stops before first "_"
+    _LAH_ID_PATTERN = re.compile(r'^(LAH[A-Za-z0-9.]+)', re.IGNORECASE)
+
+    def __init__(self, modulenames, case_insensitive=True):
+        """
+        Build the index.
+
+        Args:
+            modulenames (iterable): 'Modulename' values in row order; empty cells
+                                    belong to no module and are listed in unassigned
+            case_insensitive (bool, optional): Ignore case when matching. Defaults to True.
+        """
+        self.case_insensitive = case_insensitive
+        self.unassigned = []  # Row positions without a module name
+        positions = {}  # normalised key -> [row positions]
+        keys = {}  # module name -> normalised key; every module spans many rows
+        for position, modulename in enumerate(modulenames):
+            if pd.isna(modulename) or not str(modulename).strip():
+                self.unassigned.append(position)
+                continue
+            text = str(modulename)
+            key = keys.get(text)
+            if key is None:
+                key = keys[text] = self.normalize(self.module_key(text), case_insensitive)
+            positions.setdefault(key, []).append(position)
+        self.keys = sorted(positions)
+        self._positions = [positions[key] for key in self.keys]
+
+    @staticmethod
+    def normalize(name, case_insensitive=True):
+        """Dots, spaces and underscores are equivalent; case is ignored by default."""
+        name = name.strip()
+        name = re.sub(r'[ _.]', '.', name)
+        name = re.sub(r'\.{2,}', '.', name)
+        return name.lower() if case_insensitive else name
+
+    @staticmethod
+    def module_key(modulename):
+        """Take last path segment and strip leading AS_NNN_ prefix."""
+        segment = str(modulename).strip().split('/')[-1]
+        segment = re.sub(r'^[A-Z]+_\d+_', '', segment)
+        return segment.strip()
+
+    @staticmethod
+    def source_module(file_path):
+        """
+        Module name of a customer file.
+
+        Args:
+            file_path (str): Path of the converted customer file
+
+        Returns:
+            str: The module name, None when the file name does not follow the
+                 <ModuleName>_<hex>_local_conversion.xlsx pattern
+        """
+        match = ModuleNameIndex._FILENAME_PATTERN.match(os.path.basename(file_path))
+        return match.group('base') if match else None
+
+    def _prefix_range(self, prefix):
+        """Range of the keys starting with prefix."""
+        start = bisect_left(self.keys, prefix)
+        end = start
+        while end < len(self.keys) and self.keys[end].startswith(prefix):
+            end += 1
+        return range(start, end)
+
+    def _prefixes(self, source_module):
+        """Normalised source module and its LAH ID prefix (None without LAH ID)."""
+        source_norm = self.normalize(source_module, self.case_insensitive)
+        id_match = self._LAH_ID_PATTERN.match(source_module)
+        # Require a separator after the ID
+        lah_id_norm = (self.normalize(id_match.group(1), self.case_insensitive) + '.') if id_match else None
+        return source_norm, lah_id_norm
+
+    def rows(self, source_module):
+        """
+        Row positions of all module names matching a customer module, by prefix
+        or by LAH ID.
+
+        Args:
+            source_module (str): Module name of the customer file (see source_module)
+
+        Returns:
+            list: Row positions in file order, empty when nothing matches
+        """
+        matched = set()
+        for prefix in self._prefixes(source_module):
+            if prefix is not None:
+                matched.update(self._prefix_range(prefix))
+        return sorted(position for i in matched for position in self._positions[i])
+
+    def rows_where(self, predicate):
+        """
+        Row positions of all keys for which predicate(key) is true (a scan over the
+        distinct keys, e.g. for substring searches).
+
+        Args:
+            predicate (callable): Test on the normalised key
+
+        Returns:
+            list: Row positions in file order
+        """
+        return sorted(position for key, positions in zip(self.keys, self._positions) if predicate(key)
+                      for position in positions)
+
+    def first_match(self, source_module):
+        """
+        First row (in file order) whose module name starts with the customer
+        module; the LAH ID is only used when there is no such row.
+
+        Args:
+            source_module (str): Module name of the customer file
+
+        Returns:
+            int: Row position, None when nothing matches
+        """
+        for prefix in self._prefixes(source_module):
+            if prefix is None:
+                continue
+            positions = [self._positions[i][0] for i in self._prefix_range(prefix)]
+            if positions:
+                return min(positions)
+        return None
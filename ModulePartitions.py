@@ -0,0 +1,48 @@
+from ModuleNameIndex import ModuleNameIndex
+
+
+class ModulePartitions:
+    """
+    The rows of a multi-module compare (tracking) file, grouped by DOORS module.
+
+    Every customer file is one module, named <ModuleName>_<hex>_local_conversion.xlsx
+    by the converter. The compare file lists the module of each row in 'Modulename';
+    the rows of a customer module are looked up in a ModuleNameIndex. Rows without
+    a module name cannot be assigned and belong to every partition.
+    """
+
+    MODULE_COLUMN = 'Modulename'
+
+    def __init__(self, compare_df, module_index=None):
+        """
+        Prepare the partitions.
+
+        Args:
+            compare_df (DataFrame): The loaded compare file with a 'Modulename' column
+            module_index (ModuleNameIndex, optional): Prebuilt index of its 'Modulename' column
+        """
+        self.df = compare_df
+        self.module_index = module_index or ModuleNameIndex(compare_df[self.MODULE_COLUMN].tolist())
+        self._subsets = {}  # source module -> DataFrame or None
+
+    def subset(self, file_path):
+        """
+        Compare file rows of the module of a customer file plus the rows without a
+        module name, in file order and with the original index (so reported row
+        numbers stay the same).
+
+        Args:
+            file_path (str): Path of the customer file
+
+        Returns:
+            DataFrame: The rows of the module, None when no module matches
+        """
+        source_module = ModuleNameIndex.source_module(file_path)
+        if source_module is None:
+            return None
+        if source_module not in self._subsets:
+            positions = self.module_index.rows(source_module)
+            if positions:
+                positions = sorted(positions + self.module_index.unassigned)
+            self._subsets[source_module] = self.df.iloc[positions] if positions else None
+        return self._subsets[source_module]
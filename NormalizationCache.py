@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from logger_config import logger
+
+
+class NormalizationCache:
+    """
+    Least recently used cache of normalised texts, keyed by
+    (normalisation profile, raw text).
+
+    The checks normalise the same requirement texts over and over (every
+    check comparing the same text pair, the Bosch side again for every
+    customer file). The cache lives for the whole run and is bounded by the
+    number of characters it holds, not by the number of entries, because
+    requirement texts range from a few characters to many kilobytes.
+    """
+
+    # Per-entry overhead in characters (key tuple, dict slot), so that many
+    # tiny entries also count against the bound
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self, max_chars=32_000_000):
+        """
+        Create an empty cache.
+
+        Args:
+            max_chars (int, optional): Upper bound for the characters of all cached
+                                       raw and normalised texts
+        """
+        self.max_chars = max_chars
+        self._entries = OrderedDict()  # (profile, text) -> normalised text
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, profile, text, normalize):
+        """
+        Normalised text from the cache, computed with normalize on a miss.
+
+        Args:
+            profile (str): Name of the normalisation pipeline
+            text (str): Raw text
+            normalize (callable): Pipeline called as normalize(text, profile) on a miss
+
+        Returns:
+            str: The normalised text
+        """
+        key = (profile, text)
+        entries = self._entries
+        try:
+            result = entries[key]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = normalize(text, profile)
+        size = len(text) + len(result) + self.ENTRY_OVERHEAD
+        if size > self.max_chars:
+            return result  # Larger than the whole cache, not worth evicting everything
+
+        entries[key] = result
+        self._chars += size
+        while self._chars > self.max_chars:
+            (_, old_text), old_result = entries.popitem(last=False)
+            self._chars -= len(old_text) + len(old_result) + self.ENTRY_OVERHEAD
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop all entries and reset the statistics."""
+        self._entries.clear()
+        self._chars = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def statistics(self):
+        """
+        Usage statistics of the cache.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, entries and chars
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'chars': self._chars,
+        }
+
+    def log_statistics(self):
+        """Write the usage statistics to the log."""
+        stats = self.statistics()
+        logger.info(
+            f"Text normalisation cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.1%}), {stats['evictions']} evictions, "
+            f"{stats['entries']} entries / {stats['chars']} chars")
@@ -1,16 +1,47 @@
 from datetime import datetime
 import html
 import os
+import sys
 from typing import Dict, Any, List
-import difflib
+import json
 import pandas as pd
 from logger_config import logger
 from HelperFunc import HelperFunctions
+from Finding import Finding
+from TextDiff import TextDiff
+from DiffCache import DiffCache
 
 
 class ReportGenerator:
     """Generates reports from validation findings."""
 
+    # Word-then-character diff of the compared texts, see highlight_differences
+    text_diff = TextDiff()
+    # Persistent cache of the highlighted texts, see use_diff_cache
+    diff_cache = None
+    # Version of the HTML _diff_html renders (span classes, escaping); part of the
+    # diff cache key, bump it whenever that markup changes
+    DIFF_HTML_VERSION = 1
+
+    @staticmethod
+    def use_diff_cache(cache_folder, max_bytes=DiffCache.DEFAULT_MAX_BYTES):
+        """
+        Share the highlighted text differences across reports and runs through a
+        DiffCache in cache_folder. Calling it again with the same folder keeps the
+        open cache.
+
+        Args:
+            cache_folder (str): Folder of the cache file; None disables the cache
+            max_bytes (int, optional): Size limit of the cache. Defaults to 256 MiB.
+        """
+        path = os.path.join(cache_folder, DiffCache.FILE_NAME) if cache_folder else None
+        current = ReportGenerator.diff_cache
+        if current is not None and current.path == path:
+            return
+        if current is not None:
+            current.close()
+        ReportGenerator.diff_cache = DiffCache(path, max_bytes) if path else None
+
     @staticmethod
     def generate_report_old(file_path, report_folder, findings):
         """Generate a structured and flexible text report for findings."""
@@ -167,7 +198,10 @@ class ReportGenerator:
     def highlight_differences(text1: str, text2: str) -> tuple[str, str]:
         """
         Highlight the differences between two texts using HTML spans.
-        If one text is missing, the other text is fully highlighted.
+        If one text is missing, the other text is fully highlighted. The texts are
+        compared word by word and then character by character within changed words
+        that are similar (see TextDiff); texts too long for its budget are highlighted as a whole.
+        The result is looked up in the diff cache first when one is in use.
         """
 
         # Ensure we remove any hidden whitespace or special formatting
@@ -214,10 +248,35 @@ class ReportGenerator:
         if text1 == text2:
             return html.escape(text1), html.escape(text2)
 
-        matcher = difflib.SequenceMatcher(None, text1, text2)
+        cache = ReportGenerator.diff_cache
+        if cache is None:
+            return ReportGenerator._diff_html(text1, text2)[0]
+        key = cache.key(text1, text2, f"{ReportGenerator.text_diff.signature()} "
+                                      f"ReportGenerator.diff_html/{ReportGenerator.DIFF_HTML_VERSION}")
+        result = cache.get(key)
+        if result is None:
+            result, timed_out = ReportGenerator._diff_html(text1, text2)
+            # A diff cut short by the time budget depends on the machine load; it
+            # is not cached, so a later run can highlight the texts fully
+            if not timed_out:
+                cache.put(key, result)
+        return result
+
+    @staticmethod
+    def _diff_html(text1, text2):
+        """
+        Highlighted differences of two normalised, different texts.
+
+        Returns:
+            tuple: ((html1, html2), True when the diff hit its time budget)
+        """
+        opcodes, timed_out = ReportGenerator.text_diff.opcodes(text1, text2)
+        if opcodes is None:
+            # Too long to diff within the budget: highlight the texts as a whole
+            return ReportGenerator.highlight_value_difference(text1, text2), False
         result1, result2 = [], []
 
-        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        for op, i1, i2, j1, j2 in opcodes:
             if op == 'equal':
                 result1.append(html.escape(text1[i1:i2]))
                 result2.append(html.escape(text2[j1:j2]))
@@ -229,7 +288,7 @@ class ReportGenerator:
             elif op == 'delete':
                 result1.append(f'<span class="diff-del">{html.escape(text1[i1:i2])}</span>')
 
-        return ''.join(result1), ''.join(result2)
+        return (''.join(result1), ''.join(result2)), timed_out
 
     @staticmethod
     def _generate_summary_section(total_findings, check_counts):
@@ -274,8 +333,8 @@ class ReportGenerator:
         return summary_html
 
     @staticmethod
-    def generate_html_content(file_name, total_issues, summary_content, issues_content):
-        """Generate the complete HTML content."""
+    def _html_head(file_name, extra_style=''):
+        """Start of the HTML document up to the summary section."""
         # Truncate the file name if it's too long
         max_filename_length = 50
         truncated_filename = file_name[:max_filename_length] + "..." if len(
@@ -287,14 +346,21 @@ class ReportGenerator:
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>Analysis Report - {truncated_filename}</title>
             <style>
-                {ReportGenerator.get_html_style()}
+                {ReportGenerator.get_html_style()}{extra_style}
             </style>
         </head>
         <body>
             <div class="container">
                 <h2>📋 Report for the File: {truncated_filename}</h2>
-        {summary_content}
-        {issues_content}
+        """
+
+    # Between the summary section and the issues
+    _HTML_ISSUES_START = "\n        "
+
+    @staticmethod
+    def _html_foot():
+        """End of the HTML document after the issues."""
+        return f"""
                 <div class="footer">
                     Generated by Import/Export Checker | Date: {datetime.now().strftime('%Y-%m-%d')}
                 </div>
@@ -302,101 +368,82 @@ class ReportGenerator:
         </body>
         </html>"""
 
+    @staticmethod
+    def generate_html_content(file_name, total_issues, summary_content, issues_content):
+        """Generate the complete HTML content."""
+        return (ReportGenerator._html_head(file_name) + summary_content
+                + ReportGenerator._HTML_ISSUES_START + issues_content + ReportGenerator._html_foot())
+
+    # Details template -> its lines with their field names, see format_issue
+    _template_lines = {}
+
+    # Field pairs whose values are highlighted against each other in the HTML report
+    _HIGHLIGHTED_TEXTS = ('customer_text', 'bosch_text')
+    _HIGHLIGHTED_VALUES = ('customer_typ', 'bosch_typ')
+
+    @staticmethod
+    def _format_detail_line(line):
+        """HTML of a details line that is not highlighted."""
+        # Highlight "NOT FOUND" status lines in yellow
+        if "Status:" in line and "NOT FOUND" in line:
+            label, _, status = line.partition("Status:")
+            return f'{html.escape(label)}Status: <span class="highlight-warning">{html.escape(status.strip())}</span>'
+        # Replace "nan" with "Empty" for better readability, then escape
+        if "nan" in line.lower():
+            return html.escape(line.replace("nan", "Empty").replace("NaN", "Empty"))
+        return html.escape(line)
+
     @staticmethod
     def format_issue(finding):
         """Format a single issue for the report."""
-        # Extract Check Number and Object ID from finding dict
-        check_number = finding.get('Check Number', 'N/A')
-        object_id = finding.get('Object ID', None)
-        
-        # If Object ID not in dict, try to extract from Value field
-        if object_id is None:
-            value_lines = finding['Value'].split('\n')
-            for line in value_lines:
-                if line.startswith('Object ID:'):
-                    object_id = line.replace('Object ID:', '').strip()
-                    break
-        
-        # Format Object ID for display
-        object_id_display = str(object_id) if object_id else 'N/A'
-        
-        # Extract customer and Bosch texts from the Value string
-        value_lines = finding['Value'].split('\n')
-        customer_text = ""
-        bosch_text = ""
-
-        for i, line in enumerate(value_lines):
-            # Primary pair used by most checks
-            if "Customer File Object Text:" in line:
-                customer_text = line.replace("Customer File Object Text:", "").strip()
-            elif "Bosch File Object Text:" in line:
-                bosch_text = line.replace("Bosch File Object Text:", "").strip()
-            # Fallback for checks that use ReqIF.Text / Object Text wording (e.g. SSP Check Nr.11)
-            elif "Customer File ReqIF.Text:" in line and not customer_text:
-                customer_text = line.replace("Customer File ReqIF.Text:", "").strip()
-            elif "Customer ReqIF.Text:" in line and not customer_text:
-                customer_text = line.replace("Customer ReqIF.Text:", "").strip()
-            elif "Bosch Object Text:" in line and not bosch_text:
-                bosch_text = line.replace("Bosch Object Text:", "").strip()
-
-        # Also extract Typ values for highlighting
-        customer_typ = ""
-        bosch_typ = ""
-        for line in value_lines:
-            if "Customer Typ:" in line:
-                customer_typ = line.replace("Customer Typ:", "").strip()
-            elif "Bosch Typ:" in line:
-                bosch_typ = line.replace("Bosch Typ:", "").strip()
-
-        # Convert None values to empty strings (if needed)
-        customer_text = customer_text if customer_text else ""
-        bosch_text = bosch_text if bosch_text else ""
-
-        # Ensure highlight_differences is always called
-        highlighted_customer, highlighted_bosch = ReportGenerator.highlight_differences(
-            customer_text, bosch_text)
+        check_number = finding.check
+        object_id_display = str(finding.object_id) if finding.object_id else 'N/A'
+
+        # Compared values are taken from the finding fields, highlighted values
+        # replace them in their details lines
+        values = finding.display_values()
+        highlighted = {}
+        customer_field, bosch_field = ReportGenerator._HIGHLIGHTED_TEXTS
+        if customer_field in values or bosch_field in values:
+            highlighted[customer_field], highlighted[bosch_field] = ReportGenerator.highlight_differences(
+                str(values.get(customer_field, "")), str(values.get(bosch_field, "")))
 
         # Highlight Typ differences when both values are present (whole-value, not char-level)
-        highlighted_customer_typ, highlighted_bosch_typ = ("", "")
+        customer_field, bosch_field = ReportGenerator._HIGHLIGHTED_VALUES
+        customer_typ = str(values.get(customer_field, "")).strip()
+        bosch_typ = str(values.get(bosch_field, "")).strip()
         if customer_typ or bosch_typ:
             highlighted_customer_typ, highlighted_bosch_typ = ReportGenerator.highlight_value_difference(
                 customer_typ, bosch_typ)
+            if highlighted_customer_typ:
+                highlighted[customer_field] = highlighted_customer_typ
+            if highlighted_bosch_typ:
+                highlighted[bosch_field] = highlighted_bosch_typ
 
-        # Replace the original texts in value_lines with highlighted versions.
-        # Lines that receive highlighted HTML are left as-is (already safe).
-        # All other lines are HTML-escaped so that characters like < and > in
-        # raw text values (e.g. "<OR: embedded object ...>") cannot break the HTML.
-        for i, line in enumerate(value_lines):
-            if "Customer File Object Text:" in line:
-                value_lines[i] = f"       Customer File Object Text: {highlighted_customer}"
-            elif "Bosch File Object Text:" in line:
-                value_lines[i] = f"       Bosch File Object Text: {highlighted_bosch}"
-            # Also support highlighting for ReqIF.Text / Object Text lines (e.g. SSP Check Nr.11)
-            elif "Customer File ReqIF.Text:" in line and customer_text:
-                value_lines[i] = f"       Customer File ReqIF.Text: {highlighted_customer}"
-            elif "Customer ReqIF.Text:" in line and customer_text:
-                value_lines[i] = f"       Customer ReqIF.Text: {highlighted_customer}"
-            elif "Bosch Object Text:" in line and bosch_text:
-                value_lines[i] = f"       Bosch Object Text: {highlighted_bosch}"
-            # Highlight Typ differences
-            elif "Customer Typ:" in line and highlighted_customer_typ:
-                value_lines[i] = f"       Customer Typ: {highlighted_customer_typ}"
-            elif "Bosch Typ:" in line and highlighted_bosch_typ:
-                value_lines[i] = f"       Bosch Typ: {highlighted_bosch_typ}"
-            # Highlight "NOT FOUND" status lines in yellow
-            elif "Status:" in line and "NOT FOUND" in line:
-                label, _, status = line.partition("Status:")
-                value_lines[i] = f'{html.escape(label)}Status: <span class="highlight-warning">{html.escape(status.strip())}</span>'
-            # Replace "nan" with "Empty" for better readability, then escape
-            elif "nan" in line.lower():
-                value_lines[i] = html.escape(line.replace("nan", "Empty").replace("NaN", "Empty"))
+        template = finding.text_template
+        template_lines = ReportGenerator._template_lines.get(template)
+        if template_lines is None:
+            template_lines = [(line, Finding.fields(line)) for line in template.split('\n')]
+            ReportGenerator._template_lines[template] = template_lines
+
+        # Lines with a highlighted value get the highlighted HTML (already safe);
+        # all other lines are HTML-escaped so that characters like < and > in raw
+        # text values (e.g. "<OR: embedded object ...>") cannot break the HTML.
+        value_lines = []
+        for line, names in template_lines:
+            highlighted_names = [name for name in names if name in highlighted]
+            if highlighted_names:
+                escaped = {name: html.escape(str(value)) for name, value in values.items()}
+                escaped.update((name, highlighted[name]) for name in highlighted_names)
+                value_lines.append(line.format_map(escaped))
             else:
-                value_lines[i] = html.escape(line)
+                value_lines.extend(ReportGenerator._format_detail_line(text)
+                                   for text in line.format_map(values).split('\n'))
 
         formatted_value = "<br>".join(value_lines)
 
         # Build header with Check Number and Object ID
-        is_info = finding.get('Type') == 'info'
+        is_info = finding.severity == Finding.INFO
         icon = "ℹ️" if is_info else "⚠️"
         css_class = "issue-info" if is_info else "issue"
 
@@ -405,15 +452,15 @@ class ReportGenerator:
             header_parts.append(f"{icon} Check {check_number}")
         else:
             header_parts.append(icon)
-        header_parts.append(f"Row: {finding['Row']}")
+        header_parts.append(f"Row: {finding.row}")
         if object_id_display != 'N/A':
             header_parts.append(f"Object ID: {object_id_display}")
         header_text = " | ".join(header_parts)
 
         return f"""        <div class="{css_class}">
                        <h2>{header_text}</h2>
-                       <p><strong>Attributes:</strong> {finding['Attribute']}</p>
-                       <p><strong>Check:</strong> {finding['Issue']}</p>
+                       <p><strong>Attributes:</strong> {finding.attribute}</p>
+                       <p><strong>Check:</strong> {finding.issue}</p>
                        <p><strong>Details:</strong></p>
                        <div class="code-block">{formatted_value}</div>
                    </div>"""
@@ -423,7 +470,8 @@ class ReportGenerator:
         logger.debug(f"Generating Excel report with {len(findings)} findings")
         try:
             report_file = os.path.join(report_folder, f"{os.path.basename(file_path).replace('.xlsx', '')}{suffix}_report.xlsx")
-            df = pd.DataFrame(findings)
+            # The details texts are rendered here, one row per finding
+            df = pd.DataFrame([dict(finding) for finding in findings])
             df = df.rename(columns={'Value': 'Details'})
             
             # Reorder columns to put Check Number and Object ID first if they exist
@@ -456,13 +504,14 @@ class ReportGenerator:
             base_name = os.path.basename(file_path).replace('.xlsx', '')
             report_file = os.path.join(report_folder, f"{base_name}{suffix}_report.html")
 
-            # Calculate per-check counts (exclude informational findings)
+            # Calculate per-check counts (exclude informational findings) in a first
+            # pass, the summary precedes the issues
             check_counts = {}
             real_findings_count = 0
             for finding in findings:
-                if finding.get('Type') == 'info':
+                if finding.severity == Finding.INFO:
                     continue
-                check_num = finding.get('Check Number', 'N/A')
+                check_num = finding.check
                 check_counts[check_num] = check_counts.get(check_num, 0) + 1
                 real_findings_count += 1
 
@@ -472,21 +521,17 @@ class ReportGenerator:
                 check_counts=check_counts
             )
 
-            # Generate issues content
-            issues_content = "\n".join(
-                ReportGenerator.format_issue(finding) for finding in findings)
-
-            # Generate the complete HTML content
-            html_content = ReportGenerator.generate_html_content(
-                file_name=os.path.basename(file_path),
-                total_issues=len(findings),
-                summary_content=summary_content,
-                issues_content=issues_content
-            )
-
-            # Write the report
+            # Write the report: the issues are formatted and written one at a time,
+            # so only one of them is held in memory however many findings there are
             with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(ReportGenerator._html_head(os.path.basename(file_path)))
+                f.write(summary_content)
+                f.write(ReportGenerator._HTML_ISSUES_START)
+                for position, finding in enumerate(findings):
+                    if position:
+                        f.write("\n")
+                    f.write(ReportGenerator.format_issue(finding))
+                f.write(ReportGenerator._html_foot())
 
             logger.debug(f"HTML report generated successfully: {report_file}")
             return report_file
@@ -495,6 +540,149 @@ class ReportGenerator:
             logger.error(f"Error generating HTML report: {str(e)}", exc_info=True)
             raise
 
+    # Findings shown per page of the paged HTML report
+    PAGED_HTML_PAGE_SIZE = 100
+
+    _PAGED_HTML_STYLE = """
+                   .report-controls {
+                       display: flex;
+                       flex-wrap: wrap;
+                       gap: 10px;
+                       align-items: center;
+                       margin-bottom: 15px;
+                   }
+                   .report-controls select, .report-controls input, .report-controls button {
+                       font-size: 14px;
+                       padding: 4px 8px;
+                   }
+               """
+
+    # Script that renders the pages, bundled next to the modules by ImportExportChecksGUI.spec
+    PAGED_HTML_SCRIPT_FILE = 'ReportGenerator_paged.js'
+    _paged_html_script = None
+
+    @staticmethod
+    def paged_html_script_path():
+        """Path of the paged report script, in the PyInstaller bundle when frozen."""
+        base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(base_path, ReportGenerator.PAGED_HTML_SCRIPT_FILE)
+
+    @staticmethod
+    def paged_html_script():
+        """The paged report script, read once per process."""
+        if ReportGenerator._paged_html_script is None:
+            with open(ReportGenerator.paged_html_script_path(), encoding='utf-8') as f:
+                ReportGenerator._paged_html_script = f.read()
+        return ReportGenerator._paged_html_script
+
+    @staticmethod
+    def _script_json(data):
+        """JSON for a <script> element; '<' is escaped so that no text can close it."""
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+
+    @staticmethod
+    def _paged_record(finding, template_index):
+        """
+        Compact record of a finding for the paged HTML report.
+
+        Args:
+            finding (Finding): The finding
+            template_index (int): Index of its details template in the report
+
+        Returns:
+            list: [check, row, object ID, attribute, issue, info, template, values]
+        """
+        return [str(finding.check), str(finding.row),
+                str(finding.object_id) if finding.object_id else 'N/A',
+                str(finding.attribute), str(finding.issue), int(finding.severity == Finding.INFO),
+                template_index, [str(value) for value in finding.display_values().values()]]
+
+    @staticmethod
+    def generate_paged_html_report(file_path, report_folder, findings, suffix=''):
+        """
+        Generate an HTML report that shows the findings page by page.
+
+        The findings are embedded as a compact JSON dataset (the details templates
+        once, then one record of template fields per finding) instead of one HTML
+        block each; a small script renders only the current page, with a filter by
+        check number and a search by Object ID. Differences are highlighted when a
+        finding is shown, so the report opens at once however many findings it has.
+
+        Args:
+            file_path (str): Path of the checked file
+            report_folder (str): Folder to write the report to
+            findings (list): Finding records
+            suffix (str, optional): Appended to the report name. Defaults to ''.
+
+        Returns:
+            str: Path of the report
+        """
+        logger.debug(f"Generating paged HTML report for {file_path}")
+        try:
+            base_name = os.path.basename(file_path).replace('.xlsx', '')
+            report_file = os.path.join(report_folder, f"{base_name}{suffix}_report.html")
+
+            # First pass: per-check counts (exclude informational findings) and the
+            # details templates, written before the findings
+            check_counts = {}
+            check_numbers = set()
+            templates = {}
+            real_findings_count = 0
+            for finding in findings:
+                templates.setdefault(finding.text_template, len(templates))
+                check_numbers.add(str(finding.check))
+                if finding.severity == Finding.INFO:
+                    continue
+                check_counts[finding.check] = check_counts.get(finding.check, 0) + 1
+                real_findings_count += 1
+
+            summary_content = ReportGenerator._generate_summary_section(
+                total_findings=real_findings_count,
+                check_counts=check_counts
+            )
+            check_options = "".join(
+                f'<option value="{html.escape(check_num)}">{html.escape(check_num)}</option>'
+                for check_num in sorted(check_numbers))
+
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write(ReportGenerator._html_head(os.path.basename(file_path),
+                                                   ReportGenerator._PAGED_HTML_STYLE))
+                f.write(summary_content)
+                f.write(f"""
+                <div class="report-controls">
+                    <select id="report-check"><option value="">All checks</option>{check_options}</select>
+                    <input id="report-search" type="search" placeholder="Search Object ID">
+                    <button id="report-previous" type="button">&laquo; Previous</button>
+                    <span id="report-page"></span>
+                    <button id="report-next" type="button">Next &raquo;</button>
+                </div>
+                <div id="report-issues" data-page-size="{ReportGenerator.PAGED_HTML_PAGE_SIZE}"
+                     data-diff-tokens="{ReportGenerator.text_diff.max_tokens}"
+                     data-diff-cells="{ReportGenerator.text_diff.max_cells}"
+                     data-diff-seconds="{ReportGenerator.text_diff.max_seconds}"
+                     data-diff-ratio="{ReportGenerator.text_diff.min_ratio}"></div>
+                <script type="application/json" id="report-templates">""")
+                f.write(ReportGenerator._script_json(
+                    [[template, Finding.fields(template)] for template in templates]))
+                f.write('</script>\n                <script type="application/json" id="report-findings">[')
+                # One record at a time, as in _generate_html_report
+                for position, finding in enumerate(findings):
+                    if position:
+                        f.write(",\n")
+                    f.write(ReportGenerator._script_json(
+                        ReportGenerator._paged_record(finding, templates[finding.text_template])))
+                f.write(']</script>\n                <script>')
+                f.write(ReportGenerator.paged_html_script())
+                f.write('</script>')
+                f.write(ReportGenerator._html_foot())
+
+            logger.debug(f"Paged HTML report generated successfully: {report_file}")
+            return report_file
+
+        except Exception as e:
+            logger.error(f"Error generating paged HTML report: {str(e)}", exc_info=True)
+            raise
+
     @staticmethod
     def test_ole_object_handling():
         """Test the OLE Object handling with various examples."""
@@ -566,6 +754,122 @@ class ReportGenerator:
             print(f"Test {'PASSED' if result == case['expected_result'] else 'FAILED'}")
             print("-" * 50)
 
+    @staticmethod
+    def test_paged_html_report():
+        """Check that the paged HTML report embeds every finding as readable JSON."""
+        import tempfile
+        findings = [
+            Finding('Nr.10', 2, 'ID-1', attribute='Object Text', issue='Text differs',
+                    template="ID: {id}\nCustomer: {customer_text}\nBosch: {bosch_text}",
+                    id='ID-1', customer_text='a </script> b', bosch_text=float('nan')),
+            Finding('Nr.6', 3, None, attribute='Typ', issue='Typ differs', severity=Finding.INFO,
+                    template="Typ: {customer_typ} / {bosch_typ}", customer_typ='Information',
+                    bosch_typ='Anforderung'),
+        ]
+
+        print("\nTesting paged HTML report:")
+        print("-" * 50)
+        with tempfile.TemporaryDirectory() as folder:
+            report_file = ReportGenerator.generate_paged_html_report('module.xlsx', folder, findings)
+            with open(report_file, encoding='utf-8') as f:
+                content = f.read()
+
+        def embedded(element_id):
+            start = content.index(f'id="{element_id}">') + len(f'id="{element_id}">')
+            return json.loads(content[start:content.index('</script>', start)])
+
+        templates = embedded('report-templates')
+        records = embedded('report-findings')
+        passed = (
+            content.count('</script>') == 3
+            and len(records) == len(findings)
+            and records[0] == ['Nr.10', '2', 'ID-1', 'Object Text', 'Text differs', 0, 0,
+                               ['ID-1', 'a </script> b', 'nan']]
+            and records[1][2] == 'N/A' and records[1][5] == 1
+            and templates[records[1][6]] == [findings[1].text_template, ['customer_typ', 'bosch_typ']]
+        )
+        print(f"Findings: {len(findings)}, embedded records: {len(records)}")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
+
+    @staticmethod
+    def test_paged_html_script_parity():
+        """Check in node that the paged report script formats findings like format_issue."""
+        import shutil
+        import subprocess
+        import tempfile
+        findings = [
+            Finding('Nr.10', 2, 'ID-1', attribute='Object Text', issue='Text differs',
+                    template="ID: {id}\nCustomer: {customer_text}\nBosch: {bosch_text}",
+                    id='ID-1', customer_text='Das System muss <b> größer sein als 42 mm.',
+                    bosch_text='Das System soll größer sein als  43 mm.'),
+            Finding('Nr.10', 3, 'ID-2', attribute='Object Text', issue='Text differs',
+                    template="ID: {id}\nCustomer: {customer_text}\nBosch: {bosch_text}",
+                    id='ID-2', customer_text='a </script> b', bosch_text=float('nan')),
+            Finding('Nr.6', 4, None, attribute='Typ', issue='Typ differs', severity=Finding.INFO,
+                    template="Typ: {customer_typ} / {bosch_typ}", customer_typ='Information',
+                    bosch_typ=' Anforderung '),
+            Finding('Nr.3', 5, 'ID-3', attribute='Release', issue='Release missing',
+                    template="Entfall: {entfall!e}\nRelease: {release!t}", entfall='', release='R1,'),
+            Finding('Nr.10', 6, 'ID-4', attribute='Object Text', issue='Text differs',
+                    template="Customer: {customer_text}\nBosch: {bosch_text}",
+                    customer_text='Status offen, der Motor startet.',
+                    bosch_text='Status abgelehnt, der Sensor startet.'),
+        ]
+
+        print("\nTesting paged HTML report script against format_issue:")
+        print("-" * 50)
+        node = shutil.which('node')
+        if node is None:
+            print("node not found, Test SKIPPED")
+            print("-" * 50)
+            return
+
+        with tempfile.TemporaryDirectory() as folder:
+            report_file = ReportGenerator.generate_paged_html_report('module.xlsx', folder, findings)
+            with open(report_file, encoding='utf-8') as f:
+                content = f.read()
+
+            def embedded(element_id):
+                start = content.index(f'id="{element_id}">') + len(f'id="{element_id}">')
+                return content[start:content.index('</script>', start)]
+
+            attributes = {
+                'data-page-size': str(ReportGenerator.PAGED_HTML_PAGE_SIZE),
+                'data-diff-tokens': str(ReportGenerator.text_diff.max_tokens),
+                'data-diff-cells': str(ReportGenerator.text_diff.max_cells),
+                'data-diff-seconds': str(ReportGenerator.text_diff.max_seconds),
+                'data-diff-ratio': str(ReportGenerator.text_diff.min_ratio),
+            }
+            data = {element_id: embedded(element_id)
+                    for element_id in ('report-templates', 'report-findings')}
+            # A minimal document, enough for the script to render its first page
+            runner = os.path.join(folder, 'parity.js')
+            with open(runner, 'w', encoding='utf-8') as f:
+                f.write(f"""
+const data = {json.dumps(data)};
+const attributes = {json.dumps(attributes)};
+globalThis.document = {{getElementById: (id) => ({{
+    textContent: data[id] || '', value: '', innerHTML: '', offsetTop: 0,
+    getAttribute: (name) => attributes[name], addEventListener: () => {{}}}})}};
+globalThis.window = {{scrollTo: () => {{}}}};
+const paged = require({json.dumps(ReportGenerator.paged_html_script_path())});
+process.stdout.write(JSON.stringify(paged.findings.map(paged.formatIssue)));
+""")
+            result = subprocess.run([node, runner], capture_output=True, encoding='utf-8')
+
+        if result.returncode != 0:
+            print(result.stderr)
+            passed = False
+        else:
+            rendered = json.loads(result.stdout)
+            expected = [ReportGenerator.format_issue(finding) for finding in findings]
+            passed = rendered == expected
+            print(f"Findings: {len(findings)}, rendered alike: "
+                  f"{sum(got == want for got, want in zip(rendered, expected))}")
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
+
     @staticmethod
     def generate_translation_tsv(file_path, report_folder, findings):
         """Generate a TSV file listing requirements that need translation."""
@@ -579,24 +883,15 @@ class ReportGenerator:
             skipped_cases = []  # Track skipped cases for logging
             
             for finding in findings:
-                # Extract the requirement ID and texts from the Value field
-                value_lines = finding['Value'].split('\n')
-                req_id = None
-                customer_text = None
-                bosch_text = None
-                is_foreign_id = False
-                
-                for line in value_lines:
-                    if "ReqIF.ForeignID:" in line:
-                        req_id = line.split(":", 1)[1].strip()
-                        is_foreign_id = True
-                    elif "Object ID:" in line:
-                        req_id = line.split(":", 1)[1].strip()
-                        is_foreign_id = False
-                    elif "Customer File Object Text:" in line:
-                        customer_text = line.split(":", 1)[1].strip()
-                    elif "Bosch File Object Text:" in line:
-                        bosch_text = line.split(":", 1)[1].strip()
+                # The requirement ID and texts of the finding
+                values = finding.display_values()
+                is_foreign_id = 'foreign_id' in values
+                req_id = values.get('foreign_id' if is_foreign_id else 'id')
+                customer_text = values.get('customer_text')
+                bosch_text = values.get('bosch_text')
+                req_id, customer_text, bosch_text = (
+                    None if value is None else str(value).strip()
+                    for value in (req_id, customer_text, bosch_text))
                 
                 # Skip if we couldn't find the requirement ID
                 if not req_id:
@@ -715,15 +1010,7 @@ class ReportGenerator:
             seen_ids = set()
 
             for finding in findings:
-                object_id = finding.get('Object ID')
-                if not object_id:
-                    # Try to parse Object ID from the Value field if missing
-                    value = finding.get('Value', '')
-                    for line in str(value).split('\n'):
-                        if line.strip().startswith("Object ID:"):
-                            object_id = line.split(":", 1)[1].strip()
-                            break
-
+                object_id = finding.object_id
                 if not object_id or object_id in seen_ids:
                     continue
 
@@ -756,6 +1043,8 @@ class ReportGenerator:
             # Generate the main report (HTML or Excel)
             if report_type == 'excel':
                 report_file = ReportGenerator.generate_excel_report(file_path, report_folder, findings, suffix)
+            elif report_type == 'paged html':
+                report_file = ReportGenerator.generate_paged_html_report(file_path, report_folder, findings, suffix)
             else:
                 report_file = ReportGenerator._generate_html_report(file_path, report_folder, findings, suffix)
             report_files.append(report_file)
@@ -764,7 +1053,7 @@ class ReportGenerator:
             # Check Nr. 10 findings can be identified by their specific issue message
             translation_findings = [
                 finding for finding in findings 
-                if finding.get('Issue', '').startswith("'ReqIF.Text' differs from 'Object Text' between files")
+                if finding.issue.startswith("'ReqIF.Text' differs from 'Object Text' between files")
             ]
             
             if translation_findings:
@@ -775,7 +1064,7 @@ class ReportGenerator:
             # Generate RB update TSV only for explicit rb_update findings
             rb_update_findings = [
                 finding for finding in findings
-                if finding.get('Category') == 'rb_update'
+                if finding.category == 'rb_update'
             ]
 
             if rb_update_findings:
@@ -789,3 +1078,7 @@ class ReportGenerator:
         except Exception as e:
             logger.error(f"Error generating report: {str(e)}", exc_info=True)
             raise
+        finally:
+            # Highlighted texts of this report, for the next reports and runs
+            if ReportGenerator.diff_cache is not None:
+                ReportGenerator.diff_cache.flush()
@@ -0,0 +1,299 @@
+// Paged HTML report of ReportGenerator.generate_paged_html_report.
+// Renders the findings of the current page from the embedded JSON dataset. The
+// details are built like in format_issue, including the difference highlighting
+// (ports of TextDiff and difflib.SequenceMatcher), but only for the findings on the page.
+(function () {
+    var templates = JSON.parse(document.getElementById('report-templates').textContent);
+    var findings = JSON.parse(document.getElementById('report-findings').textContent);
+    var container = document.getElementById('report-issues');
+    var checkFilter = document.getElementById('report-check');
+    var idSearch = document.getElementById('report-search');
+    var pageInfo = document.getElementById('report-page');
+    var pageSize = parseInt(container.getAttribute('data-page-size'), 10);
+    var maxTokens = parseInt(container.getAttribute('data-diff-tokens'), 10);
+    var maxCells = parseInt(container.getAttribute('data-diff-cells'), 10);
+    var maxMilliseconds = parseFloat(container.getAttribute('data-diff-seconds')) * 1000;
+    var minRatio = parseFloat(container.getAttribute('data-diff-ratio'));
+    var HIGHLIGHTED_TEXTS = ['customer_text', 'bosch_text'];
+    var HIGHLIGHTED_VALUES = ['customer_typ', 'bosch_typ'];
+    // Whitespace as in Python's str.split() / str.strip()
+    var SPACES = /[\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+/;
+    var LEADING = new RegExp('^' + SPACES.source), TRAILING = new RegExp(SPACES.source + '$');
+    var SPACE = new RegExp('^' + SPACES.source + '$');
+    var FIELD = /\{([^{}]*)\}/g;
+    // Tokens of TextDiff: words, or any other single character
+    var TOKEN = /[\p{L}\p{N}_]+|[^\p{L}\p{N}_]/gu;
+    var selected = [];
+    var page = 0;
+
+    function escape(text) {
+        return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;').replace(/'/g, '&#x27;');
+    }
+
+    function strip(text) {
+        return text.replace(LEADING, '').replace(TRAILING, '');
+    }
+
+    function format(line, values) {
+        return line.replace(FIELD, function (match, name) { return values[name]; });
+    }
+
+    function normalizeText(text) {
+        text = text.replace(/⏐/g, '|').replace(/½/g, '|').replace(/…/g, '...')
+            .replace(/–/g, '-').replace(/—/g, '-');
+        return text.split(SPACES).filter(Boolean).join(' ');
+    }
+
+    // difflib.SequenceMatcher(isjunk, a, b, autojunk).get_opcodes() on arrays
+    function opcodes(a, b, isjunk, autojunk) {
+        var b2j = new Map(), junk = new Set();
+        b.forEach(function (elt, j) {
+            if (!b2j.has(elt)) { b2j.set(elt, []); }
+            b2j.get(elt).push(j);
+        });
+        if (isjunk) {
+            Array.from(b2j.keys()).forEach(function (elt) {
+                if (isjunk(elt)) { junk.add(elt); b2j.delete(elt); }
+            });
+        }
+        if (autojunk && b.length >= 200) {
+            var ntest = Math.floor(b.length / 100) + 1;
+            Array.from(b2j.keys()).forEach(function (elt) {
+                if (b2j.get(elt).length > ntest) { b2j.delete(elt); }
+            });
+        }
+
+        function longestMatch(alo, ahi, blo, bhi) {
+            var besti = alo, bestj = blo, bestsize = 0, j2len = new Map();
+            for (var i = alo; i < ahi; i++) {
+                var newj2len = new Map(), js = b2j.get(a[i]) || [];
+                for (var x = 0; x < js.length; x++) {
+                    var j = js[x];
+                    if (j < blo) { continue; }
+                    if (j >= bhi) { break; }
+                    var k = (j2len.get(j - 1) || 0) + 1;
+                    newj2len.set(j, k);
+                    if (k > bestsize) { besti = i - k + 1; bestj = j - k + 1; bestsize = k; }
+                }
+                j2len = newj2len;
+            }
+            // Extend the match with equal elements, first non-junk, then junk ones
+            [false, true].forEach(function (isJunk) {
+                while (besti > alo && bestj > blo && junk.has(b[bestj - 1]) === isJunk &&
+                       a[besti - 1] === b[bestj - 1]) {
+                    besti--; bestj--; bestsize++;
+                }
+                while (besti + bestsize < ahi && bestj + bestsize < bhi &&
+                       junk.has(b[bestj + bestsize]) === isJunk && a[besti + bestsize] === b[bestj + bestsize]) {
+                    bestsize++;
+                }
+            });
+            return [besti, bestj, bestsize];
+        }
+
+        var queue = [[0, a.length, 0, b.length]], blocks = [];
+        while (queue.length) {
+            var q = queue.pop(), m = longestMatch(q[0], q[1], q[2], q[3]);
+            if (m[2]) {
+                blocks.push(m);
+                if (q[0] < m[0] && q[2] < m[1]) { queue.push([q[0], m[0], q[2], m[1]]); }
+                if (m[0] + m[2] < q[1] && m[1] + m[2] < q[3]) { queue.push([m[0] + m[2], q[1], m[1] + m[2], q[3]]); }
+            }
+        }
+        blocks.sort(function (x, y) { return x[0] - y[0] || x[1] - y[1] || x[2] - y[2]; });
+        var merged = [], i1 = 0, j1 = 0, k1 = 0;
+        blocks.forEach(function (block) {
+            if (i1 + k1 === block[0] && j1 + k1 === block[1]) {
+                k1 += block[2];
+            } else {
+                if (k1) { merged.push([i1, j1, k1]); }
+                i1 = block[0]; j1 = block[1]; k1 = block[2];
+            }
+        });
+        if (k1) { merged.push([i1, j1, k1]); }
+        merged.push([a.length, b.length, 0]);
+
+        var codes = [], i = 0, j = 0;
+        merged.forEach(function (block) {
+            var tag = i < block[0] && j < block[1] ? 'replace' : i < block[0] ? 'delete' : j < block[1] ? 'insert' : '';
+            if (tag) { codes.push([tag, i, block[0], j, block[1]]); }
+            i = block[0] + block[2];
+            j = block[1] + block[2];
+            if (block[2]) { codes.push(['equal', block[0], i, block[1], j]); }
+        });
+        return codes;
+    }
+
+    // TextDiff.opcodes on code point arrays
+    function textDiff(a, b) {
+        var tokens1 = a.join('').match(TOKEN) || [], tokens2 = b.join('').match(TOKEN) || [];
+        if (tokens1.length > maxTokens || tokens2.length > maxTokens) { return null; }
+        var budget = maxCells, deadline = Date.now() + maxMilliseconds, codes = [];
+
+        function offsets(tokens) {
+            var result = [0];
+            tokens.forEach(function (token) { result.push(result[result.length - 1] + Array.from(token).length); });
+            return result;
+        }
+
+        function append(tag, i1, i2, j1, j2) {
+            var last = codes[codes.length - 1];
+            if (last && last[0] === tag) {
+                last[2] = i2; last[4] = j2;
+            } else {
+                codes.push([tag, i1, i2, j1, j2]);
+            }
+        }
+
+        var offsets1 = offsets(tokens1), offsets2 = offsets(tokens2);
+        opcodes(tokens1, tokens2, function (token) { return SPACE.test(token); }, true).forEach(function (code) {
+            var start1 = offsets1[code[1]], end1 = offsets1[code[2]];
+            var start2 = offsets2[code[3]], end2 = offsets2[code[4]];
+            if (code[0] === 'replace') {
+                var cells = (end1 - start1) * (end2 - start2);
+                if (cells <= budget && Date.now() < deadline) {
+                    budget -= cells;
+                    var refined = opcodes(a.slice(start1, end1), b.slice(start2, end2), null, false);
+                    // SequenceMatcher.ratio: only similar spans are refined
+                    var matched = 0;
+                    refined.forEach(function (c) { if (c[0] === 'equal') { matched += c[2] - c[1]; } });
+                    if (2.0 * matched / (end1 - start1 + end2 - start2) >= minRatio) {
+                        refined.forEach(function (c) {
+                            append(c[0], start1 + c[1], start1 + c[2], start2 + c[3], start2 + c[4]);
+                        });
+                        return;
+                    }
+                }
+            }
+            append(code[0], start1, end1, start2, end2);
+        });
+        return codes;
+    }
+
+    // ReportGenerator.highlight_differences
+    function highlightDifferences(text1, text2) {
+        text1 = normalizeText(strip(text1));
+        text2 = normalizeText(strip(text2));
+        if (text1 && !text2) { return ['<span class="diff-del">' + escape(text1) + '</span>', '<span class="diff-add">Empty</span>']; }
+        if (text2 && !text1) { return ['<span class="diff-del">Empty</span>', '<span class="diff-add">' + escape(text2) + '</span>']; }
+        if (text1 === text2) { return [escape(text1), escape(text2)]; }
+        var a = Array.from(text1), b = Array.from(text2), result1 = [], result2 = [];
+        var codes = textDiff(a, b);
+        if (!codes) { return highlightValueDifference(text1, text2); }
+        codes.forEach(function (code) {
+            var part1 = escape(a.slice(code[1], code[2]).join('')), part2 = escape(b.slice(code[3], code[4]).join(''));
+            if (code[0] === 'equal') {
+                result1.push(part1); result2.push(part2);
+            } else {
+                if (code[0] !== 'insert') { result1.push('<span class="diff-del">' + part1 + '</span>'); }
+                if (code[0] !== 'delete') { result2.push('<span class="diff-add">' + part2 + '</span>'); }
+            }
+        });
+        return [result1.join(''), result2.join('')];
+    }
+
+    // ReportGenerator.highlight_value_difference
+    function highlightValueDifference(val1, val2) {
+        val1 = strip(val1);
+        val2 = strip(val2);
+        if (val1 === val2) { return [escape(val1), escape(val2)]; }
+        if (val1 && !val2) { return ['<span class="diff-del">' + escape(val1) + '</span>', '<span class="diff-add">Empty</span>']; }
+        if (val2 && !val1) { return ['<span class="diff-del">Empty</span>', '<span class="diff-add">' + escape(val2) + '</span>']; }
+        return ['<span class="diff-del">' + escape(val1) + '</span>', '<span class="diff-add">' + escape(val2) + '</span>'];
+    }
+
+    // ReportGenerator._format_detail_line
+    function formatDetailLine(line) {
+        var status = line.indexOf('Status:');
+        if (status >= 0 && line.indexOf('NOT FOUND') >= 0) {
+            return escape(line.slice(0, status)) + 'Status: <span class="highlight-warning">' +
+                escape(strip(line.slice(status + 7))) + '</span>';
+        }
+        if (line.toLowerCase().indexOf('nan') >= 0) {
+            return escape(line.replace(/nan/g, 'Empty').replace(/NaN/g, 'Empty'));
+        }
+        return escape(line);
+    }
+
+    // ReportGenerator.format_issue for a record
+    // [check, row, object ID, attribute, issue, info, template, values]
+    function formatIssue(record) {
+        var template = templates[record[6]], values = {}, highlighted = {};
+        template[1].forEach(function (name, i) { values[name] = record[7][i]; });
+        var customer = HIGHLIGHTED_TEXTS[0], bosch = HIGHLIGHTED_TEXTS[1];
+        if (customer in values || bosch in values) {
+            var texts = highlightDifferences(values[customer] || '', values[bosch] || '');
+            highlighted[customer] = texts[0];
+            highlighted[bosch] = texts[1];
+        }
+        customer = HIGHLIGHTED_VALUES[0];
+        bosch = HIGHLIGHTED_VALUES[1];
+        var customerTyp = strip(values[customer] || ''), boschTyp = strip(values[bosch] || '');
+        if (customerTyp || boschTyp) {
+            var typs = highlightValueDifference(customerTyp, boschTyp);
+            if (typs[0]) { highlighted[customer] = typs[0]; }
+            if (typs[1]) { highlighted[bosch] = typs[1]; }
+        }
+
+        var lines = [];
+        template[0].split('\n').forEach(function (line) {
+            var names = [];
+            line.replace(FIELD, function (match, name) { names.push(name); return match; });
+            if (names.some(function (name) { return name in highlighted; })) {
+                var escaped = {};
+                Object.keys(values).forEach(function (name) {
+                    escaped[name] = name in highlighted ? highlighted[name] : escape(values[name]);
+                });
+                lines.push(format(line, escaped));
+            } else {
+                format(line, values).split('\n').forEach(function (text) { lines.push(formatDetailLine(text)); });
+            }
+        });
+
+        var info = record[5];
+        var header = [record[0] !== 'N/A' ? (info ? 'ℹ️' : '⚠️') + ' Check ' + record[0] : (info ? 'ℹ️' : '⚠️'),
+                      'Row: ' + record[1]];
+        if (record[2] !== 'N/A') { header.push('Object ID: ' + record[2]); }
+        return '        <div class="' + (info ? 'issue-info' : 'issue') + '">\n' +
+               '                       <h2>' + header.join(' | ') + '</h2>\n' +
+               '                       <p><strong>Attributes:</strong> ' + record[3] + '</p>\n' +
+               '                       <p><strong>Check:</strong> ' + record[4] + '</p>\n' +
+               '                       <p><strong>Details:</strong></p>\n' +
+               '                       <div class="code-block">' + lines.join('<br>') + '</div>\n' +
+               '                   </div>';
+    }
+
+    function render() {
+        var pages = Math.max(1, Math.ceil(selected.length / pageSize));
+        page = Math.min(Math.max(page, 0), pages - 1);
+        container.innerHTML = selected.slice(page * pageSize, (page + 1) * pageSize).map(formatIssue).join('\n');
+        pageInfo.textContent = 'Page ' + (page + 1) + ' of ' + pages + ' (' + selected.length + ' entries)';
+    }
+
+    function turn(step) {
+        page += step;
+        render();
+        window.scrollTo(0, container.offsetTop);
+    }
+
+    function select() {
+        var check = checkFilter.value, search = idSearch.value.trim().toLowerCase();
+        selected = findings.filter(function (record) {
+            return (!check || record[0] === check) &&
+                   (!search || record[2].toLowerCase().indexOf(search) >= 0);
+        });
+        page = 0;
+        render();
+    }
+
+    checkFilter.addEventListener('change', select);
+    idSearch.addEventListener('input', select);
+    document.getElementById('report-previous').addEventListener('click', function () { turn(-1); });
+    document.getElementById('report-next').addEventListener('click', function () { turn(1); });
+    // Lets ReportGenerator.test_paged_html_script_parity load the formatter in node
+    if (typeof module !== 'undefined') {
+        module.exports = {formatIssue: formatIssue, findings: findings};
+    }
+    select();
+})();
@@ -4,29 +4,66 @@ os.environ["COLORCLASS_DISABLE"] = "1"
 os.environ["NO_COLOR"] = "1"
 
 # Now import other modules
-import re
+import io
+import contextlib
 import zipfile
 import shutil
-import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pyreqif.reqif
 import pyreqif.rif
 import pyreqif.xlsx
-import html
+import pandas as pd
+import xlsxwriter
 from logger_config import logger
+from ReqIFStreamParser import ReqIFStreamParser
+from XhtmlTextCleaner import XhtmlTextCleaner
+from ConversionCache import ConversionCache
+from ConversionManifest import ConversionManifest
+from version import __version__
 
 
 
 class ReqIF2ExcelProcessor:
+    # Parser backends
+    PARSER_STREAM = "stream"
+    PARSER_PYREQIF = "pyreqif"
+    # Excel writer backends
+    WRITER_STREAMING = "streaming"
+    WRITER_PYREQIF = "pyreqif"
+    # Bump when the produced tables change, invalidates the conversion cache
+    CONVERTER_VERSION = "1"
+
+    ARCHIVE_EXTENSIONS = ('.zip', '.reqifz')
+    REQIF_EXTENSIONS = ('.reqif', '.xml')
+
     def __init__(self, source_folder, reqif_folder, excel_folder,
-                 check_type=0):
+                 check_type=0, parser=PARSER_STREAM, excel_writer=WRITER_STREAMING,
+                 max_workers=None,
+                 write_excel=True, keep_dataframes=True, cache_folder=None,
+                 cache_max_bytes=ConversionCache.DEFAULT_MAX_BYTES):
         """
         Initialize the ReqIF2Excel Processor with source and destination folders
 
         Args:
             source_folder (str): Path to source REQIF or XML files
-            reqif_folder (str): Path to extract REQIF/XML files
+            reqif_folder (str): Former extraction folder; only cleaned up, archive
+                                members are read directly from the archives
             excel_folder (str): Path to store converted Excel files
             check_type (int, optional): 0 for Import Check, 1 for Export Check. Defaults to 0.
+            parser (str, optional): "stream" for the incremental iterparse reader,
+                                    "pyreqif" for the full pyreqif object model. Defaults to "stream".
+            excel_writer (str, optional): "streaming" writes every row as soon as it is converted
+                                          (constant memory), "pyreqif" builds the workbook with
+                                          pyreqif.xlsx.dump (pyreqif parser only). Defaults to "streaming".
+            max_workers (int, optional): Number of worker processes used for the conversion.
+                                         1 converts sequentially, None uses all CPU cores.
+            write_excel (bool, optional): Write the *_local_conversion.xlsx files. Defaults to True.
+            keep_dataframes (bool, optional): Keep the converted tables in self.dataframes so
+                                              ChecksProcessor can use them without reading the
+                                              Excel files back. Defaults to True.
+            cache_folder (str, optional): Folder of the content-hash conversion cache.
+                                          None disables the cache.
+            cache_max_bytes (int, optional): Size limit of the conversion cache
         """
         logger.info(f"Initializing ReqIF2ExcelProcessor")
         logger.debug(f"ReqIF folder: {reqif_folder}")
@@ -36,48 +73,124 @@ class ReqIF2ExcelProcessor:
         self.reqif_folder = reqif_folder
         self.excel_folder = excel_folder
         self.check_type = check_type
-
-    def extract_all_files(self):
+        if parser not in (self.PARSER_STREAM, self.PARSER_PYREQIF):
+            raise ValueError(f"Unknown ReqIF parser: {parser}")
+        self.parser = parser
+        if excel_writer not in (self.WRITER_STREAMING, self.WRITER_PYREQIF):
+            raise ValueError(f"Unknown Excel writer: {excel_writer}")
+        if excel_writer == self.WRITER_PYREQIF and parser != self.PARSER_PYREQIF:
+            raise ValueError("The pyreqif Excel writer needs the pyreqif parser")
+        self.excel_writer = excel_writer
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.write_excel = write_excel
+        self.keep_dataframes = keep_dataframes
+        self.dataframes = {}  # Excel file name -> converted DataFrame
+        self.cache = ConversionCache(cache_folder, cache_max_bytes) if cache_folder else None
+
+    def get_reqif_sources(self):
         """
-        Recursively extract all ZIP and REQIFZ files from source folder
+        Find all REQIF and XML members of the ZIP/REQIFZ archives in the source folder.
+        Nested archives are opened in memory, nothing is extracted to disk.
+
+        Returns:
+            list: Sorted source tuples (archive path, member[, nested member ...])
         """
+        sources = []
         for root, _, files in os.walk(self.source_folder):
             for file in files:
-                if file.endswith('.zip') or file.endswith('.reqifz'):
+                if file.endswith(self.ARCHIVE_EXTENSIONS):
                     file_path = os.path.join(root, file)
-                    self._extract_zip_recursive(file_path)
+                    self._collect_archive_members(file_path, (file_path,), sources)
+
+        print(f"Found {len(sources)} REQIF/XML files")
+        return sorted(sources)
 
-    def _extract_zip_recursive(self, file_path):
+    def _collect_archive_members(self, archive, source, sources):
         """
-        Recursively extract nested ZIP files
+        Recursively collect the REQIF/XML members of an archive
 
         Args:
-            file_path (str): Path to the ZIP file to extract
+            archive (str | file object): Path or in-memory stream of the archive
+            source (tuple): Source tuple leading to this archive
+            sources (list): Receives the source tuples of all REQIF/XML members
         """
         try:
-            if not zipfile.is_zipfile(file_path):
-                print(f"Skipping invalid zip file: {file_path}")
-                return
-
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(self.reqif_folder)
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
                 for name in zip_ref.namelist():
-                    nested_zip_path = os.path.join(self.reqif_folder, name)
-                    if nested_zip_path.endswith(
-                            '.zip') or nested_zip_path.endswith('.reqifz'):
-                        self._extract_zip_recursive(nested_zip_path)
+                    if name.endswith(self.REQIF_EXTENSIONS):
+                        sources.append(source + (name,))
+                    elif name.endswith(self.ARCHIVE_EXTENSIONS):
+                        with zip_ref.open(name) as nested:
+                            nested_archive = io.BytesIO(nested.read())
+                        self._collect_archive_members(nested_archive, source + (name,), sources)
 
         except zipfile.BadZipFile:
-            print(f"Error: {file_path} is not a valid zip file.")
+            print(f"Error: {self.source_name(source)} is not a valid zip file.")
         except Exception as e:
-            print(f"Unexpected error with file {file_path}: {e}")
+            print(f"Unexpected error with file {self.source_name(source)}: {e}")
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_archives():
+        """
+        Open the members of several sources while sharing the opened archives.
+
+        The archives along the path of the last opened source stay open (nested
+        ones in memory) and are closed once a source lies outside them, so sorted
+        sources open and read every archive once.
+
+        Yields:
+            callable: Opens the member of a source tuple as a binary stream
+        """
+        archives = {}  # archive path tuple -> open ZipFile
+
+        def open_member(source):
+            path = source[:-1]
+            for opened in [opened for opened in archives if path[:len(opened)] != opened]:
+                archives.pop(opened).close()
+            for depth in range(1, len(path) + 1):
+                if path[:depth] in archives:
+                    continue
+                if depth == 1:
+                    archive = zipfile.ZipFile(path[0], 'r')
+                else:
+                    with archives[path[:depth - 1]].open(path[depth - 1]) as nested:
+                        archive = zipfile.ZipFile(io.BytesIO(nested.read()), 'r')
+                archives[path[:depth]] = archive
+            return archives[path].open(source[-1])
+
+        try:
+            yield open_member
+        finally:
+            for archive in archives.values():
+                archive.close()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_source(source):
+        """
+        Open a REQIF/XML archive member as a binary stream
+
+        Args:
+            source (tuple): Source tuple from get_reqif_sources
+        """
+        with ReqIF2ExcelProcessor.open_archives() as open_member:
+            with open_member(source) as stream:
+                yield stream
+
+    @staticmethod
+    def source_name(source):
+        """Readable name of a source tuple, e.g. 'C:\\drop\\pkg.reqifz!module.reqif'."""
+        return "!".join(source)
 
     def prepare_folders(self):
         """
-        Delete and recreate destination folders
+        Create the destination folders. The Excel folder is kept: its conversion
+        manifest decides which outputs are still current. The extraction folder
+        is no longer used and only cleared.
         """
+        self.delete_folder(self.reqif_folder)
         for folder in [self.reqif_folder, self.excel_folder]:
-            self.delete_folder(folder)
             os.makedirs(folder, exist_ok=True)
 
     @staticmethod
@@ -95,142 +208,420 @@ class ReqIF2ExcelProcessor:
         except Exception as e:
             print(f"Error deleting '{folder_path}': {str(e)}")
 
-    def clean_reqif_folder(self):
+    def clean_text(self, raw_text):
         """
-        Delete files except REQIF and XML
+        Clean the given raw text by removing HTML tags and decoding HTML entities.
+
+        Args:
+            raw_text (str): The raw text with HTML tags and encoded entities.
+
+            Returns:
+                str: The cleaned text.
         """
-        self.delete_files_except_extensions(self.reqif_folder,
-                                            ['reqif', 'xml'])
+        return XhtmlTextCleaner.clean_markup(raw_text)
 
-    @staticmethod
-    def delete_files_except_extensions(folder_path, allowed_extensions):
+    def convert_to_excel(self, progress_callback=None):
         """
-        Delete all files except those with specified extensions
+        Convert REQIF/XML files to Excel.
+        This method performs the following steps:
+        1. Collects the REQIF/XML archive members and their Excel output paths.
+        2. Compares the member content hashes with the conversion manifest of the
+           Excel folder: unchanged members keep their Excel file, outputs whose
+           source disappeared are deleted.
+        3. Converts the remaining files, in parallel worker processes when
+           max_workers > 1. Every file runs isolated: a failing file is reported
+           and the others continue.
+        4. Reports progress after each finished file.
+        5. Collects the converted DataFrames in self.dataframes, keyed by the
+           Excel file name they correspond to.
 
         Args:
-            folder_path (str): Folder to clean up
-            allowed_extensions (list): List of allowed file extensions
+            progress_callback (callable, optional): Called as
+                progress_callback(done, total, name, error) after each file;
+                name is the readable source name, error is None on success.
+
+        Returns:
+            list: (source name, error) tuples of the converted files in sorted order
         """
-        try:
-            all_files = glob.glob(os.path.join(folder_path, "*"))
+        tasks = {}
+        sources = self.get_reqif_sources()
+        for source in sources:
+            base_filename = os.path.splitext(os.path.basename(source[-1]))[0]
+            output_file = os.path.join(self.excel_folder,
+                                       f"{base_filename}_local_conversion.xlsx")
+            if output_file in tasks:
+                # Same module name in several archives: the last one wins, as before
+                logger.warning(f"{self.source_name(tasks[output_file])} and {self.source_name(source)} "
+                               f"both convert to {os.path.basename(output_file)}; "
+                               f"keeping {self.source_name(source)}")
+            tasks[output_file] = source
+
+        manifest = ConversionManifest(self.excel_folder, self.cache_version())
+        if not manifest.exists:
+            # Outputs of runs without a manifest cannot be trusted
+            for file_name in os.listdir(self.excel_folder):
+                if file_name.endswith("_local_conversion.xlsx"):
+                    os.remove(os.path.join(self.excel_folder, file_name))
+        with self.open_archives() as open_member:
+            content_keys = manifest.hash_sources(
+                sources, open_member,
+                lambda stream: ConversionCache.content_key(stream, self.cache_version()),
+                self.source_name)
+
+        output_names = {os.path.basename(output_file) for output_file in tasks}
+        for output_name in list(manifest.outputs):
+            if output_name not in output_names:
+                self._remove_output(os.path.join(self.excel_folder, output_name))
+                manifest.forget(output_name)
+                logger.info(f"Removed {output_name}, its source no longer exists")
+
+        jobs = []
+        unchanged = 0
+        for output_file, source in sorted(tasks.items(), key=lambda task: task[1]):
+            output_name = os.path.basename(output_file)
+            content_key = content_keys[source]
+            if manifest.is_current(output_name, source, content_key):
+                excel_current = manifest.has_excel(output_name) and os.path.exists(output_file)
+            else:
+                excel_current = False
+                # Never leave an Excel file of an older source version behind
+                self._remove_output(output_file)
+                manifest.forget(output_name)
+
+            if excel_current:
+                unchanged += 1
+            write_excel = self.write_excel and not excel_current
+            if write_excel or self.keep_dataframes:
+                jobs.append((source, output_file, content_key, write_excel))
+        logger.info(f"{unchanged} of {len(tasks)} modules unchanged since the last conversion")
+
+        total = len(jobs)
+        errors = {}
+        frames = {}
+
+        def report(done, source, error):
+            name = self.source_name(source)
+            if error is None:
+                logger.info(f"[{done}/{total}] Converted {name}")
+            else:
+                print(f"Error converting {name}: {error}")
+                logger.error(f"[{done}/{total}] Error converting {name}: {error}")
+            if progress_callback is not None:
+                progress_callback(done, total, name, error)
+
+        workers = min(self.max_workers, total)
+        if workers <= 1:
+            with self.open_archives() as open_member:
+                for done, job in enumerate(jobs, start=1):
+                    source = job[0]
+                    frames[source], errors[source] = self.convert_file(*job, open_member=open_member)
+                    report(done, source, errors[source])
+        else:
+            logger.info(f"Converting {total} files with {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(self.convert_file, *job): job[0] for job in jobs}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    source = futures[future]
+                    try:
+                        frames[source], errors[source] = future.result()
+                    except Exception as e:
+                        # Worker crashed (e.g. out of memory) before it could report
+                        frames[source], errors[source] = None, str(e)
+                    report(done, source, errors[source])
+
+        for source, output_file, content_key, write_excel in jobs:
+            output_name = os.path.basename(output_file)
+            if errors[source] is not None:
+                self._remove_output(output_file)
+                manifest.forget(output_name)
+            else:
+                excel = write_excel or manifest.has_excel(output_name)
+                manifest.record(output_name, source, content_key, excel)
+        manifest.save()
+
+        if self.cache is not None:
+            self.cache.evict()
+        self.dataframes = {
+            os.path.basename(output_file): frames[source]
+            for source, output_file, _, _ in jobs if frames[source] is not None
+        }
+        return [(self.source_name(job[0]), errors[job[0]]) for job in jobs]
+
+    @staticmethod
+    def _remove_output(output_file):
+        """Delete a converted Excel file if it exists."""
+        if os.path.exists(output_file):
+            os.remove(output_file)
 
-            for file_path in all_files:
-                if os.path.isfile(file_path):
-                    if not any(file_path.endswith(f".{ext}") for ext in
-                               allowed_extensions):
-                        os.remove(file_path)
-                        print(f"Deleted file: {file_path}")
+    def convert_file(self, source, output_file, content_key=None, write_excel=None,
+                     open_member=None):
+        """
+        Convert a single REQIF/XML archive member. Runs inside the worker processes.
+        Unchanged members are served from the conversion cache when it is enabled.
 
-            print(
-                f"All files except {', '.join(allowed_extensions)} files have been deleted.")
+        Args:
+            source (tuple): Source tuple from get_reqif_sources
+            output_file (str): Absolute path of the Excel file to write
+            content_key (str, optional): Precomputed ConversionCache.content_key of the member
+            write_excel (bool, optional): Overrides self.write_excel for this file
+            open_member (callable, optional): Opener from open_archives shared with
+                                              other sources; defaults to open_source
 
+        Returns:
+            tuple: (DataFrame or None, error message or None)
+        """
+        if write_excel is None:
+            write_excel = self.write_excel
+        if open_member is None:
+            open_member = self.open_source
+        try:
+            with contextlib.ExitStack() as stack:
+                # The member is opened at most once, and not at all for a cache hit
+                stream = None
+                cache_key = None
+                if self.cache is not None:
+                    cache_key = content_key
+                    if cache_key is None:
+                        stream = stack.enter_context(open_member(source))
+                        cache_key = self.cache.content_key(stream, self.cache_version())
+                        stream.seek(0)
+                    df, header = self.cache.load(cache_key)
+                    if df is not None:
+                        logger.debug(f"Loaded {self.source_name(source)} from the conversion cache")
+                        if write_excel:
+                            self.write_excel_rows(output_file, self.dataframe_rows(df),
+                                                  lambda: header)
+                        return (df if self.keep_dataframes else None), None
+
+                build_frame = self.keep_dataframes or cache_key is not None
+                if stream is None:
+                    stream = stack.enter_context(open_member(source))
+                if self.parser == self.PARSER_PYREQIF:
+                    header, df = self._convert_with_pyreqif(stream, output_file,
+                                                            write_excel, build_frame)
+                else:
+                    header, df = self._convert_with_stream_parser(stream, output_file,
+                                                                  write_excel, build_frame)
+
+            if cache_key is not None:
+                self.cache.store(cache_key, df, header)
+            return (df if self.keep_dataframes else None), None
         except Exception as e:
-            print(
-                f"Error deleting files except '{allowed_extensions}': {str(e)}")
+            return None, str(e)
 
-    def get_reqif_files(self):
+    def cache_version(self):
+        """Version string stored in the conversion cache key."""
+        return f"{__version__}/{self.CONVERTER_VERSION}/{self.parser}"
+
+    def _convert_with_pyreqif(self, file, output_file, write_excel, build_frame):
         """
-        Find all REQIF and XML files in the extraction folder
+        Convert one REQIF/XML file by loading the complete pyreqif document.
+
+        Args:
+            file (file object): Binary stream of the REQIF/XML file
+            output_file (str): Path of the Excel file to write
+            write_excel (bool): Write the Excel file
+            build_frame (bool): Build the DataFrame of the converted rows
 
         Returns:
-            list: Paths to REQIF and XML files
+            tuple: (column list, DataFrame or None)
         """
-        try:
-            files_list = []
-            for root, _, files in os.walk(self.reqif_folder):
-                for file in files:
-                    if file.endswith('.reqif') or file.endswith('.xml'):
-                        files_list.append(os.path.join(root, file))
+        reqif_document = pyreqif.reqif.load(file)
+
+        for requirement in reqif_document.requirementList:
+            for value in requirement.values:
+                # Check for content, handling potential None values
+                content = getattr(value, '_content', None)
+                if content is not None:
+                    # Decode bytes if necessary
+                    if isinstance(content, bytes):
+                        content = content.decode('utf-8')
+                    # Clean the HTML content
+                    cleaned_content = self.clean_text(content)
+                    value._content = cleaned_content
+
+        columns = reqif_document.fields + [ReqIFStreamParser.REQIF_ID_COLUMN]
+        if write_excel and self.excel_writer == self.WRITER_PYREQIF:
+            pyreqif.xlsx.dump(reqif_document, output_file)
+            write_excel = False
+        if not (write_excel or build_frame):
+            return columns, None
+
+        records = self._write_rows(output_file, self._pyreqif_rows(reqif_document, columns),
+                                   lambda: columns, write_excel, build_frame)
+        if records is None:
+            return columns, None
+        return columns, self.rows_to_dataframe(columns, records)
 
-            print(f"Found {len(files_list)} REQIF/XML files")
-            return files_list
+    @staticmethod
+    def _pyreqif_rows(reqif_document, columns):
+        """
+        Rows of a pyreqif document in hierarchy order, with the cell values
+        pyreqif.xlsx.dump would write.
 
-        except Exception as e:
-            print(f"Error searching for files: {str(e)}")
-            return []
+        Args:
+            reqif_document (pyreqif.doc): Loaded ReqIF document
+            columns (list): Column list of the document
 
-    def clean_text(self, raw_text):
+        Yields:
+            list: Cell values aligned with columns
         """
-        Clean the given raw text by removing HTML tags and decoding HTML entities.
+        for child in reqif_document.hierarchy:
+            for item, _ in reqif_document.hierach_iterator(child, columns):
+                row = [""] * len(columns)
+                for col, value in item.items():
+                    if isinstance(value, bytes):
+                        value = value.decode('utf-8')
+                    row[columns.index(col)] = ReqIFStreamParser.flatten_markup(value)
+                yield row
+
+    def _convert_with_stream_parser(self, file, output_file, write_excel, build_frame):
+        """
+        Convert one REQIF/XML file with the incremental ReqIFStreamParser.
 
         Args:
-            raw_text (str): The raw text with HTML tags and encoded entities.
+            file (file object): Binary stream of the REQIF/XML file
+            output_file (str): Path of the Excel file to write
+            write_excel (bool): Write the Excel file
+            build_frame (bool): Build the DataFrame of the converted rows
 
-            Returns:
-                str: The cleaned text.
+        Returns:
+            tuple: (column list, DataFrame or None)
+        """
+        parser = ReqIFStreamParser(file, self.clean_text)
+        records = self._write_rows(output_file, parser.iter_rows(),
+                                   lambda: parser.columns, write_excel, build_frame)
+        if records is None:
+            return parser.columns, None
+        return parser.columns, self.rows_to_dataframe(parser.columns, records)
+
+    def _write_rows(self, output_file, rows, get_columns, write_excel, build_frame):
+        """
+        Consume converted rows once: stream them into the Excel file and/or
+        collect them for the DataFrame.
+
+        Args:
+            output_file (str): Path of the Excel file to write
+            rows (iterable): Converted rows
+            get_columns (callable): Returns the column list, see write_excel_rows
+            write_excel (bool): Write the Excel file
+            build_frame (bool): Collect the rows
+
+        Returns:
+            list: Collected rows, None when build_frame is False
         """
-        if not raw_text:
-            return ""
+        records = [] if build_frame else None
+
+        def collect(rows):
+            for row in rows:
+                if records is not None:
+                    records.append(row)
+                yield row
+
+        rows = collect(rows)
+        if write_excel:
+            self.write_excel_rows(output_file, rows, get_columns)
+        else:
+            for _ in rows:
+                pass
+        return records
 
-        # Remove self-closing tags and attributes (like <br/>, <object ... />)
-        raw_text = re.sub(r'<[^>]+?/>', '', raw_text)
+    @staticmethod
+    def rows_to_dataframe(columns, rows):
+        """
+        Build the DataFrame ChecksProcessor would get from reading the Excel file back
+        with pd.read_excel(keep_default_na=False, na_values=['']): duplicate headers
+        are renamed to 'name.1', 'name.2', ... and empty cells become NaN.
 
-        # Remove full HTML tags (e.g., <b>...</b>, <div>...</div>)
-        raw_text = re.sub(r'<[^>]+>', '', raw_text)
+        Args:
+            columns (list): Column names as written to the Excel header
+            rows (list): Rows aligned with columns
 
-        # Remove multiple consecutive whitespaces
-        raw_text = re.sub(r'\s+', ' ', raw_text)
+        Returns:
+            DataFrame: The converted table
+        """
+        counts = {}
+        unique_columns = []
+        for col in columns:
+            count = counts.get(col, 0)
+            while count > 0:
+                counts[col] = count + 1
+                col = f"{col}.{count}"
+                count = counts.get(col, 0)
+            unique_columns.append(col)
+            counts[col] = count + 1
+
+        df = pd.DataFrame(rows, columns=unique_columns, dtype=object)
+        df = df.mask(df == "")
+        return df.infer_objects()
 
-        # Decode HTML entities (e.g., &#196; to Ä)
-        cleaned_text = html.unescape(raw_text)
+    @staticmethod
+    def dataframe_rows(df):
+        """
+        Turn a converted DataFrame back into Excel rows (missing values as "").
 
-        # Strip leading and trailing whitespace
-        return cleaned_text
+        Args:
+            df (DataFrame): Table created by rows_to_dataframe
 
-    def convert_to_excel(self):
+        Yields:
+            tuple: Cell values in column order
         """
-        Convert REQIF/XML files to Excel.
-        This method performs the following steps:
-        1. Changes the current working directory to the Excel folder.
-        2. Iterates over the list of REQIF/XML files.
-        3. For each file:
-            - Loads the REQIF document.
-            - Iterates over the requirements in the document.
-            - Prints the requirement ID and long name.
-            - Iterates over the values of each requirement.
-            - Cleans the HTML content of each value.
-            - Updates the value with the cleaned content.
-            - Dumps the cleaned document to an Excel file.
-        4. Changes back to the original working directory.
-        """
-        original_path = os.getcwd()
-        os.chdir(self.excel_folder)
-
-        for file in self.get_reqif_files():
-            try:
-                base_filename = os.path.splitext(os.path.basename(file))[0]
-                reqif_document = pyreqif.reqif.load(file)
-
-                for requirement in reqif_document.requirementList:
-                    for value in requirement.values:
-                        # Check for content, handling potential None values
-                        content = getattr(value, '_content', None)
-                        if content is not None:
-                            # Decode bytes if necessary
-                            if isinstance(content, bytes):
-                                content = content.decode('utf-8')
-                            # Clean the HTML content
-                            cleaned_content = self.clean_text(content)
-                            value._content = cleaned_content
-
-                pyreqif.xlsx.dump(reqif_document,
-                                  f"{base_filename}_local_conversion.xlsx")
-
-            except Exception as e:
-                print(f"Error converting {file}: {e}")
-
-        os.chdir(original_path)
-
-    def process(self):
+        values = df.astype(object).where(df.notna(), "")
+        yield from values.itertuples(index=False, name=None)
+
+    @staticmethod
+    def write_excel_rows(output_file, rows, get_columns):
+        """
+        Write converted rows using the same sheet layout as pyreqif.xlsx.dump.
+        The workbook runs in constant memory mode: every row is flushed to the
+        temporary sheet file as soon as the next one starts, so memory does not
+        grow with the number of rows.
+
+        Args:
+            output_file (str): Path of the Excel file to write
+            rows (iterable): Rows aligned with the column list
+            get_columns (callable): Returns the column list; called once the
+                                    first row is available (or rows are exhausted)
+        """
+        workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+        worksheet = workbook.add_worksheet("Export")
+        cell_format = workbook.add_format()
+        cell_format.set_text_wrap()
+
+        def write_header(columns):
+            for col_nr, col in enumerate(columns):
+                worksheet.write(0, col_nr, col)
+            worksheet.set_column(0, len(columns), 20)
+            if "ReqIF.Text" in columns:
+                text_col = columns.index("ReqIF.Text")
+                worksheet.set_column(text_col, text_col, 100)
+
+        header_written = False
+        row_nr = 0
+        for row in rows:
+            if not header_written:
+                write_header(get_columns())
+                header_written = True
+            row_nr += 1
+            for col_nr, value in enumerate(row):
+                worksheet.write(row_nr, col_nr, value)
+            worksheet.set_row(row_nr, None, cell_format)
+
+        if not header_written:
+            write_header(get_columns())
+        workbook.close()
+
+    def process(self, progress_callback=None):
         """
         Main processing method to orchestrate the entire workflow
+
+        Args:
+            progress_callback (callable, optional): Forwarded to convert_to_excel
         """
         try:
             logger.info("Starting ReqIF to Excel conversion process")
             self.prepare_folders()
-            self.extract_all_files()
-            self.clean_reqif_folder()
-            self.convert_to_excel()
+            self.convert_to_excel(progress_callback)
             logger.info("Conversion completed successfully")
         except Exception as e:
             logger.error(f"Error during ReqIF conversion: {str(e)}", exc_info=True)
@@ -0,0 +1,268 @@
+import io
+from collections import Counter
+from lxml import etree
+from logger_config import logger
+from XhtmlTextCleaner import XhtmlTextCleaner
+
+
+class ReqIFStreamParser:
+    """
+    Incremental ReqIF reader built on lxml.etree.iterparse.
+
+    DATATYPES and SPEC-TYPES are resolved once while they stream past, after
+    that every SPEC-OBJECT is turned into one row and its XML subtree is
+    released again. The rows themselves cannot be streamed: the hierarchy
+    that orders them follows the SPEC-OBJECTS, so the rows of all objects are
+    buffered (memory O(rows) of converted cells, not the XML tree) and each is
+    released once its last reference has been yielded.
+
+    The produced columns match what pyreqif.xlsx.dump writes: the attribute
+    LONG-NAMEs of all SPEC-OBJECT-TYPEs in document order followed by
+    "reqifId". Like pyreqif, rows are yielded in the pre-order of each
+    SPECIFICATION's SPEC-HIERARCHY: an object referenced twice appears twice
+    and an object outside every hierarchy is not written.
+    """
+
+    REQIF_ID_COLUMN = "reqifId"
+
+    _TRACKED_TAGS = (
+        "{*}DATATYPE-DEFINITION-ENUMERATION",
+        "{*}SPEC-OBJECT-TYPE",
+        "{*}SPEC-TYPE",
+        "{*}SPEC-OBJECT",
+        "{*}SPEC-RELATIONS",
+        "{*}SPECIFICATION",
+        "{*}SPECIFICATIONS",
+        "{*}SPEC-RELATION-GROUPS",
+    )
+
+    def __init__(self, source, clean_text):
+        """
+        Initialize the parser.
+
+        Args:
+            source (str | file object): Path to a REQIF/XML file or a binary file object
+            clean_text (callable): Cleaner applied to string values (same role as
+                                   ReqIF2ExcelProcessor.clean_text); XHTML values
+                                   go through XhtmlTextCleaner.clean_element
+        """
+        self.source = source
+        self.clean_text = clean_text
+        self.columns = []
+        self._column_positions = {}
+        self._enum_values = {}        # ENUM-VALUE identifier -> LONG-NAME
+        self._attributes = {}         # ATTRIBUTE-DEFINITION identifier -> LONG-NAME
+        self._type_defaults = {}      # SPEC-OBJECT-TYPE identifier -> [(LONG-NAME, default)]
+        self._columns_final = False
+
+    @staticmethod
+    def _local_name(tag):
+        """Return the tag name without its namespace."""
+        if not isinstance(tag, str):
+            return ""
+        return tag.rsplit('}', 1)[-1]
+
+    @staticmethod
+    def _release(element):
+        """Free an element and all already processed siblings before it."""
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+    def _child(self, element, name):
+        for child in element:
+            if self._local_name(child.tag) == name:
+                return child
+        return None
+
+    def _read_enumeration(self, element):
+        """Register the enum value LONG-NAMEs of a DATATYPE-DEFINITION-ENUMERATION."""
+        specified_values = self._child(element, "SPECIFIED-VALUES")
+        if specified_values is None:
+            return
+        for enum_value in specified_values:
+            identifier = enum_value.get("IDENTIFIER")
+            if identifier is not None:
+                self._enum_values[identifier] = enum_value.get("LONG-NAME")
+
+    def _read_spec_object_type(self, element):
+        """Register the attribute definitions of a SPEC-OBJECT-TYPE as columns."""
+        type_id = element.get("IDENTIFIER")
+        defaults = self._type_defaults.setdefault(type_id, [])
+        spec_attributes = self._child(element, "SPEC-ATTRIBUTES")
+        if spec_attributes is None:
+            return
+
+        for definition in spec_attributes:
+            if not self._local_name(definition.tag).startswith("ATTRIBUTE-DEFINITION-"):
+                continue
+            long_name = definition.get("LONG-NAME") or definition.get("IDENTIFIER")
+            self._attributes[definition.get("IDENTIFIER")] = long_name
+            self.columns.append(long_name)
+            self._column_positions.setdefault(long_name, len(self.columns) - 1)
+
+            default_value = self._child(definition, "DEFAULT-VALUE")
+            if default_value is not None:
+                for ref in default_value.iter("{*}ENUM-VALUE-REF"):
+                    defaults.append((long_name, ref.text))
+                    break
+
+    def _finalize_columns(self):
+        if self._columns_final:
+            return
+        self.columns.append(self.REQIF_ID_COLUMN)
+        self._column_positions.setdefault(self.REQIF_ID_COLUMN, len(self.columns) - 1)
+        self._columns_final = True
+
+    @staticmethod
+    def flatten_markup(value):
+        """
+        Mirror pyreqif.xlsx.write_excel_line: a value that still parses as XML
+        after cleaning is reduced to its text content.
+        """
+        if '<' not in value or '>' not in value:
+            return value
+        try:
+            root = etree.parse(io.BytesIO(value.encode('utf-8'))).getroot()
+        except Exception:
+            return value
+        return "".join(root.itertext())
+
+    def _value_content(self, value_element):
+        """
+        Extract the cell content of one ATTRIBUTE-VALUE-* element.
+
+        Returns:
+            tuple: (attribute definition identifier, content) or (None, None)
+        """
+        kind = self._local_name(value_element.tag)[len("ATTRIBUTE-VALUE-"):]
+        definition = self._child(value_element, "DEFINITION")
+        if definition is None or len(definition) == 0:
+            return None, None
+        attribute_ref = definition[0].text
+
+        if kind == "ENUMERATION":
+            content = ""
+            values = self._child(value_element, "VALUES")
+            if values is not None:
+                for ref in values:
+                    long_name = self._enum_values.get(ref.text)
+                    if long_name is not None:
+                        content += long_name + ","
+            return attribute_ref, content
+
+        the_value = value_element.get("THE-VALUE")
+        if the_value is not None:
+            return attribute_ref, self.clean_text(the_value)
+
+        container = self._child(value_element, "THE-VALUE")
+        if container is None:
+            container = self._child(value_element, "XHTML-CONTENT")
+        if container is None or len(container) == 0:
+            return attribute_ref, ""
+        return attribute_ref, XhtmlTextCleaner.clean_element(container[0])
+
+    def _build_row(self, spec_object):
+        """Turn one SPEC-OBJECT element into a row aligned with self.columns."""
+        row = [""] * len(self.columns)
+        has_values = False
+
+        type_ref = None
+        type_element = self._child(spec_object, "TYPE")
+        if type_element is not None and len(type_element) > 0:
+            type_ref = type_element[0].text
+
+        for long_name, default_ref in self._type_defaults.get(type_ref, []):
+            default = self._enum_values.get(default_ref)
+            if default is not None:
+                row[self._column_positions[long_name]] = default
+                has_values = True
+
+        values = self._child(spec_object, "VALUES")
+        if values is not None:
+            for value_element in values:
+                attribute_ref, content = self._value_content(value_element)
+                long_name = self._attributes.get(attribute_ref)
+                if long_name is None:
+                    continue
+                row[self._column_positions[long_name]] = self.flatten_markup(content)
+                has_values = True
+
+        # pyreqif only fills reqifId for objects that carry at least one value
+        if has_values:
+            row[self._column_positions[self.REQIF_ID_COLUMN]] = spec_object.get("IDENTIFIER")
+        return row
+
+    def _hierarchy_refs(self, specification):
+        """
+        Yield the SPEC-OBJECT-REFs of a SPECIFICATION in hierarchy pre-order.
+
+        Mirrors pyreqif's hierach_iterator: the SPECIFICATION itself is not an
+        object, every SPEC-HIERARCHY below it is visited before its CHILDREN.
+        """
+        children = self._child(specification, "CHILDREN")
+        pending = list(reversed(children)) if children is not None else []
+        while pending:
+            hierarchy = pending.pop()
+            object_element = self._child(hierarchy, "OBJECT")
+            if object_element is not None and len(object_element) > 0:
+                yield object_element[0].text
+            children = self._child(hierarchy, "CHILDREN")
+            if children is not None:
+                pending.extend(reversed(children))
+
+    def iter_rows(self):
+        """
+        Yield the SPEC-OBJECTs of the source as rows in hierarchy order.
+
+        SPECIFICATIONS follow SPEC-OBJECTS in a ReqIF document, so the rows are
+        built and buffered by identifier while the objects pass, and yielded once
+        the hierarchy references of all SPECIFICATIONs are known. Rows no
+        hierarchy references are dropped first; every other row is removed from
+        the buffer when its last reference is yielded.
+        self.columns is complete before the first row is yielded.
+
+        Yields:
+            list: Cell values aligned with self.columns ("" for missing values)
+        """
+        rows = {}
+        hierarchy_refs = []  # SPEC-OBJECT-REFs of all SPECIFICATIONs in output order
+        object_count = 0
+        row_count = 0
+        context = etree.iterparse(self.source, events=("end",),
+                                  tag=self._TRACKED_TAGS, huge_tree=True)
+        for _, element in context:
+            name = self._local_name(element.tag)
+            if name == "DATATYPE-DEFINITION-ENUMERATION":
+                self._read_enumeration(element)
+            elif name in ("SPEC-OBJECT-TYPE", "SPEC-TYPE"):
+                self._read_spec_object_type(element)
+            elif name == "SPEC-OBJECT":
+                self._finalize_columns()
+                rows[element.get("IDENTIFIER")] = self._build_row(element)
+                object_count += 1
+            elif name == "SPECIFICATION":
+                hierarchy_refs.extend(self._hierarchy_refs(element))
+            elif name == "SPECIFICATIONS":
+                self._release(element)
+                self._finalize_columns()
+                remaining = Counter(hierarchy_refs)
+                for identifier in [identifier for identifier in rows if identifier not in remaining]:
+                    del rows[identifier]
+                for object_ref in hierarchy_refs:
+                    remaining[object_ref] -= 1
+                    row = rows.pop(object_ref, None) if remaining[object_ref] == 0 else rows.get(object_ref)
+                    if row is None:
+                        logger.warning(f"SPEC-HIERARCHY references unknown SPEC-OBJECT {object_ref}")
+                        continue
+                    row_count += 1
+                    yield row if remaining[object_ref] == 0 else list(row)
+                hierarchy_refs = []
+                continue
+            self._release(element)
+
+        self._finalize_columns()
+        logger.debug(f"Converted {row_count} rows from {object_count} SPEC-OBJECTs "
+                     f"with {len(self.columns)} columns")
@@ -0,0 +1,153 @@
+import re
+import time
+from difflib import SequenceMatcher
+
+
+class TextDiff:
+    """
+    Diff of two requirement texts with a bounded cost, for the report highlighting.
+
+    A character-level SequenceMatcher over whole texts is quadratic and, above
+    200 characters, ignores the frequent characters (autojunk), which makes the
+    result of long texts both slow and fragmented. The texts are therefore
+    compared word by word first (words, spaces and punctuation marks are the
+    tokens); only the replaced spans are refined character by character, and
+    only when their characters are at least min_ratio similar
+    (SequenceMatcher.ratio). Unrelated words stay one replaced span instead of
+    showing the few letters they happen to share.
+
+    Budget of one diff: texts of more than max_tokens tokens are not diffed at all
+    (opcodes returns None). A refinement costs up to len(a) * len(b) character
+    comparisons ("cells"); a replaced span that does not fit into the remaining
+    max_cells or max_seconds is kept as a whole. The cell budget gives the same
+    result on every run, the time budget does not: opcodes reports when it was
+    hit, so that such a result is not cached.
+    """
+
+    _TOKEN = re.compile(r'\w+|\W')
+
+    MAX_TOKENS = 20_000
+    MAX_CELLS = 1_000_000
+    MAX_SECONDS = 0.5
+    MIN_RATIO = 0.5
+
+    def __init__(self, max_tokens=MAX_TOKENS, max_cells=MAX_CELLS, max_seconds=MAX_SECONDS,
+                 min_ratio=MIN_RATIO):
+        """
+        Create a diff engine.
+
+        Args:
+            max_tokens (int, optional): Size limit of each text. Defaults to MAX_TOKENS.
+            max_cells (int, optional): Refinement budget per diff. Defaults to MAX_CELLS.
+            max_seconds (float, optional): Refinement time per diff. Defaults to MAX_SECONDS.
+            min_ratio (float, optional): Similarity a replaced span needs to be refined.
+                                         Defaults to MIN_RATIO.
+        """
+        self.max_tokens = max_tokens
+        self.max_cells = max_cells
+        self.max_seconds = max_seconds
+        self.min_ratio = min_ratio
+
+    def signature(self):
+        """Identifies the engine and its budget, for caching the highlighted results."""
+        return f"TextDiff/2 {self.max_tokens} {self.max_cells} {self.max_seconds} {self.min_ratio}"
+
+    @staticmethod
+    def _offsets(tokens):
+        """Start offset of every token in the text, plus the text length."""
+        offsets = [0]
+        for token in tokens:
+            offsets.append(offsets[-1] + len(token))
+        return offsets
+
+    def opcodes(self, text1, text2):
+        """
+        Character opcodes turning text1 into text2, like SequenceMatcher.get_opcodes().
+
+        Args:
+            text1 (str): Old text
+            text2 (str): New text
+
+        Returns:
+            tuple: (opcodes, timed_out); opcodes is a list of (tag, i1, i2, j1, j2)
+                   tuples with tag 'equal', 'replace', 'delete' or 'insert', or None
+                   when the texts are too long for the budget; timed_out is True when
+                   max_seconds kept a replaced span from being refined
+        """
+        tokens1 = self._TOKEN.findall(text1)
+        tokens2 = self._TOKEN.findall(text2)
+        if len(tokens1) > self.max_tokens or len(tokens2) > self.max_tokens:
+            return None, False
+        budget = self.max_cells
+        timed_out = False
+        deadline = time.perf_counter() + self.max_seconds
+        offsets1 = self._offsets(tokens1)
+        offsets2 = self._offsets(tokens2)
+
+        opcodes = []
+
+        def append(tag, i1, i2, j1, j2):
+            # Merge with the previous opcode when it has the same tag (spans of
+            # the word pass and of a refinement meet)
+            if opcodes and opcodes[-1][0] == tag:
+                opcodes[-1] = (tag, opcodes[-1][1], i2, opcodes[-1][3], j2)
+            else:
+                opcodes.append((tag, i1, i2, j1, j2))
+
+        # Spaces and frequent tokens (punctuation, common words) only extend matches
+        # found on the other tokens (junk, autojunk): a match never starts on a space,
+        # and the word pass stays near linear
+        word_opcodes = SequenceMatcher(str.isspace, tokens1, tokens2).get_opcodes()
+        for tag, i1, i2, j1, j2 in word_opcodes:
+            start1, end1, start2, end2 = offsets1[i1], offsets1[i2], offsets2[j1], offsets2[j2]
+            if tag == 'replace':
+                cells = (end1 - start1) * (end2 - start2)
+                if cells <= budget:
+                    if time.perf_counter() >= deadline:
+                        timed_out = True
+                    else:
+                        budget -= cells
+                        matcher = SequenceMatcher(None, text1[start1:end1], text2[start2:end2], autojunk=False)
+                        # quick_ratio is an upper bound of ratio and skips the matching
+                        # of spans that cannot be similar enough
+                        if matcher.quick_ratio() >= self.min_ratio and matcher.ratio() >= self.min_ratio:
+                            for char_tag, c1, c2, d1, d2 in matcher.get_opcodes():
+                                append(char_tag, start1 + c1, start1 + c2, start2 + d1, start2 + d2)
+                            continue
+            append(tag, start1, end1, start2, end2)
+        return opcodes, timed_out
+
+    @staticmethod
+    def test_opcodes():
+        """Check that the opcodes rebuild the new text and that the budget limits apply."""
+        cases = [
+            ('The quick brown fox jumps.', 'The quick browne fox jumped!'),
+            ('OLE Object Text', 'Text A'),
+            ('Die Spannung ≥ 12V; sonst Fehler', 'Spannung ≥ 12 V, sonst Fehler 😀'),
+            ('', 'Text'),
+            ('Wert | ' * 2000, ('Wert | ' * 1000) + 'Größe | ' + ('Wert | ' * 999)),
+        ]
+
+        print("\nTesting the bounded text diff:")
+        print("-" * 50)
+        passed = True
+        for text1, text2 in cases:
+            for diff in (TextDiff(), TextDiff(max_cells=0), TextDiff(max_seconds=0)):
+                opcodes, timed_out = diff.opcodes(text1, text2)
+                rebuilt = ''.join(text1[i1:i2] if tag == 'equal' else text2[j1:j2]
+                                  for tag, i1, i2, j1, j2 in opcodes)
+                passed &= rebuilt == text2
+                passed &= not timed_out or diff.max_seconds == 0
+        # Without time left the replaced words are kept whole, and the result says so
+        opcodes, timed_out = TextDiff(max_seconds=0).opcodes(*cases[0])
+        passed &= timed_out and opcodes[1] == ('replace', 10, 15, 10, 16)
+        passed &= TextDiff(max_tokens=3).opcodes('a b c', 'a b d') == (None, False)
+        passed &= TextDiff().opcodes('OLE Object Text', 'Text A')[0][1] == ('equal', 11, 15, 0, 4)
+        # Similar words are refined, unrelated ones stay one replaced span
+        passed &= ('insert', 15, 15, 15, 16) in TextDiff().opcodes(*cases[0])[0]
+        passed &= TextDiff().opcodes('Status offen', 'Status abgelehnt') == (
+            [('equal', 0, 7, 0, 7), ('replace', 7, 12, 7, 16)], False)
+        passed &= TextDiff(min_ratio=0).opcodes('Status offen', 'Status abgelehnt')[0] != [
+            ('equal', 0, 7, 0, 7), ('replace', 7, 12, 7, 16)]
+        print(f"Test {'PASSED' if passed else 'FAILED'}")
+        print("-" * 50)
@@ -24,6 +24,10 @@ from typing import List, Tuple, Optional
 
 import pandas as pd
 
+# The module name index is shared with the checks in the parent folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ModuleNameIndex import ModuleNameIndex  # noqa: E402
+
 
 FILENAME_PATTERN = re.compile(
     r"^(?P<base>.+?)_[0-9a-fA-F]{8}_local_conversion\.xlsx$"
@@ -41,12 +45,7 @@ def normalize_for_match(s: str, case_insensitive: bool = True) -> str:
     - Collapse consecutive dots
     - Optionally lowercase
     """
-    s = s.strip()
-    s = re.sub(r"[ _.]", ".", s)
-    s = re.sub(r"\.{2,}", ".", s)
-    if case_insensitive:
-        s = s.lower()
-    return s
+    return ModuleNameIndex.normalize(s, case_insensitive)
 
 
 def extract_module_name(filename: str) -> Optional[str]:
@@ -130,33 +129,18 @@ def main() -> int:
 
     df_target = load_target_modules(args.target_excel, args.sheet)
 
-    # Build list of (normalized_key, original_Modulename) for fuzzy prefix matching.
+    # Sorted index of the normalized target keys for fuzzy prefix matching.
     # Spaces, underscores, and dots are treated as equivalent.
     # Source name only needs to be a PREFIX of the target key (target may have extra text).
-    target_entries: List[Tuple[str, str]] = [
-        (normalize_for_match(key, ci), str(orig))
-        for key, orig in zip(df_target["Modulename_key"], df_target["Modulename"])
-    ]
-
-    # Pattern to extract just the LAH module ID (e.g. "LAH.000.900.CM") from a name.
-    # Use [A-Za-z0-9.]+ (no underscore) so it stops at the first "_" separator.
-    _lah_id_re = re.compile(r"^(LAH[A-Za-z0-9.]+)", re.IGNORECASE)
+    target_values: List[str] = [str(orig) for orig in df_target["Modulename"]]
+    target_index = ModuleNameIndex(df_target["Modulename"].tolist(), case_insensitive=ci)
 
     def find_match(source_module: str) -> Optional[str]:
-        src_norm = normalize_for_match(source_module, ci)
         # 1) Full prefix match: target key starts with normalized source name
-        for tgt_norm, tgt_val in target_entries:
-            if tgt_norm.startswith(src_norm):
-                return tgt_val
         # 2) ID-only fallback: match on just the LAH code (e.g. "LAH.000.900.CM")
         #    when descriptions differ between source and target
-        id_m = _lah_id_re.match(source_module)
-        if id_m:
-            id_norm = normalize_for_match(id_m.group(1), ci) + "."  # require dot/separator after ID
-            for tgt_norm, tgt_val in target_entries:
-                if tgt_norm.startswith(id_norm):
-                    return tgt_val
-        return None
+        position = target_index.first_match(source_module)
+        return target_values[position] if position is not None else None
 
     print("Matches (Source -> Target):")
     print("-" * 80)
@@ -183,8 +167,8 @@ def main() -> int:
             if id_match:
                 lah_id_norm = normalize_for_match(id_match.group(1), ci)
                 candidates = [
-                    tgt_val for tgt_norm, tgt_val in target_entries
-                    if lah_id_norm in tgt_norm
+                    target_values[position]
+                    for position in target_index.rows_where(lambda tgt_norm: lah_id_norm in tgt_norm)
                 ]
                 if candidates:
                     # Deduplicate while preserving order
@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import os
 from utils import get_exe_directory
 
@@ -11,8 +12,11 @@ def setup_logger():
     logger = logging.getLogger('ImportExportChecker')
     logger.setLevel(logging.DEBUG)  # Capture all levels
     
-    # Create file handler with DEBUG level to capture everything
-    file_handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
+    # Create file handler with DEBUG level to capture everything.
+    # Worker processes re-import this module, they must append instead of
+    # truncating the log of the main process.
+    log_mode = 'w' if multiprocessing.parent_process() is None else 'a'
+    file_handler = logging.FileHandler(log_path, mode=log_mode, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)  # Changed to DEBUG to capture all logs
     
     # Create console handler (won't be visible in exe but useful during development)
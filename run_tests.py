@@ -1,4 +1,32 @@
 from ReportGenerator import ReportGenerator
+from Finding import Finding
+
+# Check the finding records and the rendering of their details
+Finding.test_finding()
 
 # Run the OLE Object handling tests
-ReportGenerator.test_ole_object_handling() 
\ No newline at end of file
+ReportGenerator.test_ole_object_handling() 
+# Check the data embedded in the paged HTML report
+ReportGenerator.test_paged_html_report()
+# Check the paged report script against format_issue (needs node)
+ReportGenerator.test_paged_html_script_parity()
+# Check the word/character diff of the report highlighting
+from TextDiff import TextDiff
+TextDiff.test_opcodes()
+# Check the persistent cache of highlighted differences
+from DiffCache import DiffCache
+DiffCache.test_diff_cache()
+# Compare the single pass XHTML cleaner with the regex chain
+from XhtmlTextCleaner import XhtmlTextCleaner
+XhtmlTextCleaner.benchmark_against_regex_chain()
+# Check the batch text normalisation against the scalar one
+from HelperFunc import HelperFunctions
+HelperFunctions.test_normalize_text_series()
+# Check the vectorised SDV01 checks against their row-wise versions
+from ChecksSDV01 import ProjectCheckerSDV01
+ProjectCheckerSDV01.test_vectorised_checks()
+# Check that every check works on tables projected to its declared columns
+from CheckRegistry import CheckRegistry
+CheckRegistry.test_column_projection()
+# Check that the module partitions keep the compare rows without a module
+CheckRegistry.test_module_partitions()